@@ -1,15 +1,13 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 # Copyright (C) 2025-2026 Benjamin Abendroth <braph93@gmx.de>
 
-'''Exporting modules.'''
+'''Exporting modules.
 
-from . import errors
-from . import cli, config, utils
-from . import shell, bash, fish, zsh
-from . import argparse_source, json_source, yaml_source
-from . import extended_yaml_parser
-from . import scheme_validator
-from . import help_parser
+The modules are imported on first access, so that importing a single
+module (e.g. by the `crazy-complete` script) does not import all others.
+'''
+
+import importlib
 
 __all__ = [
     'errors',
@@ -27,3 +25,17 @@ __all__ = [
     'scheme_validator',
     'help_parser',
 ]
+
+
+def __getattr__(name):
+    try:
+        return importlib.import_module(f'.{name}', __name__)
+    except ModuleNotFoundError as e:
+        if e.name != f'{__name__}.{name}':
+            raise
+
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -3,19 +3,30 @@
 
 '''Class for main command line application.'''
 
+import io
 import os
 import sys
+import time
 import shlex
 import argparse
+import contextlib
 
 from .errors import CrazyError
-from . import bash, fish, zsh
-from . import argparse_source, json_source, yaml_source
 from . import argparse_mod  # .complete()
-from . import help_converter
 from . import utils
 from . import config
-from . import paths
+from . import profiler
+
+# The modules for the shells, the input types, the cache, the watch mode and
+# the installation paths are imported when they are needed. This keeps the
+# startup time low, since crazy-complete is often run many times in a row
+# (e.g. by build scripts).
+
+# pylint: disable=import-outside-toplevel
+
+
+# The version of crazy-complete
+VERSION = '0.3.8'
 
 
 # The import of `argparse_mod` only modifies the classes provided by the
@@ -39,6 +50,46 @@ def version(string):
     return tuple(map(int, string.split('.')))
 
 
+def size(string):
+    '''Parse a size in bytes with an optional K, M or G suffix.'''
+
+    multiplier = 1
+    suffix = string[-1:].upper()
+
+    if suffix in ('K', 'M', 'G'):
+        multiplier = 1024 ** ('KMG'.index(suffix) + 1)
+        string = string[:-1]
+
+    value = int(string) * multiplier
+
+    if value < 0:
+        raise ValueError(f"Negative size: {string}")
+
+    return value
+
+
+def shell_list(string):
+    '''Convert a comma separated string of shells to list.
+
+    `all` is an alias for `bash,fish,zsh`.
+    '''
+
+    choices = ('bash', 'fish', 'zsh', 'json', 'yaml', 'compile')
+    shells = []
+
+    for shell in string.split(','):
+        if shell == 'all':
+            shells.extend(('bash', 'fish', 'zsh'))
+        elif shell in choices:
+            shells.append(shell)
+        else:
+            valid = ', '.join(map(repr, choices + ('all',)))
+            raise argparse.ArgumentTypeError(
+                f'invalid choice: {shell!r} (choose from {valid})')
+
+    return list(dict.fromkeys(shells))
+
+
 def feature_list(string):
     '''Convert a comma separated string of features to list.'''
 
@@ -60,8 +111,18 @@ p = argparse.ArgumentParser(
     exit_on_error=False)
 
 p.add_argument(
-    'shell', choices=('bash', 'fish', 'zsh', 'json', 'yaml'),
-    help='Specify the shell type for the completion script')
+    'shell', metavar='{bash,fish,zsh,json,yaml,compile,all}', type=shell_list,
+    help=('Specify the shell type for the completion script. '
+          'Multiple shells can be given as a comma separated list')
+).complete('value_list', {'values': {
+    'bash': 'Generate Bash completion',
+    'fish': 'Generate Fish completion',
+    'zsh':  'Generate Zsh completion',
+    'json': 'Convert definition to JSON',
+    'yaml': 'Convert definition to YAML',
+    'compile': 'Compile definition for fast loading',
+    'all':  'Generate Bash, Fish and Zsh completion',
+}})
 
 p.add_argument(
     'definition_file',
@@ -69,7 +130,7 @@ p.add_argument(
 ).complete('file')
 
 p.add_argument(
-    '--version', action='version', version='%(prog)s 0.3.8',
+    '--version', action='version', version=f'%(prog)s {VERSION}',
     help='Show program version')
 
 p.add_argument(
@@ -81,8 +142,9 @@ p.add_argument(
     help='Specify the variable name of the ArgumentParser object (for --input-type=python)')
 
 p.add_argument(
-    '--input-type', choices=('yaml', 'json', 'python', 'help', 'auto'), default='auto',
-    help='Specify input file type')
+    '--input-type', choices=('yaml', 'json', 'python', 'help', 'compiled', 'auto'),
+    default='auto',
+    help='Specify input file type (compiled files are not validated again, only use trusted ones)')
 
 p.add_argument(
     '--abbreviate-commands', metavar='BOOL', default=False, type=boolean,
@@ -137,6 +199,12 @@ p.add_argument(
     help='Generate code for a specific bash-completions version'
 )
 
+p.add_argument(
+    '--bash-parser', default='auto',
+    choices=('auto', 'v1', 'v2', 'v3'),
+    help='Sets which command line parser is used in Bash scripts'
+).complete('choices', ('auto', 'v1', 'v2', 'v3'))
+
 p.add_argument(
     '--zsh-compdef', metavar='BOOL', default=True, type=boolean,
     help='Sets whether #compdef is used in zsh scripts'
@@ -161,6 +229,21 @@ p.add_argument(
     '--debug', action='store_true', default=False,
     help='Enable debug mode')
 
+p.add_argument(
+    '--watch', action='store_true', default=False,
+    help='Regenerate output each time the definition file or an included file changes')
+
+p.add_argument(
+    '--profile', action='store_true', default=False,
+    help='Record the time spent in each phase of the generation')
+
+p.add_argument(
+    '--profile-output', metavar='FILE', default=None,
+    help=('Write the results of --profile to FILE as JSON (*.json), as a '
+          'cProfile dump (*.prof) or as a table, implies --profile '
+          '[default: stderr]')
+).complete('file')
+
 p.add_argument(
     '--keep-comments', action='store_true', default=False,
     help='Keep comments in generated output')
@@ -174,6 +257,24 @@ p.add_argument(
     '--function-prefix', metavar='PREFIX', default='_$PROG',
     help='Set the prefix used for generated functions')
 
+p.add_argument(
+    '--cache', action='store_true', default=False,
+    help='Cache generated output')
+
+p.add_argument(
+    '--cache-dir', metavar='DIR', default=None,
+    help=('Set the cache directory, implies --cache '
+          '[default: $XDG_CACHE_HOME/crazy-complete]')
+).complete('directory')
+
+p.add_argument(
+    '--no-cache', action='store_true', default=False,
+    help='Do not use the cache, even if --cache or --cache-dir is given')
+
+p.add_argument(
+    '--cache-max-size', metavar='SIZE', default=None, type=size,
+    help='Set the maximum size of the cache')
+
 grp = p.add_mutually_exclusive_group()
 
 grp.add_argument(
@@ -205,6 +306,38 @@ def write_string_to_file(string, file):
         print(string)
 
 
+def write_bytes_to_file(data, file):
+    '''Writes bytes to file if file is given, else to STDOUT.'''
+
+    if file is not None:
+        with open(file, 'wb') as fh:
+            fh.write(data)
+    else:
+        # STDOUT is replaced by a text stream in batch mode
+        buffer = getattr(sys.stdout, 'buffer', None)
+        if buffer is None:
+            raise CrazyError('Cannot write binary output to STDOUT in batch mode, use --output')
+
+        sys.stdout.flush()
+        buffer.write(data)
+        buffer.flush()
+
+
+def _load_json(file):
+    from . import json_source
+    return json_source.load_from_file(file)
+
+
+def _load_yaml(file):
+    from . import yaml_source
+    return yaml_source.load_from_file(file)
+
+
+def _load_compiled(file):
+    from . import compiled_source
+    return compiled_source.load_from_file(file)
+
+
 def load_definition_file(opts):
     '''Load a definition file as specified in `opts`.'''
 
@@ -213,10 +346,13 @@ def load_definition_file(opts):
         extension = os.path.splitext(basename)[1].lower().strip('.')
 
         if extension == 'json':
-            return json_source.load_from_file(opts.definition_file)
+            return _load_json(opts.definition_file)
 
         if extension in ('yaml', 'yml'):
-            return yaml_source.load_from_file(opts.definition_file)
+            return _load_yaml(opts.definition_file)
+
+        if extension == 'ccd':
+            return _load_compiled(opts.definition_file)
 
         if extension == 'py':
             msg = 'Reading Python files must be enabled by --input-type=python'
@@ -224,20 +360,24 @@ def load_definition_file(opts):
 
         if extension == '':
             msg = ('File has no extension. '
-                   'Please supply --input-type=json|yaml|help|python')
+                   'Please supply --input-type=json|yaml|help|python|compiled')
             raise CrazyError(msg)
 
         msg = (f'Unknown file extension `{extension}`. '
-               'Please supply --input-type=json|yaml|help|python')
+               'Please supply --input-type=json|yaml|help|python|compiled')
         raise CrazyError(msg)
 
     if opts.input_type == 'json':
-        return json_source.load_from_file(opts.definition_file)
+        return _load_json(opts.definition_file)
 
     if opts.input_type == 'yaml':
-        return yaml_source.load_from_file(opts.definition_file)
+        return _load_yaml(opts.definition_file)
+
+    if opts.input_type == 'compiled':
+        return _load_compiled(opts.definition_file)
 
     if opts.input_type == 'python':
+        from . import argparse_source
         return argparse_source.load_from_file(
             opts.definition_file,
             opts.parser_variable,
@@ -258,6 +398,7 @@ def _get_config_from_options(opts):
     conf.set_long_option_argument_separator(opts.long_opt_arg_sep)
     conf.set_vim_modeline(opts.vim_modeline)
     conf.set_bash_completions_version(opts.bash_completions_version)
+    conf.set_bash_parser(opts.bash_parser)
     conf.set_zsh_compdef(opts.zsh_compdef)
     conf.set_fish_inline_conditions(opts.fish_inline_conditions)
     conf.include_many_files(opts.include_file or [])
@@ -295,11 +436,73 @@ def try_print_manual(args):
     sys.exit(0)
 
 
+def _run_batch_line(line):
+    '''Run a single line of a batch file.
+
+    Output to STDOUT and STDERR is captured. Errors that are not caused by
+    invalid input are not caught.
+
+    Returns:
+        tuple: (success, stdout, stderr, elapsed seconds)
+    '''
+
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    success = True
+    start = time.perf_counter()
+
+    with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+        utils.print_err('Running:', sys.argv[0], line)
+
+        app = Application()
+
+        try:
+            app.parse_args(shlex.split(line))
+            app.run()
+        except SystemExit as e:
+            success = e.code in (None, 0)
+        except argparse.ArgumentError as e:
+            success = False
+            utils.print_err('Command line error:', e)
+        except get_user_error_types() as e:
+            success = False
+            utils.print_err('Error:', e)
+            if app.options.debug:
+                import traceback
+                traceback.print_exc()
+            else:
+                utils.print_err('Pass --debug to see full stack trace')
+
+    return (success, stdout.getvalue(), stderr.getvalue(), time.perf_counter() - start)
+
+
+def _print_batch_summary(lines, results, jobs, elapsed):
+    failed = [line for line, result in zip(lines, results) if not result[0]]
+
+    utils.print_err()
+    utils.print_err(f'Batch summary: {len(lines)} commands, {len(failed)} failed, '
+                    f'{elapsed:.2f}s ({jobs} jobs)')
+
+    for line, (success, _, _, seconds) in zip(lines, results):
+        status = 'ok' if success else 'FAILED'
+        utils.print_err(f'  {seconds:7.2f}s  {status:<6}  {line}')
+
+
 def try_batch(args):
-    '''Do batch processing.'''
+    '''Do batch processing.
+
+    The lines of the batch file are run in parallel by a pool of `--jobs`
+    processes. The output of each line is printed in the order of the
+    batch file, so it is the same as running the lines one after another.
+
+    A failing line does not stop the processing of the other lines. If
+    more than one job is used, a summary with the timings of the lines is
+    printed at the end.
+    '''
 
     parser = argparse.ArgumentParser(add_help=False)
     parser.add_argument('--batch')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1)
     opts, _ = parser.parse_known_args(args)
 
     if not opts.batch:
@@ -308,58 +511,252 @@ def try_batch(args):
     with open(opts.batch, 'r', encoding='utf-8') as fh:
         content = fh.read()
 
+    lines = []
     for line in content.split('\n'):
         line = line.strip()
 
-        if not line or line.startswith('#'):
-            continue
+        if line and not line.startswith('#'):
+            lines.append(line)
 
-        utils.print_err('Running:', sys.argv[0], line)
+    jobs = max(1, min(opts.jobs, len(lines)))
+    start = time.perf_counter()
+    results = []
 
-        app = Application()
-        app.parse_args(shlex.split(line))
-        app.run()
+    def print_result(result):
+        _, stdout, stderr, _ = result
+        sys.stderr.write(stderr)
+        sys.stderr.flush()
+        sys.stdout.write(stdout)
+        sys.stdout.flush()
+        results.append(result)
+
+    if jobs == 1:
+        for line in lines:
+            print_result(_run_batch_line(line))
+    else:
+        import concurrent.futures
+        with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as executor:
+            for result in executor.map(_run_batch_line, lines):
+                print_result(result)
+
+    if jobs > 1:
+        _print_batch_summary(lines, results, jobs, time.perf_counter() - start)
+
+    if not all(result[0] for result in results):
+        sys.exit(1)
 
     sys.exit(0)
 
 
+# Output types that are conversions of the definition file
+_CONVERSIONS = ('json', 'yaml', 'compile')
+
+
+def _get_output_file(opts, shell):
+    if opts.output_file is None:
+        return None
+
+    return opts.output_file.replace('{shell}', shell)
+
+
+def _generate_conversion(opts, shell, cmdline):
+    '''Convert the definition to JSON, YAML or a compiled definition.'''
+
+    if shell == 'compile':
+        from . import compiled_source
+        output = compiled_source.commandline_to_compiled(cmdline)
+        write_bytes_to_file(output, _get_output_file(opts, shell))
+        return
+
+    if shell == 'json':
+        from . import json_source
+        output = json_source.commandline_to_json(cmdline)
+    else:
+        from . import yaml_source
+        output = yaml_source.commandline_to_yaml(cmdline)
+
+    write_string_to_file(output, _get_output_file(opts, shell))
+
+
+def _generate_completion(shell, cmdline, conf):
+    '''Return the generated completion code.'''
+
+    if shell == 'bash':
+        from . import bash
+        return bash.generate_completion(cmdline, conf)
+
+    if shell == 'fish':
+        from . import fish
+        return fish.generate_completion(cmdline, conf)
+
+    if shell == 'zsh':
+        from . import zsh
+        return zsh.generate_completion(cmdline, conf)
+
+    raise AssertionError("Should not be reached")
+
+
+def _get_cache_key(opts, shell, conf):
+    if opts.no_cache or not (opts.cache or opts.cache_dir is not None):
+        return None
+
+    # Python files may import other files, so we cannot tell if they changed
+    if opts.input_type == 'python':
+        return None
+
+    input_type = opts.input_type
+    if input_type == 'auto':
+        input_type = os.path.splitext(opts.definition_file)[1].lower()
+
+    from . import cache
+    return cache.GenerationCache.make_key(
+        opts.definition_file, input_type, shell, conf, VERSION)
+
+
+def _check_multiple_shells(opts):
+    if len(opts.shell) == 1:
+        return
+
+    if opts.install_system_wide or opts.uninstall_system_wide:
+        if any(shell in _CONVERSIONS for shell in opts.shell):
+            raise CrazyError('Cannot install JSON, YAML or compiled files')
+        return
+
+    if opts.output_file is None or '{shell}' not in opts.output_file:
+        raise CrazyError('Multiple shells require an output file containing `{shell}`')
+
+
+def _watch(opts):
+    '''Regenerate the output each time an input file changes.'''
+
+    if opts.install_system_wide or opts.uninstall_system_wide:
+        raise CrazyError('--watch cannot be used with --install-system-wide '
+                         'or --uninstall-system-wide')
+
+    if opts.input_type == 'help':
+        raise CrazyError('--watch cannot be used with --input-type=help')
+
+    if opts.profile or opts.profile_output is not None:
+        raise CrazyError('--watch cannot be used with --profile')
+
+    from . import watch
+
+    conf = _get_config_from_options(opts)
+    definition_file = os.path.abspath(opts.definition_file)
+    watcher = watch.make_watcher([definition_file] + conf.include_files)
+    changed = {definition_file}
+    cmdline = None
+
+    utils.print_err(f'Watching {opts.definition_file} for changes ...')
+
+    while True:
+        start = time.perf_counter()
+
+        try:
+            new_cmdline = cmdline
+            if definition_file in changed or cmdline is None:
+                new_cmdline = load_definition_file(opts)
+
+            if new_cmdline == cmdline and changed == {definition_file}:
+                elapsed = (time.perf_counter() - start) * 1000
+                utils.print_err(f'Definition unchanged ({elapsed:.1f} ms)')
+            else:
+                cmdline = None
+
+                for shell in opts.shell:
+                    if shell in _CONVERSIONS:
+                        _generate_conversion(opts, shell, new_cmdline)
+                    else:
+                        output = _generate_completion(shell, new_cmdline, conf)
+                        write_string_to_file(output, _get_output_file(opts, shell))
+
+                cmdline = new_cmdline
+                elapsed = (time.perf_counter() - start) * 1000
+                utils.print_err(f"Regenerated {','.join(opts.shell)} ({elapsed:.1f} ms)")
+        except Exception as e: # pylint: disable=broad-exception-caught
+            utils.print_err('Error:', e)
+            if opts.debug:
+                import traceback
+                traceback.print_exc()
+
+        try:
+            changed = watcher.wait()
+        except KeyboardInterrupt:
+            return
+
+
 def generate(opts):
-    '''Generate output file as specified in `opts`.'''
+    '''Generate output files as specified in `opts`.
+
+    The definition file is loaded only once for all shells.
+    '''
+
+    _check_multiple_shells(opts)
+
+    if opts.watch:
+        _watch(opts)
+        return
 
     if opts.input_type == 'help':
-        if opts.shell != 'yaml':
+        if opts.shell != ['yaml']:
             raise CrazyError('The `help` input-type currently only supports YAML generation')
+        from . import help_converter
         output = help_converter.from_file_to_yaml(opts.definition_file)
         write_string_to_file(output, opts.output_file)
         return
 
-    cmdline = load_definition_file(opts)
+    cmdline = None
+    conf = _get_config_from_options(opts)
 
-    if opts.shell == 'json':
-        output = json_source.commandline_to_json(cmdline)
-        write_string_to_file(output, opts.output_file)
-        return
+    for shell in opts.shell:
+        if shell in _CONVERSIONS:
+            if cmdline is None:
+                with profiler.phase('load'):
+                    cmdline = load_definition_file(opts)
+            with profiler.phase('convert', shell):
+                _generate_conversion(opts, shell, cmdline)
+            continue
 
-    if opts.shell == 'yaml':
-        output = yaml_source.commandline_to_yaml(cmdline)
-        write_string_to_file(output, opts.output_file)
-        return
+        key = _get_cache_key(opts, shell, conf)
+        cached = None
 
-    conf = _get_config_from_options(opts)
+        if key is not None:
+            from . import cache
+            cache_dir = opts.cache_dir or cache.get_default_cache_dir()
+            max_size = opts.cache_max_size
+            if max_size is None:
+                max_size = cache.DEFAULT_MAX_SIZE
+            generation_cache = cache.GenerationCache(cache_dir, max_size)
+            cached = generation_cache.get(key)
+
+        if cached is not None:
+            prog, output = cached
+        else:
+            if cmdline is None:
+                with profiler.phase('load'):
+                    cmdline = load_definition_file(opts)
+
+            prog = cmdline.prog
+            with profiler.phase('generate', shell):
+                output = _generate_completion(shell, cmdline, conf)
+
+            if key is not None:
+                generation_cache.put(key, prog, output)
+
+        with profiler.phase('output', shell):
+            _write_output(opts, shell, prog, output)
 
-    if opts.shell == 'bash':
-        output = bash.generate_completion(cmdline, conf)
-    elif opts.shell == 'fish':
-        output = fish.generate_completion(cmdline, conf)
-    elif opts.shell == 'zsh':
-        output = zsh.generate_completion(cmdline, conf)
+
+def _write_output(opts, shell, prog, output):
+    '''Write, install or uninstall the generated completion code.'''
 
     if opts.install_system_wide or opts.uninstall_system_wide:
+        from . import paths
         file = {
             'bash':  paths.get_bash_completion_file,
             'fish':  paths.get_fish_completion_file,
             'zsh':   paths.get_zsh_completion_file,
-        }[opts.shell](cmdline.prog)
+        }[shell](prog)
 
         if opts.install_system_wide:
             utils.print_err(f'Installing to {file}')
@@ -368,7 +765,69 @@ def generate(opts):
             utils.print_err(f'Removing {file}')
             os.remove(file)
     else:
-        write_string_to_file(output, opts.output_file)
+        write_string_to_file(output, _get_output_file(opts, shell))
+
+
+def generate_with_profile(opts):
+    '''Like `generate()`, but record the time spent in each phase.
+
+    The results are written to the file given by `--profile-output`.
+    '''
+
+    profile_file = opts.profile_output or '-'
+    prof = profiler.start()
+    cprof = None
+
+    if profile_file.endswith(('.prof', '.pstats')):
+        import cProfile
+        cprof = cProfile.Profile()
+        cprof.enable()
+
+    try:
+        generate(opts)
+    finally:
+        if cprof is not None:
+            cprof.disable()
+        profiler.stop()
+
+    if cprof is not None:
+        cprof.dump_stats(profile_file)
+        profile_file = '-'
+
+    if profile_file.endswith('.json'):
+        import json
+        with open(profile_file, 'w', encoding='utf-8') as fh:
+            json.dump(prof.to_dict(), fh, indent=2)
+    elif profile_file == '-':
+        utils.print_err(prof.format_table())
+    else:
+        write_string_to_file(prof.format_table(), profile_file)
+
+
+def get_user_error_types():
+    '''Return the exception types that are caused by invalid input.
+
+    The error types of the JSON and YAML parsers are only included if the
+    corresponding module has been imported, since otherwise they cannot
+    have been raised.
+
+    Returns:
+        tuple: The exception types.
+    '''
+
+    r = [CrazyError, FileNotFoundError]
+
+    json = sys.modules.get('json')
+    if json is not None:
+        r.append(json.decoder.JSONDecodeError)
+
+    yaml = sys.modules.get('yaml')
+    if yaml is not None:
+        r.extend([yaml.scanner.ScannerError,
+                  yaml.parser.ParserError,
+                  yaml.constructor.ConstructorError])
+
+    return tuple(r)
 
 
 class Application:
@@ -397,4 +856,7 @@ class Application:
             - yaml.parser.ParserError
             - json.decoder.JSONDecodeError
         '''
-        generate(self.options)
+        if self.options.profile or self.options.profile_output is not None:
+            generate_with_profile(self.options)
+        else:
+            generate(self.options)
@@ -14,6 +14,8 @@ from . import bash_helpers
 from . import bash_complete
 from . import bash_parser
 from . import bash_parser_v2
+from . import bash_parser_v3
+from . import bash_parser_cost
 from . import bash_option_completion
 from . import bash_option_strings_completion
 from . import bash_positionals_completion
@@ -34,7 +36,7 @@ class BashCompletionGenerator:
     def __init__(self, ctxt, commandline):
         self.ctxt = ctxt
         self.commandline = commandline
-        self.options = commandline.get_options()
+        self.options = commandline.get_option_index().get_options()
         self.positionals = commandline.get_positionals()
         self.subcommands = commandline.get_subcommands()
         self.completer = bash_complete.BashCompleter()
@@ -134,9 +136,13 @@ class BashCompletionGenerator:
         code['subcommand_call'] = self._generate_subcommand_call()
         code['command_arg'] = self._generate_command_arg_call()
         code['option_completion'] = bash_option_completion.generate_option_completion(self)
-        code['option_strings_completion'] = bash_option_strings_completion.generate(self)
+        code['option_strings_completion'], option_strings_array = \
+            bash_option_strings_completion.generate(self)
         code['positional_completion'] = bash_positionals_completion.generate(self)
 
+        # Global definitions that are placed before the completion function
+        global_code = [option_strings_array]
+
         if self.commandline.parent is None:
             # The root parser makes those variables local and sets up the completion.
             r  = 'local cur prev words cword split words_dequoted\n'
@@ -144,11 +150,9 @@ class BashCompletionGenerator:
             r += self.ctxt.helpers.use_function('dequote_words')
             code['init_completion'] = r
 
-            v1 = bash_parser.generate(self.commandline, self.variable_manager)
-            v2 = bash_parser_v2.generate(self.commandline, self.variable_manager)
-            c  = v1 if len(v1) < len(v2) else v2
-
-            func = helpers.ShellFunction('parse_commandline', c)
+            parser_code, table_code = self._generate_parser()
+            global_code.insert(0, table_code)
+            func = helpers.ShellFunction('parse_commandline', parser_code)
             self.ctxt.helpers.add_function(func)
 
             # This sets up END_OF_OPTIONS, POSITIONALS and the OPT_* variables.
@@ -159,8 +163,58 @@ class BashCompletionGenerator:
         r += '  return 1\n'
         r += '}'
 
+        global_code = [c for c in global_code if c]
+        if global_code:
+            r = '%s\n\n%s' % ('\n\n'.join(global_code), r)
+
         self.result = r
 
+    def _generate_parser(self):
+        # Returns the code of the parser and the code of the global option
+        # table (or None if the chosen parser does not use one).
+        config = self.ctxt.config
+        table = self.ctxt.helpers.make_completion_funcname(self.commandline, '__options')
+        use_cost_model = config.bash_parser == 'auto' or config.debug
+
+        if use_cost_model:
+            parsers = bash_parser_cost.PARSERS
+        else:
+            parsers = (config.bash_parser,)
+
+        # The table entries are needed by v3 and by the cost model
+        entries = None
+        if use_cost_model or 'v3' in parsers:
+            entries = bash_parser_v3.get_table_entries(self.commandline, self.variable_manager)
+
+        code = OrderedDict()
+        if 'v1' in parsers:
+            code['v1'] = bash_parser.generate(self.commandline, self.variable_manager)
+        if 'v2' in parsers:
+            code['v2'] = bash_parser_v2.generate(self.commandline, self.variable_manager)
+        if 'v3' in parsers:
+            code['v3'] = bash_parser_v3.generate(self.commandline, table)
+
+        estimates = None
+        if use_cost_model:
+            estimates = bash_parser_cost.estimate(entries, code)
+
+        parser = config.bash_parser
+        if parser == 'auto':
+            parser = bash_parser_cost.choose(estimates)
+
+        if config.debug:
+            utils.print_err(bash_parser_cost.format_estimates(
+                self.commandline.prog, estimates, parser))
+
+        if parser == 'v3':
+            commands = []
+            if bash_parser_v3.has_unknown_subcommands(self.commandline):
+                commands = bash_parser_v3.get_commands(self.commandline)
+
+            return (code['v3'], bash_parser_v3.generate_table(entries, commands, table))
+
+        return (code[parser], None)
+
 
 def _generate_wrapper(ctxt, commandline):
     make_completion_funcname = ctxt.helpers.make_completion_funcname
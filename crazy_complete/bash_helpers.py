@@ -15,7 +15,8 @@ local word append=0
 
 for word; do
   if [[ "$word" == "$cur"* ]]; then
-    COMPREPLY+=("$(printf '%q' "$word")")
+    printf -v word '%q' "$word"
+    COMPREPLY+=("$word")
   fi
 done
 ''')
@@ -61,13 +62,29 @@ ___IN_QUOTES=$___in_quotes
 ''')
 
 _DEQUOTE_WORDS = ShellFunction('dequote_words', r'''
-local word dequoted break_pos in_quotes
+local i word dequoted break_pos in_quotes all_words
+
+# Words after the cursor are not needed for parsing the command line.
+# Words without quoting characters stay the same (word break characters
+# only affect the break position, which is not used here).
+printf -v all_words '%s' "${words[@]:0:cword+1}"
+
+if [[ "$all_words" != *[\'\"\\]* ]]; then
+  words_dequoted=("${words[@]:0:cword+1}")
+  return
+fi
 
 words_dequoted=()
 
-for word in "${words[@]}"; do
-  dequote "$word" dequoted break_pos in_quotes
-  words_dequoted+=("$dequoted")
+for ((i=0; i <= cword; ++i)); do
+  word="${words[i]}"
+
+  if [[ "$word" != *[\'\"\\]* ]]; then
+    words_dequoted+=("$word")
+  else
+    dequote "$word" dequoted break_pos in_quotes
+    words_dequoted+=("$dequoted")
+  fi
 done
 ''', ['dequote'])
 
@@ -192,7 +209,7 @@ if (( ${#COMPREPLY[@]} )); then
     if (( in_quotes )); then
       COMPREPLY[i]="$line$REPLY"
     else
-      COMPREPLY[i]="$(printf '%q' "$line$REPLY")"
+      printf -v 'COMPREPLY[i]' '%q' "$line$REPLY"
     fi
   done
 fi
@@ -208,7 +225,7 @@ local item desc special="$COMP_WORDBREAKS\"'><=;|&({:\\\$\`"
 
 while IFS=$'\t' read -r item desc; do
   if [[ "$item" == "$cur"* ]]; then
-    [[ "$item" == *[$special]* ]] && item="$(printf '%q' "$item")"
+    [[ "$item" == *[$special]* ]] && printf -v item '%q' "$item"
     COMPREPLY+=("$item")
   fi
 done < <(eval "$1")
@@ -592,7 +609,8 @@ local match
 
 while read -r match; do
   if [[ "$match" == "$cur"* ]]; then
-    COMPREPLY+=("$(printf '%q' "$match")")
+    printf -v match '%q' "$match"
+    COMPREPLY+=("$match")
   fi
 done < <(command grep -E -o -- "$1" "$HISTFILE")
 ''')
@@ -721,7 +739,8 @@ while read -r line; do
     fi
 
     if [[ "$file" == "$cur_dequoted"* ]]; then
-      COMPREPLY+=("$(printf '%q' "$file")")
+      printf -v file '%q' "$file"
+      COMPREPLY+=("$file")
     fi
   fi
 done < <(command file -L $i_opt -- "$cur_dequoted"* 2>/dev/null)
@@ -763,7 +782,8 @@ local REPLY
 COMPREPLY=()
 
 while read -r REPLY; do
-  COMPREPLY+=("$(printf '%q' "$REPLY")")
+  printf -v REPLY '%q' "$REPLY"
+  COMPREPLY+=("$REPLY")
 done < <(command findmnt -lno TARGET)
 ''')
 
@@ -199,7 +199,7 @@ class _Info:
 
         self._collect_options_info(options)
 
-        all_options = self.commandline.get_options(
+        all_options = self.commandline.get_option_index().get_options(
             with_parent_options=self.commandline.inherit_options)
 
         old_option_strings = algo.flatten([o.get_old_option_strings() for o in all_options])
@@ -330,7 +330,8 @@ def _get_dispatcher(info):
 def generate_option_completion(self):
     '''Generate code for completing options.'''
 
-    options = self.commandline.get_options(only_with_arguments=True)
+    index = self.commandline.get_option_index()
+    options = index.get_options(only_with_arguments=True)
     abbreviations = utils.get_option_abbreviator(self.commandline)
 
     complete_function = _get_master_completion_obj(options, abbreviations, self)
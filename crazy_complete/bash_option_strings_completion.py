@@ -49,21 +49,25 @@ def _get_option_full_condition(option):
     return ''
 
 
-def _generate_option_strings_completion(options):
+def _generate_option_strings_completion(options, array):
     r = []
 
+    if array is not None:
+        r.append('opts=("${%s[@]}")' % array)
+
     grouped_by_condition = algo.group_by(options, _get_option_full_condition)
     for condition, opts in grouped_by_condition.items():
+        if not condition:
+            continue
+
         s = 'opts+=(%s)' % _make_option_strings([o.option for o in opts])
-        if condition:
-            s = '%s && %s' % (condition, s)
-        r.append(s)
+        r.append('%s && %s' % (condition, s))
 
     return '\n'.join(r)
 
 
-def _generate_final_check_with_options(final_conditions, options):
-    option_strings_completion = _generate_option_strings_completion(options)
+def _generate_final_check_with_options(final_conditions, options, array):
+    option_strings_completion = _generate_option_strings_completion(options, array)
 
     if not final_conditions:
         return option_strings_completion
@@ -74,18 +78,36 @@ def _generate_final_check_with_options(final_conditions, options):
     return r
 
 
+def _generate_array(options, array):
+    # The option strings that have no conditions are stored in a global
+    # array which is defined when the script is sourced. It is not made
+    # read-only, so a regenerated script can be sourced again.
+    unconditional = [o.option for o in options if not _get_option_full_condition(o)]
+    if not unconditional:
+        return None
+
+    return 'declare -ga %s=(%s)' % (array, _make_option_strings(unconditional))
+
+
 def generate(generator):
-    '''Generate option strings completion code.'''
+    '''Generate option strings completion code.
+
+    Returns:
+        tuple: The code for the completion function and the definition of
+               the global array holding the unconditional option strings
+               (or None if there are no such option strings).
+    '''
 
     if len(generator.options) == 0:
-        return None
+        return (None, None)
 
     commandline = generator.commandline
     variable_manager = generator.variable_manager
+    option_index = commandline.get_option_index()
     options = []
     final_conditions = []
 
-    for final_option in commandline.get_final_options():
+    for final_option in option_index.final_options:
         final_conditions += ["! ${#%s[@]}" % variable_manager.capture_variable(final_option)]
 
     for option in commandline.options:
@@ -94,7 +116,12 @@ def generate(generator):
 
         conditions = []
 
-        for exclusive_option in option.get_conflicting_options():
+        if option.groups:
+            conflicting_options = option_index.get_conflicting_options(option)
+        else:
+            conflicting_options = ()
+
+        for exclusive_option in conflicting_options:
             conditions += ["! ${#%s[@]}" % variable_manager.capture_variable(exclusive_option)]
 
         if not option.repeatable:
@@ -114,12 +141,20 @@ def generate(generator):
 
         options.append(_Option(option, conditions, when))
 
+    array = generator.ctxt.helpers.make_completion_funcname(commandline, '__option_strings')
+    array_code = _generate_array(options, array)
+    if array_code is None:
+        array = None
+
     r  = 'if (( ! END_OF_OPTIONS )) && [[ "$cur" = -* ]]; then\n'
-    r += '  local -a opts\n'
-    r += '%s\n' % indent(_generate_final_check_with_options(final_conditions, options), 2)
-    r += '  COMPREPLY+=($(compgen -W "${opts[*]}" -- "$cur"))\n'
+    if array is None or final_conditions or any(map(_get_option_full_condition, options)):
+        r += '  local -a opts\n'
+        r += '%s\n' % indent(_generate_final_check_with_options(final_conditions, options, array), 2)
+        r += '  COMPREPLY+=($(compgen -W "${opts[*]}" -- "$cur"))\n'
+    else:
+        r += '  COMPREPLY+=($(compgen -W "${%s[*]}" -- "$cur"))\n' % array
     r += '  [[ ${COMPREPLY-} == *= ]] && compopt -o nospace\n'
     r += '  return 1\n'
     r += 'fi'
 
-    return r
+    return (r, array_code)
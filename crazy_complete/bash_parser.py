@@ -156,7 +156,7 @@ def _make_short_option_case(short_options, option, variable):
 
 def _generate_option_cases(commandline, variable_manager):
     OptionCases = namedtuple('OptionCases', ['long_options', 'short_options'])
-    options = commandline.get_options()
+    options = commandline.get_option_index().get_options()
     abbreviations = utils.get_option_abbreviator(commandline)
     option_cases = OptionCases([], [])
 
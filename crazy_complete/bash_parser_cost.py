@@ -0,0 +1,285 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2025-2026 Benjamin Abendroth <braph93@gmx.de>
+
+'''Static cost model for the Bash command line parsers.
+
+The costs of a parser consist of sourcing its code once and running
+`COMPLETIONS_PER_SOURCE` completions, each parsing `WORDS_PER_COMPLETION`
+words. The words are split evenly between the word types the command line
+knows of:
+
+    long        A long (or old-style) option, like `--option`
+    short       A short option, like `-o`
+    positional  A positional argument or subcommand
+
+For each parser and word type the case statements and case patterns that
+are evaluated, the function calls and the table lookups are counted. Those
+counts are then priced with the costs below, which have been measured with
+Bash 5.2 (see `test/bench/bash_parsers.py`).
+
+The case-based parsers (v1 and v2) test a word against the command path of
+the command lines that have options, and then against the option patterns
+of the current command line. On average half of the command lines and half
+of the option patterns are evaluated before a match. The table-based
+parser (v3) needs one lookup per option.
+
+Bash copies the body of a function each time the function is called (and
+each time a nested function is defined), so large functions are not only
+expensive to source, but also to call. This hits the parse function of v1
+once per completion and `__find_option` of v2 once per option word.
+'''
+
+from collections import namedtuple, OrderedDict
+
+# Rough costs in microseconds, measured with Bash 5.2
+COST_CASE_STATEMENT = 1.5   # A case statement with a single pattern
+COST_CASE_PATTERN   = 0.55  # Matching a word against a case pattern
+COST_FUNCTION_CALL  = 3.0
+COST_FUNCTION_BYTE  = 0.013 # Copying a byte of a function body on a call
+COST_TABLE_LOOKUP   = 9.5   # Including the setup of the capture variable
+COST_SOURCE_BYTE    = 0.08  # Sourcing a byte of a function
+COST_TABLE_ENTRY    = 8.0   # Sourcing an entry of the option table
+
+# Costs of parsing a word that are equal for all parsers (running the loop,
+# storing the option, iterating over the characters of short options)
+COST_WORD = {
+    'long':       22.0,
+    'short':      38.0,
+    'positional': 13.0,
+}
+
+COMPLETIONS_PER_SOURCE = 20
+WORDS_PER_COMPLETION = 5
+
+PARSERS = ('v1', 'v2', 'v3')
+
+WORD_TYPES = ('long', 'short', 'positional')
+
+Costs = namedtuple('Costs', ['statements', 'patterns', 'calls', 'bytes', 'lookups'])
+
+
+def price(costs):
+    '''Return the costs of a `Costs` object in microseconds.'''
+
+    return (costs.statements * COST_CASE_STATEMENT
+            + costs.patterns * COST_CASE_PATTERN
+            + costs.calls * COST_FUNCTION_CALL
+            + costs.bytes * COST_FUNCTION_BYTE
+            + costs.lookups * COST_TABLE_LOOKUP)
+
+
+class Estimate:
+    '''The estimated costs of a parser.'''
+
+    # pylint: disable=too-few-public-methods
+
+    def __init__(self, source, completion, words, mix):
+        self.source = source            # Costs of sourcing the code
+        self.completion = completion    # Costs of calling the parser
+        self.words = words              # Mapping of word types to costs
+        self.mix = mix                  # Mapping of word types to their share
+
+    def get_word(self, word_type):
+        '''Return the costs of parsing a word of `word_type` in microseconds.'''
+
+        return COST_WORD[word_type] + price(self.words[word_type])
+
+    @property
+    def total(self):
+        '''The costs of sourcing the code and running the completions.'''
+
+        words = sum(self.get_word(t) * share for t, share in self.mix.items())
+        completion = price(self.completion) + WORDS_PER_COMPLETION * words
+        return self.source + COMPLETIONS_PER_SOURCE * completion
+
+
+class _Statistics:
+    '''Numbers of the option table needed by the cost model.'''
+
+    # pylint: disable=too-few-public-methods
+
+    def __init__(self, entries):
+        long_patterns = {}   # command path -> number of long option patterns
+        short_patterns = {}  # command path -> number of short option patterns
+        all_patterns = {}    # command path -> number of option strings
+
+        for command, option_string, value in entries:
+            if command.endswith(':*'):
+                continue
+
+            if len(option_string) == 2:
+                short_patterns[command] = short_patterns.get(command, 0) + 1
+            else:
+                # v1 has an additional pattern for `--option=*`
+                n = 2 if value[0] != '0' else 1
+                long_patterns[command] = long_patterns.get(command, 0) + n
+
+            all_patterns[command] = all_patterns.get(command, 0) + 1
+
+        self.entries = len(entries)
+        self.long_commands = len(long_patterns)
+        self.short_commands = len(short_patterns)
+        self.commands = len(all_patterns)
+        self.patterns = _average(all_patterns.values())
+        self.long_patterns = _average(long_patterns.values())
+        self.short_patterns = _average(short_patterns.values())
+        self.old_options = any(
+            len(option_string) > 2 and option_string[1] != '-'
+            for _, option_string, _ in entries)
+
+
+def _average(values):
+    values = list(values)
+    return sum(values) / len(values) if values else 0
+
+
+def _half(n):
+    # Expected number of tests until a match, when testing `n` alternatives
+    return (n + 1) / 2
+
+
+def _add(*costs):
+    return Costs(*map(sum, zip(*costs)))
+
+
+def _get_function_size(code, name):
+    # Returns the size of the function `name` defined in `code`
+    start = code.find('%s() {\n' % name)
+    if start == -1:
+        return 0
+    return code.find('\n}', start) - start
+
+
+def _estimate_v1(stats, code):
+    completion = Costs(0, 0, 1, len(code), 0)
+
+    words = {
+        # `--` and `-?*`, the command checks and the long option patterns
+        'long': Costs(
+            _half(stats.long_commands),
+            2 + _half(stats.long_patterns), 0, 0, 0),
+        # All long option patterns fail before the short options are tested
+        'short': Costs(
+            stats.long_commands + _half(stats.short_commands),
+            2 + stats.long_patterns + _half(stats.short_patterns), 0, 0, 0),
+        'positional': Costs(0, 3, 0, 0, 0),
+    }
+
+    return completion, words
+
+
+def _estimate_v2(stats, code):
+    find_option = _get_function_size(code, '__find_option')
+    append_to_array = _get_function_size(code, '__append_to_array')
+
+    # The nested functions are defined on each call of the parser
+    completion = Costs(0, 0, 1, len(code) + find_option + append_to_array, 0)
+
+    # Each option needs a call of `__find_option` and `__append_to_array`.
+    # `__find_option` holds the patterns of all option strings.
+    option = Costs(
+        _half(stats.commands), _half(stats.patterns),
+        2, find_option + append_to_array, 0)
+
+    # If there are old-style options, a short option is first looked up as
+    # such and fails
+    old = Costs(0, 0, 0, 0, 0)
+    if stats.old_options:
+        old = Costs(stats.commands, 1 + stats.patterns, 1, find_option, 0)
+
+    words = {
+        # `--`, `--*=*` and `--*`
+        'long': _add(Costs(0, 3, 0, 0, 0), option),
+        'short': _add(Costs(0, 4, 0, 0, 0), option, old),
+        'positional': Costs(0, 5, 0, 0, 0),
+    }
+
+    return completion, words
+
+
+def _estimate_v3(stats, code):
+    completion = Costs(0, 0, 1, len(code), 0)
+
+    old = 1 if stats.old_options else 0
+
+    words = {
+        'long': Costs(0, 3, 0, 0, 1),
+        'short': Costs(0, 4 + old, 0, 0, 1 + old),
+        'positional': Costs(0, 5, 0, 0, 0),
+    }
+
+    return completion, words
+
+
+def estimate(entries, code):
+    '''Estimate the costs of the parsers.
+
+    Args:
+        entries (list):
+            The entries of the option table, as returned by
+            `bash_parser_v3.get_table_entries()`.
+
+        code (dict):
+            Mapping of parser names (`v1`, `v2`, `v3`) to their generated
+            code. Only the parsers in `code` are estimated.
+
+    Returns:
+        OrderedDict: Mapping of parser names to `Estimate` objects.
+    '''
+
+    stats = _Statistics(entries)
+
+    mix = ['positional']
+    if stats.long_commands:
+        mix.append('long')
+    if stats.short_commands:
+        mix.append('short')
+    mix = {word_type: 1 / len(mix) for word_type in mix}
+
+    estimators = {'v1': _estimate_v1, 'v2': _estimate_v2, 'v3': _estimate_v3}
+
+    result = OrderedDict()
+
+    for parser in PARSERS:
+        if parser not in code:
+            continue
+
+        source = len(code[parser]) * COST_SOURCE_BYTE
+        if parser == 'v3':
+            source += stats.entries * COST_TABLE_ENTRY
+
+        completion, words = estimators[parser](stats, code[parser])
+        result[parser] = Estimate(source, completion, words, mix)
+
+    return result
+
+
+def choose(estimates):
+    '''Return the name of the parser with the lowest estimated costs.'''
+
+    return min(estimates, key=lambda parser: estimates[parser].total)
+
+
+def format_estimates(prog, estimates, chosen):
+    '''Return the estimates as a table.'''
+
+    lines = []
+    lines.append('Bash parser cost estimates for %s in us '
+                 '(source + %d completions of %d words):' % (
+                     prog, COMPLETIONS_PER_SOURCE, WORDS_PER_COMPLETION))
+    lines.append('%8s %10s %10s %10s %10s %10s %10s' % (
+        'parser', 'source', 'call', *WORD_TYPES, 'total'))
+
+    for parser, est in estimates.items():
+        words = []
+        for word_type in WORD_TYPES:
+            if word_type in est.mix:
+                words.append('%10.2f' % est.get_word(word_type))
+            else:
+                words.append('%10s' % '-')
+
+        lines.append('%8s %10.1f %10.1f %s %10.1f%s' % (
+            parser, est.source, price(est.completion), ' '.join(words),
+            est.total, ' *' if parser == chosen else ''))
+
+    return '\n'.join(lines)
@@ -205,7 +205,7 @@ def generate(commandline, variable_manager):
 
 def _generate_option_cases(commandline, variable_manager):
     OptionCase = namedtuple('OptionCase', ['option_strings', 'variable', 'args'])
-    options = commandline.get_options()
+    options = commandline.get_option_index().get_options()
     abbreviations = utils.get_option_abbreviator(commandline)
     option_cases = []
 
@@ -0,0 +1,304 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2025-2026 Benjamin Abendroth <braph93@gmx.de>
+
+'''Code for parsing a command line in Bash, version 3.
+
+Instead of matching each word against the case patterns of all command
+lines, the options are stored in a global associative array which is
+defined once when the script is sourced. The keys are made of the command
+path and the option string, separated by a tab:
+
+    [root:sub$'\\t'--option]=1OPT_option
+
+The value is the number of arguments (`0`, `1` or `?`) followed by the
+name of the variable that captures the option. This way each word is
+resolved in a single lookup.
+
+Options of command lines that have `inherit_options` set are stored for
+each of their subcommands. They are also stored for unknown subcommands,
+using the command path `<parent>:*`. In this case the table also contains
+the known command paths as keys, so that unknown subcommands can be
+detected.
+'''
+
+from collections import OrderedDict
+
+from . import utils
+from . import shell
+from .str_utils import indent
+from .bash_parser_subcommand_code import (
+    make_subcommand_switch_code, get_subcommand_path
+)
+from .preprocessor import preprocess
+
+_PARSER_CODE = '''\
+#ifdef positionals
+POSITIONALS=()
+#endif
+END_OF_OPTIONS=0
+
+local cmd="root" argi arg i char trailing_chars REPLY ___var
+
+for ((argi=1; argi < cword; ++argi)); do
+  arg="${words_dequoted[argi]}"
+
+  case "$arg" in
+    --)
+      END_OF_OPTIONS=1
+#ifdef positionals
+      POSITIONALS+=("${words_dequoted[@]:$((++argi))}")
+#endif
+      return;;
+#ifdef long_options
+    --*=*)
+      REPLY="${%TABLE%["$cmd"$'\\t'"${arg%%=*}"]}"
+      if [[ -n "$REPLY" ]]; then
+        declare -n ___var="${REPLY:1}"
+        ___var+=("${arg#*=}")
+      fi;;
+    --*)
+      REPLY="${%TABLE%["$cmd"$'\\t'"$arg"]}"
+      if [[ -n "$REPLY" ]]; then
+        declare -n ___var="${REPLY:1}"
+        if [[ "${REPLY:0:1}" == 1 ]]
+        then ___var+=("${words_dequoted[++argi]}")
+        else ___var+=(_OPT_ISSET_)
+        fi
+      fi;;
+#else
+    --*);;
+#endif
+    -?*) # ignore '-'
+#ifdef old_options
+      if [[ "$arg" == -*=* ]]; then
+        REPLY="${%TABLE%["$cmd"$'\\t'"${arg%%=*}"]}"
+        if [[ -n "$REPLY" ]]; then
+          declare -n ___var="${REPLY:1}"
+          ___var+=("${arg#*=}")
+          continue
+        fi
+      fi
+
+      REPLY="${%TABLE%["$cmd"$'\\t'"$arg"]}"
+      if [[ -n "$REPLY" ]]; then
+        declare -n ___var="${REPLY:1}"
+        if [[ "${REPLY:0:1}" == 1 ]]
+        then ___var+=("${words_dequoted[++argi]}")
+        else ___var+=(_OPT_ISSET_)
+        fi
+
+        continue
+      fi
+#endif
+
+#ifdef short_options
+      for ((i=1; i < ${#arg}; ++i)); do
+        char="${arg:$i:1}"
+        trailing_chars="${arg:$((i + 1))}"
+
+        REPLY="${%TABLE%["$cmd"$'\\t'"-$char"]}"
+        if [[ -n "$REPLY" ]]; then
+          declare -n ___var="${REPLY:1}"
+          if [[ "${REPLY:0:1}" == 1 ]]; then
+            if [[ -n "$trailing_chars" ]]
+            then ___var+=("$trailing_chars")
+            else ___var+=("${words_dequoted[++argi]}")
+            fi
+            break;
+#ifdef short_optionals
+          elif [[ "${REPLY:0:1}" == '?' ]]; then
+            if [[ -n "$trailing_chars" ]]
+            then ___var+=("$trailing_chars")
+            else ___var+=(_OPT_ISSET_)
+            fi
+            break;
+#endif
+          else
+            ___var+=(_OPT_ISSET_)
+          fi
+        fi
+      done
+#endif
+      ;;
+#ifdef positionals
+    *)
+      POSITIONALS+=("$arg")
+#ifdef unknown_subcommands
+      REPLY="$cmd"
+#endif
+%SUBCOMMAND_SWITCH_CODE%
+#ifdef unknown_subcommands
+      [[ -v %TABLE%["$cmd"] ]] || cmd="$REPLY:*"
+#endif
+      ;;
+#endif
+  esac
+done
+#ifdef positionals
+
+for ((; argi <= cword; ++argi)); do
+  case "${words_dequoted[argi]}" in
+    -?*);;
+    *) POSITIONALS+=("${words_dequoted[argi]}");;
+  esac
+done
+#endif'''
+
+
+def _get_option_entries(commandline, variable_manager):
+    '''Return a dictionary mapping the option strings to their values.'''
+
+    abbreviations = utils.get_option_abbreviator(commandline)
+    entries = OrderedDict()
+
+    for option in commandline.get_option_index().get_options():
+        option_strings = option.get_short_option_strings()
+
+        option_strings += abbreviations.get_many_abbreviations(
+                option.get_long_option_strings())
+
+        option_strings += abbreviations.get_many_abbreviations(
+                option.get_old_option_strings())
+
+        variable = variable_manager.capture_variable(option)
+
+        if option.has_optional_arg():
+            args = '?'
+        elif option.has_required_arg():
+            args = '1'
+        else:
+            args = '0'
+
+        for option_string in option_strings:
+            entries.setdefault(option_string, args + variable)
+
+    return entries
+
+
+def _inherits_options(commandline):
+    '''Check if subcommands of `commandline` inherit any options.'''
+
+    return any(c.inherit_options for c in commandline.get_parents(include_self=True))
+
+
+def has_unknown_subcommands(commandline):
+    '''Check if inherited options have to be stored for unknown subcommands.'''
+
+    for cmdline in commandline.get_all_commandlines():
+        if cmdline.get_subcommands() and _inherits_options(cmdline):
+            return True
+
+    return False
+
+
+def get_table_entries(commandline, variable_manager):
+    '''Return all entries of the option table.
+
+    Returns:
+        list: Tuples of (command path, option string, value).
+    '''
+
+    own_entries = {}  # command path -> entries
+    result = []
+
+    def add_entries(command, entries):
+        for option_string, value in entries.items():
+            result.append((command, option_string, value))
+
+    for cmdline in commandline.get_all_commandlines():
+        command = get_subcommand_path(cmdline)
+        own_entries[command] = _get_option_entries(cmdline, variable_manager)
+
+        # Options of subcommands take precedence over inherited options
+        inherited = OrderedDict()
+        for parent in cmdline.get_parents():
+            if parent.inherit_options:
+                inherited.update(own_entries[get_subcommand_path(parent)])
+
+        entries = inherited.copy()
+        entries.update(own_entries[command])
+        add_entries(command, entries)
+
+        if cmdline.get_subcommands() and _inherits_options(cmdline):
+            if cmdline.inherit_options:
+                inherited.update(own_entries[command])
+            add_entries(command + ':*', inherited)
+
+    return result
+
+
+def get_commands(commandline):
+    '''Return the command paths that are stored in the option table.
+
+    Only needed if `has_unknown_subcommands()` is true.
+    '''
+
+    commands = []
+
+    for cmdline in commandline.get_all_commandlines():
+        commands.append(get_subcommand_path(cmdline))
+
+        if cmdline.get_subcommands() and _inherits_options(cmdline):
+            commands.append(get_subcommand_path(cmdline) + ':*')
+
+    return commands
+
+
+def generate_table(entries, commands, table):
+    '''Generate the definition of the option table named `table`.
+
+    Args:
+        entries (list):
+            The entries as returned by `get_table_entries()`.
+
+        commands (list):
+            The command paths as returned by `get_commands()`, or an
+            empty list.
+
+        table (str):
+            The name of the table.
+    '''
+
+    r = 'declare -gA %s=(\n' % table
+    for command in commands:
+        r += '  [%s]=1\n' % shell.quote(command)
+    for command, option_string, value in entries:
+        r += "  [%s$'\\t'%s]=%s\n" % (
+            shell.quote(command), shell.quote(option_string), shell.quote(value))
+    r += ')'
+    return r
+
+
+def generate(commandline, table):
+    '''Generate code for parsing the command line.
+
+    The option table has to be defined using `generate_table()`.
+    '''
+
+    subcommand_switch_code = make_subcommand_switch_code(commandline)
+
+    defines = []
+    types = utils.get_defined_option_types(commandline)
+    if types.short:
+        defines.append('short_options')
+    if types.long:
+        defines.append('long_options')
+    if types.old:
+        defines.append('old_options')
+    if types.short_optional:
+        defines.append('short_optionals')
+    if types.positionals:
+        defines.append('positionals')
+    if has_unknown_subcommands(commandline):
+        defines.append('unknown_subcommands')
+
+    s = preprocess(_PARSER_CODE, defines)
+    s = s.replace('%TABLE%', table)
+
+    if subcommand_switch_code:
+        s = s.replace('%SUBCOMMAND_SWITCH_CODE%',
+                      indent(subcommand_switch_code, 6))
+    else:
+        s = s.replace('%SUBCOMMAND_SWITCH_CODE%\n', '')
+
+    return s
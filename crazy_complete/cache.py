@@ -0,0 +1,197 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2025-2026 Benjamin Abendroth <braph93@gmx.de>
+
+'''On-disk cache for generated completion files.
+
+Cache entries are addressed by a hash of everything that influences the
+generated output: The contents of the definition file and of the included
+files, the target shell, the configuration and the crazy-complete version.
+
+Each entry is stored in its own file. The first line holds the program name,
+the rest of the file is the generated code. The modification time of an entry
+is updated on every cache hit and used for evicting the least recently used
+entries once the cache grows beyond its maximum size.
+'''
+
+import os
+import hashlib
+import tempfile
+
+# Default maximum size of the cache directory in bytes
+DEFAULT_MAX_SIZE = 64 * 1024 * 1024
+
+# Bump this if the format of the cache entries changes
+_CACHE_FORMAT = 1
+
+_SUFFIX = '.cache'
+
+
+def get_default_cache_dir():
+    '''Return the default cache directory.
+
+    This is `$XDG_CACHE_HOME/crazy-complete`, falling back to
+    `~/.cache/crazy-complete`.
+    '''
+
+    cache_home = os.environ.get('XDG_CACHE_HOME')
+
+    if not cache_home or not os.path.isabs(cache_home):
+        cache_home = os.path.join(os.path.expanduser('~'), '.cache')
+
+    return os.path.join(cache_home, 'crazy-complete')
+
+
+def _hash_file(hasher, file):
+    with open(file, 'rb') as fh:
+        content = fh.read()
+
+    hasher.update(b'%d:' % len(content))
+    hasher.update(content)
+
+
+def _hash_string(hasher, string):
+    data = string.encode('utf-8')
+    hasher.update(b'%d:' % len(data))
+    hasher.update(data)
+
+
+class GenerationCache:
+    '''Cache for generated completion files.'''
+
+    def __init__(self, directory, max_size=DEFAULT_MAX_SIZE):
+        '''Initializes the cache.
+
+        Args:
+            directory (str):
+                The cache directory. It is created on the first write.
+
+            max_size (int):
+                Maximum size of all cache entries in bytes.
+        '''
+
+        self.directory = directory
+        self.max_size = max_size
+
+    @staticmethod
+    def make_key(definition_file, input_type, shell, config, version):
+        '''Return the cache key for a generation.
+
+        Args:
+            definition_file (str):
+                The path of the definition file.
+
+            input_type (str):
+                The type of the definition file (yaml, json, ...).
+
+            shell (str):
+                The target shell.
+
+            config (Config):
+                The configuration used for generation.
+
+            version (str):
+                The crazy-complete version.
+
+        Returns:
+            str: The key or None if a file could not be read.
+        '''
+
+        hasher = hashlib.sha256()
+
+        _hash_string(hasher, repr((_CACHE_FORMAT, version, input_type, shell)))
+        _hash_string(hasher, repr(sorted(vars(config).items())))
+
+        try:
+            _hash_file(hasher, definition_file)
+
+            for file in config.include_files:
+                _hash_file(hasher, file)
+        except OSError:
+            return None
+
+        return hasher.hexdigest()
+
+    def _get_path(self, key):
+        return os.path.join(self.directory, key + _SUFFIX)
+
+    def get(self, key):
+        '''Return a cached entry.
+
+        Returns:
+            tuple: The program name and the generated code, or None if
+                   there is no entry for `key`.
+        '''
+
+        path = self._get_path(key)
+
+        try:
+            with open(path, 'r', encoding='utf-8') as fh:
+                content = fh.read()
+
+            # Mark entry as recently used
+            os.utime(path)
+        except (OSError, UnicodeDecodeError):
+            return None
+
+        prog, sep, output = content.partition('\n')
+        if not sep:
+            return None
+
+        return (prog, output)
+
+    def put(self, key, prog, output):
+        '''Store an entry in the cache.
+
+        Errors while writing are ignored, the cache is only an optimization.
+        '''
+
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+
+            fd, tmp = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as fh:
+                    fh.write(prog)
+                    fh.write('\n')
+                    fh.write(output)
+                os.replace(tmp, self._get_path(key))
+            except BaseException:
+                os.unlink(tmp)
+                raise
+
+            self.evict()
+        except OSError:
+            pass
+
+    def evict(self):
+        '''Remove the least recently used entries until the cache fits
+        into its maximum size.'''
+
+        entries = []
+        total_size = 0
+
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if not entry.name.endswith(_SUFFIX):
+                    continue
+
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total_size += stat.st_size
+
+        entries.sort()
+
+        for _, size, path in entries:
+            if total_size <= self.max_size:
+                break
+
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+
+            total_size -= size
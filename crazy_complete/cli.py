@@ -30,9 +30,89 @@ def is_extended_bool(obj):
     return obj in (True, False, INHERIT)
 
 
+class OptionIndex:
+    '''Lookup tables for the options of a CommandLine object.
+
+    The index is built on first use by `CommandLine.get_option_index()` and
+    rebuilt if options are added to the command line or to one of its
+    parents. The index returns tuples, which can be used without copying.
+    '''
+
+    def __init__(self, commandline, stamp):
+        self.commandline = commandline
+        self.stamp = stamp
+        self.by_option_string = {}
+        self.by_group = OrderedDict()
+        final_options = []
+        self._conflicting = {}
+        self._options = {}
+
+        for option in commandline.options:
+            for option_string in option.option_strings:
+                self.by_option_string.setdefault(option_string, option)
+
+            for group in option.groups or ():
+                options = self.by_group.setdefault(group, [])
+                if option not in options:
+                    options.append(option)
+
+        cmdline = commandline
+        while cmdline:
+            final_options.extend(o for o in cmdline.options if o.final)
+            cmdline = cmdline.parent
+
+        self.final_options = tuple(final_options)
+
+    def get_options(self, with_parent_options=False, only_with_arguments=False):
+        '''Return the result of `CommandLine.get_options()` as a tuple.'''
+
+        key = (with_parent_options, only_with_arguments)
+
+        try:
+            return self._options[key]
+        except KeyError:
+            pass
+
+        getter = CommandLine.OptionsGetter(
+            self.commandline,
+            with_parent_options=with_parent_options,
+            only_with_arguments=only_with_arguments)
+
+        options = self._options[key] = tuple(getter.get())
+        return options
+
+    def get_conflicting_options(self, option):
+        '''Return the result of `Option.get_conflicting_options()` as a tuple.'''
+
+        try:
+            return self._conflicting[id(option)]
+        except KeyError:
+            pass
+
+        r = []
+        for group in option.groups:
+            for other in self.by_group.get(group, ()):
+                if other not in r:
+                    r.append(other)
+        r.remove(option)
+
+        r = self._conflicting[id(option)] = tuple(r)
+        return r
+
+
+def _is_same_stamp(a, b):
+    return len(a) == len(b) and all(
+        x[0] is y[0] and x[1] == y[1] for x, y in zip(a, b))
+
+
 class CommandLine:
     '''Represents a command line with options, positionals, and subcommands.'''
 
+    __slots__ = ('prog', 'parent', 'help', 'aliases', 'wraps',
+                 'abbreviate_commands', 'abbreviate_options', 'inherit_options',
+                 'options', 'positionals', 'subcommands', 'validated',
+                 '_option_index', '_options_version')
+
     def __init__(self,
                  prog,
                  parent=None,
@@ -113,6 +193,15 @@ class CommandLine:
         self.positionals = []
         self.subcommands = None
 
+        # Set by definition sources that already ran the `scheme_validator`
+        # on this command line. Cleared when the command line is modified.
+        self.validated = False
+
+        # Cache for `get_option_index()`. The version is increased each time
+        # the options of this command line are modified.
+        self._option_index = None
+        self._options_version = 0
+
     def add_option(self, option_strings, **parameters):
         '''Adds a new option to the command line.
 
@@ -124,6 +213,8 @@ class CommandLine:
 
         o = Option(self, option_strings, **parameters)
         self.options.append(o)
+        self.validated = False
+        self.invalidate_option_index()
         return o
 
     def add_positional(self, number, **parameters):
@@ -137,6 +228,7 @@ class CommandLine:
 
         p = Positional(self, number, **parameters)
         self.positionals.append(p)
+        self.validated = False
         return p
 
     def add_mutually_exclusive_group(self, group):
@@ -162,6 +254,7 @@ class CommandLine:
             raise CrazyError('CommandLine object already has subcommands')
 
         self.subcommands = SubCommandsOption(self)
+        self.validated = False
         return self.subcommands
 
     class OptionsGetter:
@@ -197,6 +290,41 @@ class CommandLine:
                     r.append(option)
             return r
 
+    def _get_option_index_stamp(self):
+        # The command lines are stored themselves (not their ids), so they
+        # cannot be freed and replaced by other objects at the same address.
+        # pylint: disable=protected-access
+        stamp = []
+        cmdline = self
+        while cmdline:
+            stamp.append((cmdline, cmdline._options_version))
+            cmdline = cmdline.parent
+        return stamp
+
+    def get_option_index(self):
+        '''Return the `OptionIndex` of this command line.
+
+        The index is cached. It is rebuilt if options are added to this
+        command line or one of its parents using `add_option()` or
+        `MutuallyExclusiveGroup.add_option()`, or if the parent of a command
+        line changes. If the options are modified in any other way,
+        `invalidate_option_index()` has to be called.
+        '''
+
+        stamp = self._get_option_index_stamp()
+        index = self._option_index
+
+        if index is None or not _is_same_stamp(index.stamp, stamp):
+            index = self._option_index = OptionIndex(self, stamp)
+
+        return index
+
+    def invalidate_option_index(self):
+        '''Discard the cached `OptionIndex` of this command line and its
+        subcommands.'''
+
+        self._options_version += 1
+
     def get_options(self, with_parent_options=False, only_with_arguments=False):
         '''Gets a list of options associated with the command line.
 
@@ -214,12 +342,8 @@ class CommandLine:
         assert isinstance(with_parent_options, bool)
         assert isinstance(only_with_arguments, bool)
 
-        getter = CommandLine.OptionsGetter(
-            self,
-            with_parent_options=with_parent_options,
-            only_with_arguments=only_with_arguments)
-
-        return getter.get()
+        index = self.get_option_index()
+        return list(index.get_options(with_parent_options, only_with_arguments))
 
     def get_option_strings(self, with_parent_options=False, only_with_arguments=False):
         '''Gets a list of option strings associated with the command line.
@@ -252,16 +376,7 @@ class CommandLine:
     def get_final_options(self):
         '''Gets a list of all final options.'''
 
-        r = []
-        cmdline = self
-
-        while cmdline:
-            for option in cmdline.options:
-                if option.final:
-                    r.append(option)
-            cmdline = cmdline.parent
-
-        return r
+        return list(self.get_option_index().final_options)
 
     def get_final_option_strings(self):
         '''Gets a list of all final option strings.'''
@@ -331,17 +446,16 @@ class CommandLine:
         '''Return all options containing one option_strings.'''
 
         result = []
+        by_option_string = self.get_option_index().by_option_string
 
         for option_string in option_strings:
-            found = False
-            for option in self.options:
-                if option_string in option.option_strings:
-                    if option not in result:
-                        result.append(option)
-                    found = True
-                    break
-            if not found:
-                raise CrazyError('Option %r not found' % option_string)
+            try:
+                option = by_option_string[option_string]
+            except KeyError:
+                raise CrazyError('Option %r not found' % option_string) from None
+
+            if option not in result:
+                result.append(option)
 
         return result
 
@@ -432,6 +546,7 @@ class CommandLine:
             for subparser in self.subcommands.subcommands:
                 subcommands_option.add_commandline_object(subparser.copy())
 
+        copy.validated = self.validated
         return copy
 
     def __eq__(self, other):
@@ -468,6 +583,9 @@ class CommandLine:
 class Positional:
     '''Class representing a command line positional.'''
 
+    __slots__ = ('parent', 'number', 'metavar', 'help', 'repeatable',
+                 'complete', 'nosort', 'when', 'capture')
+
     def __init__(
             self,
             parent,
@@ -602,6 +720,10 @@ def is_old_option_string(string):
 class Option:
     '''Class representing a command line option.'''
 
+    __slots__ = ('parent', 'option_strings', 'metavar', 'help', 'complete',
+                 'nosort', 'groups', 'optional_arg', 'repeatable', 'final',
+                 'hidden', 'when', 'capture', 'long_opt_arg_sep')
+
     # pylint: disable=too-many-locals
 
     def __init__(
@@ -792,14 +914,9 @@ class Option:
 
         if not self.groups:
             return []
-        r = []
-        for group in self.groups:
-            for option in self.parent.options:
-                if option.groups is not None and group in option.groups:
-                    if option not in r:
-                        r.append(option)
-        r.remove(self)
-        return r
+
+        index = self.parent.get_option_index()
+        return list(index.get_conflicting_options(self))
 
     def get_conflicting_option_strings(self):
         '''Returns a list of option strings conflicting with the current option
@@ -809,8 +926,11 @@ class Option:
             list: A list of option strings representing conflicting options.
         '''
 
+        if not self.groups:
+            return []
+
         r = []
-        for option in self.get_conflicting_options():
+        for option in self.parent.get_option_index().get_conflicting_options(self):
             r.extend(option.get_option_strings())
         return r
 
@@ -849,6 +969,8 @@ class Option:
 class SubCommandsOption(Positional):
     '''Class holding subcommands of a commandline.'''
 
+    __slots__ = ('subcommands',)
+
     def __init__(self, parent):
         self.subcommands = []
 
@@ -940,3 +1062,4 @@ class MutuallyExclusiveGroup:
 
         option.parent = self.parent
         option.groups = [self.group]
+        self.parent.invalidate_option_index()
@@ -0,0 +1,139 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2025-2026 Benjamin Abendroth <braph93@gmx.de>
+
+'''Views of CommandLine objects with the configuration applied.
+
+A view wraps a CommandLine, Option, Positional or SubCommandsOption object
+and overlays the settings that depend on the `Config` (e.g. INHERIT values).
+All other attributes are read from the wrapped object when they are first
+accessed.
+
+The wrapped objects are never modified, so the same definition can be used
+for generating multiple shells. Unlike `CommandLine.copy()`, creating a view
+neither copies the attributes nor runs the constructors and their validation
+again.
+
+Views are subclasses of the classes they wrap, so all methods of the wrapped
+class work on them. Attributes can be set on views (e.g. `when_parsed`),
+this does not affect the wrapped object. Attribute values that are read from
+the wrapped object (e.g. `option_strings`) are shared with it, so they have
+to be replaced on the view instead of being modified in place.
+'''
+
+from . import cli
+from . import config as _config
+
+# pylint: disable=super-init-not-called
+# pylint: disable=too-few-public-methods
+
+
+def _resolve(value, default):
+    if value == cli.INHERIT:
+        return default
+    return value
+
+
+class _View:
+    '''Forwards reading attributes that are not set on the view.'''
+
+    def __getattr__(self, name):
+        # Only called if the attribute is not set on the view
+        if name == 'wrapped':
+            raise AttributeError(name)
+
+        value = getattr(self.wrapped, name)
+        setattr(self, name, value)
+        return value
+
+
+class CommandLineView(_View, cli.CommandLine):
+    '''A CommandLine with the configuration applied.'''
+
+    def __init__(self, commandline, config, parent=None):
+        '''Initializes the view.
+
+        Args:
+            commandline (CommandLine):
+                The command line object to wrap.
+
+            config (Config):
+                The configuration object containing the settings to apply.
+
+            parent (CommandLineView or None):
+                The view of the parent command line.
+        '''
+
+        assert isinstance(commandline, cli.CommandLine)
+        assert isinstance(config, _config.Config)
+
+        self.wrapped = commandline
+        self.parent = parent
+        self._option_index = None
+        self._options_version = 0
+
+        self.abbreviate_commands = _resolve(
+            commandline.abbreviate_commands, config.abbreviate_commands)
+
+        self.abbreviate_options = _resolve(
+            commandline.abbreviate_options, config.abbreviate_options)
+
+        self.inherit_options = _resolve(
+            commandline.inherit_options, config.inherit_options)
+
+        self.options = [
+            OptionView(option, config, self) for option in commandline.options]
+
+        self.positionals = [
+            PositionalView(positional, config, self) for positional in commandline.positionals]
+
+        if commandline.subcommands is not None:
+            self.subcommands = SubCommandsOptionView(commandline.subcommands, config, self)
+
+
+class OptionView(_View, cli.Option):
+    '''An Option with the configuration applied.'''
+
+    def __init__(self, option, config, parent):
+        self.wrapped = option
+        self.parent = parent
+
+        self.repeatable = _resolve(option.repeatable, config.repeatable_options)
+        self.long_opt_arg_sep = _resolve(option.long_opt_arg_sep, config.long_opt_arg_sep)
+
+        if config.disabled_hidden:
+            self.hidden = False
+
+        if config.disabled_final:
+            self.final = False
+
+        if config.disabled_groups:
+            self.groups = []
+
+        if config.disabled_repeatable:
+            self.repeatable = True
+
+        if config.disabled_when:
+            self.when = None
+
+
+class PositionalView(_View, cli.Positional):
+    '''A Positional with the configuration applied.'''
+
+    def __init__(self, positional, config, parent):
+        self.wrapped = positional
+        self.parent = parent
+
+        if config.disabled_when:
+            self.when = None
+
+
+class SubCommandsOptionView(_View, cli.SubCommandsOption):
+    '''A SubCommandsOption holding views of the subcommands.'''
+
+    def __init__(self, subcommands, config, parent):
+        self.wrapped = subcommands
+        self.parent = parent
+
+        self.subcommands = [
+            CommandLineView(commandline, config, parent)
+            for commandline in subcommands.subcommands]
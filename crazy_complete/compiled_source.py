@@ -0,0 +1,106 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2025-2026 Benjamin Abendroth <braph93@gmx.de>
+
+"""
+This module provides functions for creating CommandLine objects from compiled
+definition files and vice versa.
+
+A compiled definition file holds the command lines of a definition file that
+has already been validated and whose defines have been replaced. Loading it
+skips parsing and validating the definition file.
+
+The file starts with a header line:
+
+    crazy-complete <FORMAT VERSION> <MARSHAL VERSION> <SHA256 OF PAYLOAD>
+
+The payload is the list of command line dictionaries (as created by
+`dictionary_source.commandline_to_dictionaries`), serialized using `marshal`
+and compressed using zlib. Unlike pickle, unmarshalling data cannot execute
+code.
+
+The checksum only detects corrupted files. The command lines of a compiled
+file are trusted to be valid, they are not validated again when loading it.
+"""
+
+import zlib
+import marshal
+import hashlib
+
+from . import dictionary_source
+from . import completion_validator
+from .errors import CrazyError
+
+
+# Bump this if the format of the compiled files changes
+FORMAT_VERSION = 1
+
+_MAGIC = b'crazy-complete'
+
+
+def _to_builtin(obj):
+    # marshal only supports the built-in types, not OrderedDict
+    if isinstance(obj, dict):
+        return {key: _to_builtin(value) for key, value in obj.items()}
+    if isinstance(obj, list):
+        return [_to_builtin(value) for value in obj]
+    return obj
+
+
+def commandline_to_compiled(commandline):
+    '''Convert a cli.CommandLine object into a compiled definition.
+
+    Command lines that have not been validated by their source are
+    validated first.
+
+    Returns:
+        bytes: The compiled definition.
+    '''
+
+    completion_validator.validate_commandlines(commandline)
+
+    dictionaries = dictionary_source.commandline_to_dictionaries(commandline)
+    payload = zlib.compress(marshal.dumps(_to_builtin(dictionaries)))
+    digest = hashlib.sha256(payload).hexdigest()
+
+    header = b'%s %d %d %s\n' % (_MAGIC, FORMAT_VERSION, marshal.version, digest.encode())
+    return header + payload
+
+
+def load_from_file(file):
+    '''Load a compiled definition file and turn it into a cli.CommandLine object.
+
+    Raises:
+        CrazyError: If the file is not a compiled definition file, if it
+                    was created by an incompatible version or if it is
+                    corrupted.
+    '''
+
+    with open(file, 'rb') as fh:
+        header = fh.readline()
+        payload = fh.read()
+
+    try:
+        magic, format_version, marshal_version, digest = header.split()
+        format_version = int(format_version)
+        marshal_version = int(marshal_version)
+    except ValueError:
+        magic = None
+
+    if magic != _MAGIC:
+        raise CrazyError(f'{file}: Not a compiled definition file')
+
+    if format_version != FORMAT_VERSION or marshal_version != marshal.version:
+        raise CrazyError(f'{file}: Compiled by an incompatible version of '
+                         'crazy-complete. Please compile it again')
+
+    if hashlib.sha256(payload).hexdigest().encode() != digest:
+        raise CrazyError(f'{file}: Checksum mismatch, the file is corrupted')
+
+    try:
+        dictionaries = marshal.loads(zlib.decompress(payload))
+    except (zlib.error, EOFError, ValueError, TypeError):
+        raise CrazyError(f'{file}: Corrupted compiled definition file') from None
+
+    # The definitions have been validated before they were compiled. The file
+    # is trusted not to be modified since then (see the module docstring).
+    return dictionary_source.dictionaries_to_commandline(dictionaries, validated=True)
@@ -13,6 +13,7 @@
 from types import NoneType
 
 from . import scheme_validator
+from . import profiler
 from .value_with_trace import ValueWithOutTrace
 
 
@@ -64,9 +65,20 @@ def _positional_to_definition(positional):
     }
 
 
+def _get_options_to_revalidate(cmdline):
+    # The configuration (see `cli_view`) only changes values to ones that are
+    # valid on their own, but it may turn a hidden option into a repeatable
+    # one, which the `scheme_validator` rejects.
+    return [o for o in cmdline.options if o.repeatable is True and o.hidden is True]
+
+
 def _commandline_to_definition(cmdline):
-    options = list(map(_option_to_definition, cmdline.options))
-    positionals = list(map(_positional_to_definition, cmdline.positionals))
+    if cmdline.validated:
+        options = list(map(_option_to_definition, _get_options_to_revalidate(cmdline)))
+        positionals = []
+    else:
+        options = list(map(_option_to_definition, cmdline.options))
+        positionals = list(map(_positional_to_definition, cmdline.positionals))
 
     definition = {
         'prog':                cmdline.get_command_path(),
@@ -95,6 +107,18 @@ def _commandlines_to_definition_list(commandline):
 
 
 def validate_commandlines(cmdline):
-    '''Validate commandlines.'''
-    definitions = _commandlines_to_definition_list(cmdline)
-    scheme_validator.validate(definitions)
+    '''Validate commandlines.
+
+    Command lines which have already been validated by their source are
+    only checked for problems introduced by applying the configuration.
+    '''
+
+    def is_valid(cmdline):
+        return cmdline.validated and not _get_options_to_revalidate(cmdline)
+
+    if all(map(is_valid, cmdline.get_all_commandlines())):
+        return
+
+    with profiler.phase('validate'):
+        definitions = _commandlines_to_definition_list(cmdline)
+        scheme_validator.validate(definitions)
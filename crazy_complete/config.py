@@ -36,6 +36,7 @@ class Config:
         self.keep_comments          = False
         self.line_length            = 80
         self.bash_completions_version = (2,)
+        self.bash_parser            = 'auto'
         self.zsh_compdef            = True
         self.fish_inline_conditions = False
 
@@ -291,6 +292,29 @@ class Config:
 
         self.bash_completions_version = version
 
+    def set_bash_parser(self, parser):
+        '''Sets which command line parser is used in Bash scripts.
+
+        Args:
+            parser (str):
+                If `auto`, the parser with the lowest estimated costs is used.
+                If `v1`, the command line is parsed using case statements.
+                If `v2`, the case statements are moved into a function.
+                If `v3`, the options are looked up in an associative array.
+
+        Notes:
+            This defaults to `auto`.
+
+            The cost estimates are printed in debug mode.
+        '''
+
+        if parser not in ('auto', 'v1', 'v2', 'v3'):
+            raise AssertionError('Config.set_bash_parser: '
+                                 'parser: Invalid value: '
+                                 'expected: `auto`, `v1`, `v2` or `v3`')
+
+        self.bash_parser = parser
+
     def set_zsh_compdef(self, enable):
         '''Sets whether a `#compdef` comment is written at the top of the
         generated zsh script.
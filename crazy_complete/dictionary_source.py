@@ -118,6 +118,8 @@ def _get_commandline_by_path(root, path):
 def replace_defines_in_documents(documents):
     '''Replaces defines in a list of documents.
 
+    The documents are not modified, a new list of documents is returned.
+
     Exmaple:
         prog: '%defines%'
         my_completer: ['choices', ['foo', 'bar']]
@@ -128,21 +130,20 @@ def replace_defines_in_documents(documents):
             complete: 'my_completer'
     '''
 
-    defines = None
+    defines_document = None
 
     for document in documents:
         if not isinstance(document, dict):
             continue
 
         if 'prog' in document and document['prog'] == '%defines%':
-            defines = document
+            defines_document = document
             break
 
-    if defines is None:
+    if defines_document is None:
         return documents
 
-    documents.remove(defines)
-    defines.pop('prog')
+    defines = {key: val for key, val in defines_document.items() if key != 'prog'}
 
     def replace_defines(obj):
         if isinstance(obj, str):
@@ -155,25 +156,35 @@ def replace_defines_in_documents(documents):
 
     new = []
     for document in documents:
-        new.append(replace_defines(document))
+        if document is not defines_document:
+            new.append(replace_defines(document))
     return new
 
 
-def dictionaries_to_commandline(dictionaries):
-    '''Convert a list of dictionaries to a cli.CommandLine object.'''
+def _set_validated(commandline):
+    commandline.validated = True
 
-    dictionaries = replace_defines_in_documents(dictionaries)
-    compat.fix_commandline_dictionaries(dictionaries)
 
-    root = CommandLine('root')
+class CommandLineBuilder:
+    '''Build a cli.CommandLine object from dictionaries, one at a time.
 
-    for dictionary in dictionaries:
+    Dictionaries of subcommands have to be added after the dictionary of
+    their parent command. Defines have to be replaced by the caller.
+    '''
+
+    def __init__(self):
+        self.root = CommandLine('root')
+
+    def add_dictionary(self, dictionary):
+        '''Convert `dictionary` and add it to the command line tree.'''
+
+        compat.fix_commandline_dictionary(dictionary)
         _check_prog_in_dictionary(dictionary)
 
         path = dictionary['prog'].split()
         progname = path.pop()
 
-        cmdline = _get_commandline_by_path(root, path)
+        cmdline = _get_commandline_by_path(self.root, path)
 
         subcommands = cmdline.get_subcommands()
         if not subcommands:
@@ -186,16 +197,46 @@ def dictionaries_to_commandline(dictionaries):
         except CrazyError as e:
             raise CrazyError(f"Multiple definition of program `{progname}`") from e
 
-    if not root.get_subcommands():
-        raise CrazyError("No programs defined")
+    def get_commandline(self, validated=False):
+        '''Return the main command line.
+
+        If `validated` is True, the dictionaries have already been checked
+        by the `scheme_validator` and the command lines are marked as
+        validated.
+        '''
+
+        if not self.root.get_subcommands():
+            raise CrazyError("No programs defined")
+
+        if len(self.root.get_subcommands().subcommands) > 1:
+            progs = [c.prog for c in self.root.get_subcommands().subcommands]
+            raise CrazyError(f"Too many main programs defined: {progs}")
+
+        cmdline = self.root.get_subcommands().subcommands[0]
+        cmdline.parent = None
 
-    if len(root.get_subcommands().subcommands) > 1:
-        progs = [c.prog for c in root.get_subcommands().subcommands]
-        raise CrazyError(f"Too many main programs defined: {progs}")
+        if validated:
+            cmdline.visit_commandlines(_set_validated)
+
+        return cmdline
+
+
+def dictionaries_to_commandline(dictionaries, validated=False):
+    '''Convert a list of dictionaries to a cli.CommandLine object.
+
+    If `validated` is True, the dictionaries have already been checked by
+    the `scheme_validator` and the resulting command lines are marked as
+    validated.
+    '''
+
+    dictionaries = replace_defines_in_documents(dictionaries)
+
+    builder = CommandLineBuilder()
+
+    for dictionary in dictionaries:
+        builder.add_dictionary(dictionary)
 
-    cmdline = root.get_subcommands().subcommands[0]
-    cmdline.parent = None
-    return cmdline
+    return builder.get_commandline(validated)
 
 
 def option_to_dictionary(self):
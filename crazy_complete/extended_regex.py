@@ -0,0 +1,685 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2025-2026 Benjamin Abendroth <braph93@gmx.de>
+
+'''This module contains a syntax checker for POSIX extended regular expressions.
+
+The checker follows the syntax accepted by `grep -E` (GNU grep using the
+GNU C library regex engine). It does not compile the regular expression,
+it only checks if `grep -E` would reject it.
+
+Some aspects depend on the current locale (e.g. the order of characters
+in ranges, collating elements and locale specific character classes).
+For these, the checker reports that it cannot decide.
+'''
+
+from .string_stream import StringStream
+
+
+# Token types
+CHARACTER     = 'CHARACTER'     # Literal character
+ANY           = 'ANY'           # .
+CHAR_CLASS    = 'CHAR_CLASS'    # \w \W \s \S
+ANCHOR        = 'ANCHOR'        # ^ $ \< \> \b \B \` \'
+BACK_REF      = 'BACK_REF'      # \1 ... \9
+OPEN_GROUP    = 'OPEN_GROUP'    # (
+CLOSE_GROUP   = 'CLOSE_GROUP'   # )
+ALTERNATION   = 'ALTERNATION'   # |
+DUPLICATION   = 'DUPLICATION'   # * + ?
+OPEN_INTERVAL = 'OPEN_INTERVAL' # {
+CLOSE_INTERVAL= 'CLOSE_INTERVAL'# }
+OPEN_BRACKET  = 'OPEN_BRACKET'  # [
+END           = 'END'
+
+# Maximum number of repetitions in an interval expression
+RE_DUP_MAX = 0x7fff
+
+# Maximum length of a name inside [: :], [. .] and [= =]
+BRACKET_NAME_MAX = 32
+
+CHARACTER_CLASSES = (
+    'alpha', 'upper', 'lower', 'digit', 'xdigit', 'space',
+    'print', 'punct', 'graph', 'cntrl', 'blank', 'alnum')
+
+
+class Undecidable(Exception):
+    '''Raised if the validity depends on the environment (e.g. the locale).'''
+
+
+class Token:
+    '''Holds a token.'''
+
+    # pylint: disable=too-few-public-methods
+
+    def __init__(self, type_, char=None):
+        self.type = type_
+        self.char = char
+
+    def __repr__(self):
+        return f'{self.type}({self.char!r})'
+
+
+class BracketElement:
+    '''Holds an element of a bracket expression.'''
+
+    # pylint: disable=too-few-public-methods
+
+    CHAR = 'CHAR'             # a
+    COLLATING = 'COLLATING'   # [.a.]
+    EQUIVALENCE = 'EQUIV'     # [=a=]
+    CLASS = 'CLASS'           # [:alpha:]
+
+    def __init__(self, type_, value):
+        self.type = type_
+        self.value = value
+
+
+class ExtendedRegexParser(StringStream):
+    '''Parses a POSIX extended regular expression.
+
+    The structure of the parser follows the one of the GNU C library
+    (parse_reg_exp, parse_branch, parse_expression, parse_dup_op, ...),
+    because that is what decides which expressions `grep -E` accepts.
+    '''
+
+    def __init__(self, pattern):
+        super().__init__(pattern)
+        self.token = None
+        self.num_groups = 0
+        self.completed_groups = set()
+        self.undecidable = False
+
+    def parse(self):
+        '''Parse the regular expression.
+
+        Raises:
+            - ValueError: If the regular expression is invalid.
+            - Undecidable: If the validity cannot be determined.
+        '''
+
+        self._fetch_token()
+        self._parse_reg_exp(0)
+
+        # An unmatched `)` on top level is a literal character, so there
+        # is nothing left here.
+        assert self.token.type == END
+
+        if self.undecidable:
+            raise Undecidable()
+
+    # =========================================================================
+    # Tokenizer
+    # =========================================================================
+
+    def _fetch_token(self):
+        self.token = self._read_token()
+        return self.token
+
+    def _read_token(self):
+        # pylint: disable=too-many-return-statements
+
+        if not self.have():
+            return Token(END)
+
+        c = self.get()
+
+        if c == '\\':
+            if not self.have():
+                raise ValueError('Trailing backslash')
+
+            c = self.get()
+
+            if c in '123456789':
+                return Token(BACK_REF, int(c))
+
+            if c in '<>bB`\'':
+                return Token(ANCHOR, c)
+
+            if c in 'wWsS':
+                return Token(CHAR_CLASS, c)
+
+            return Token(CHARACTER, c)
+
+        token_type = {
+            '.': ANY,
+            '^': ANCHOR,
+            '$': ANCHOR,
+            '(': OPEN_GROUP,
+            ')': CLOSE_GROUP,
+            '|': ALTERNATION,
+            '*': DUPLICATION,
+            '+': DUPLICATION,
+            '?': DUPLICATION,
+            '{': OPEN_INTERVAL,
+            '}': CLOSE_INTERVAL,
+            '[': OPEN_BRACKET,
+        }.get(c, CHARACTER)
+
+        return Token(token_type, c)
+
+    # =========================================================================
+    # Parser
+    # =========================================================================
+
+    def _parse_reg_exp(self, nest):
+        self._parse_branch(nest)
+
+        while self.token.type == ALTERNATION:
+            self._fetch_token()
+
+            if (self.token.type not in (ALTERNATION, END) and
+                    (nest == 0 or self.token.type != CLOSE_GROUP)):
+                self._parse_branch(nest)
+
+    def _parse_branch(self, nest):
+        self._parse_expression(nest)
+
+        while (self.token.type not in (ALTERNATION, END) and
+                (nest == 0 or self.token.type != CLOSE_GROUP)):
+            self._parse_expression(nest)
+
+    def _parse_expression(self, nest):
+        # pylint: disable=too-many-branches
+
+        token = self.token
+
+        if token.type in (CHARACTER, ANY, CHAR_CLASS, CLOSE_INTERVAL):
+            self._fetch_token()
+
+        elif token.type == CLOSE_GROUP:
+            # An unmatched `)` is treated as a literal character.
+            self._fetch_token()
+
+        elif token.type == OPEN_GROUP:
+            self._parse_sub_exp(nest)
+
+        elif token.type == OPEN_BRACKET:
+            self._parse_bracket_exp()
+            self._fetch_token()
+
+        elif token.type == BACK_REF:
+            if token.char not in self.completed_groups:
+                raise ValueError('Invalid back reference')
+            self._fetch_token()
+
+        elif token.type in (DUPLICATION, OPEN_INTERVAL):
+            # A repetition operator at the start of an expression is ignored.
+            self._fetch_token()
+            self._parse_expression(nest)
+            return
+
+        elif token.type == ANCHOR:
+            # Anchors cannot be followed by repetition operators, a following
+            # operator starts a new expression.
+            self._fetch_token()
+            return
+
+        elif token.type in (ALTERNATION, END):
+            return
+
+        while self.token.type in (DUPLICATION, OPEN_INTERVAL):
+            if self.token.type == DUPLICATION:
+                self._fetch_token()
+            elif not self._parse_interval():
+                # Not a valid interval, `{` is treated as a literal character.
+                self.token = Token(CHARACTER, '{')
+                break
+
+    def _parse_sub_exp(self, nest):
+        group = self.num_groups + 1
+        self.num_groups += 1
+
+        self._fetch_token()
+
+        if self.token.type != CLOSE_GROUP:
+            self._parse_reg_exp(nest + 1)
+
+            if self.token.type != CLOSE_GROUP:
+                raise ValueError('Unmatched ( or \\(')
+
+        self.completed_groups.add(group)
+        self._fetch_token()
+
+    def _fetch_number(self):
+        '''Read a number of an interval expression.
+
+        Returns:
+            - None if there are no digits
+            - False if the number is invalid
+            - the number otherwise
+        '''
+
+        number = None
+
+        while True:
+            token = self._fetch_token()
+
+            if token.type == END:
+                return False
+
+            if token.type == CLOSE_INTERVAL or token.char == ',':
+                return number
+
+            if (token.type != CHARACTER or not token.char.isdigit() or
+                    not '0' <= token.char <= '9' or number is False):
+                number = False
+            elif number is None:
+                number = int(token.char)
+            else:
+                number = min(RE_DUP_MAX + 1, number * 10 + int(token.char))
+
+    def _parse_interval(self):
+        '''Parse an interval expression ({n}, {n,}, {,m}, {n,m}).
+
+        Returns:
+            - True if the interval is valid
+            - False if it has to be treated as literal characters
+        '''
+
+        position = self.i
+
+        start = self._fetch_number()
+
+        if start is None:
+            if self.token.char == ',':
+                start = 0
+            else:
+                raise ValueError('Invalid content of \\{\\}')
+
+        if start is not False:
+            if self.token.type == CLOSE_INTERVAL:
+                end = start
+            elif self.token.char == ',':
+                end = self._fetch_number()
+            else:
+                end = False
+
+        if start is False or end is False:
+            self.i = position
+            return False
+
+        if (end is not None and start > end) or self.token.type != CLOSE_INTERVAL:
+            raise ValueError('Invalid content of \\{\\}')
+
+        if (start if end is None else end) > RE_DUP_MAX:
+            raise ValueError('Regular expression too big')
+
+        self._fetch_token()
+        return True
+
+    # =========================================================================
+    # Bracket expressions
+    # =========================================================================
+
+    def _peek_bracket_token(self):
+        '''Return the type and length of the next token in a bracket expression.'''
+
+        c = self.peek()
+
+        if c is None:
+            return (END, 0)
+
+        if c == '[':
+            c2 = self.peek(1)
+            if c2 == '.':
+                return (BracketElement.COLLATING, 2)
+            if c2 == '=':
+                return (BracketElement.EQUIVALENCE, 2)
+            if c2 == ':':
+                return (BracketElement.CLASS, 2)
+            return (CHARACTER, 1)
+
+        if c == '-':
+            return ('-', 1)
+
+        if c == ']':
+            return (']', 1)
+
+        if c == '^':
+            return ('^', 1)
+
+        return (CHARACTER, 1)
+
+    def _parse_bracket_symbol(self, type_):
+        delimiter = {
+            BracketElement.COLLATING: '.',
+            BracketElement.EQUIVALENCE: '=',
+            BracketElement.CLASS: ':',
+        }[type_]
+
+        name = ''
+
+        while True:
+            if len(name) >= BRACKET_NAME_MAX or not self.have():
+                raise ValueError('Unmatched [, [^, [:, [., or [=')
+
+            c = self.get()
+
+            if not self.have():
+                raise ValueError('Unmatched [, [^, [:, [., or [=')
+
+            if c == delimiter and self.peek() == ']':
+                self.get()
+                return BracketElement(type_, name)
+
+            name += c
+
+    def _parse_bracket_element(self, token_type, accept_hyphen):
+        if token_type in (BracketElement.COLLATING,
+                          BracketElement.EQUIVALENCE,
+                          BracketElement.CLASS):
+            self.advance(2)
+            return self._parse_bracket_symbol(token_type)
+
+        c = self.get()
+
+        if token_type == '-' and not accept_hyphen:
+            # A `-` must only appear as range operator or right before the
+            # closing bracket.
+            if self._peek_bracket_token()[0] != ']':
+                raise ValueError('Invalid range end')
+
+        return BracketElement(BracketElement.CHAR, c)
+
+    def _check_bracket_element(self, element):
+        if element.type == BracketElement.CLASS:
+            if element.value not in CHARACTER_CLASSES:
+                if not element.value:
+                    raise ValueError('Invalid character class name')
+                # Locales may define additional character classes
+                self.undecidable = True
+
+        elif element.type in (BracketElement.COLLATING,
+                              BracketElement.EQUIVALENCE):
+            if len(element.value) != 1:
+                # Locales may define multi-character collating elements
+                self.undecidable = True
+
+    def _check_range(self, start, end):
+        for element in (start, end):
+            if element.type in (BracketElement.CLASS, BracketElement.EQUIVALENCE):
+                raise ValueError('Invalid range end')
+
+            if element.type == BracketElement.COLLATING and len(element.value) != 1:
+                self.undecidable = True
+                return
+
+        start, end = start.value, end.value
+
+        if not start.isascii() or not end.isascii():
+            # The order of non-ASCII characters depends on the locale
+            self.undecidable = True
+            return
+
+        if start > end:
+            raise ValueError('Invalid range end')
+
+    def _parse_bracket_exp(self):
+        # pylint: disable=too-many-branches
+
+        begin = self.i
+        first_round = True
+        has_range = False
+
+        token_type, _ = self._peek_bracket_token()
+        if token_type == '^':
+            self.advance(1)
+            begin = self.i
+            token_type, _ = self._peek_bracket_token()
+
+        # We treat the first `]` as a normal character
+        if token_type == ']':
+            token_type = CHARACTER
+
+        while True:
+            if token_type == END:
+                raise ValueError('Unmatched [, [^, [:, [., or [=')
+
+            start = self._parse_bracket_element(token_type, first_round)
+            first_round = False
+            is_range = False
+
+            token_type, length = self._peek_bracket_token()
+
+            if start.type not in (BracketElement.CLASS, BracketElement.EQUIVALENCE):
+                if token_type == END:
+                    raise ValueError('Unmatched [, [^, [:, [., or [=')
+
+                if token_type == '-':
+                    self.advance(length)
+                    token_type2, _ = self._peek_bracket_token()
+
+                    if token_type2 == END:
+                        raise ValueError('Unmatched [, [^, [:, [., or [=')
+
+                    if token_type2 == ']':
+                        # We treat the last `-` as a normal character
+                        self.advance(-length)
+                        token_type = CHARACTER
+                    else:
+                        is_range = True
+
+            if is_range:
+                end = self._parse_bracket_element(token_type2, True)
+                self._check_range(start, end)
+                has_range = True
+                token_type, _ = self._peek_bracket_token()
+            else:
+                self._check_bracket_element(start)
+
+            if token_type == END:
+                raise ValueError('Unmatched [, [^, [:, [., or [=')
+
+            if token_type == ']':
+                if not has_range:
+                    self._check_confusing_brackets(self.s[begin:self.i])
+                self.advance(1)
+                return
+
+    def _check_confusing_brackets(self, content):
+        '''GNU grep rejects `[:space:]` written without the outer brackets.'''
+
+        if (len(content) > 2 and content[0] == ':' and content[-1] == ':' and
+                content.strip(':')):
+            if '[' in content:
+                self.undecidable = True
+            else:
+                raise ValueError('character class syntax is [[:space:]], not [:space:]')
+
+
+def _is_fixed_strings(pattern):
+    '''Check if GNU grep matches `pattern` as fixed strings.
+
+    If there are multiple patterns, GNU grep converts them to fixed strings
+    if none of them uses special characters (see `try_fgrep_pattern()` in
+    grep.c). In this case they are not compiled as regular expressions, and
+    a backslash at the very end of the last pattern is a literal character.
+    '''
+
+    i = 0
+    while i < len(pattern):
+        c = pattern[i]
+
+        if c in '$*.[^(+?{|':
+            return False
+
+        if c == '\\' and i + 1 < len(pattern):
+            if pattern[i + 1] in '\nBSW\'<bsw`>123456789':
+                return False
+            i += 1
+
+        i += 1
+
+    return True
+
+
+def check_extended_regex(pattern):
+    '''Check if `pattern` is a valid POSIX extended regular expression.
+
+    Just like `grep -E`, a newline separates multiple patterns.
+
+    Returns:
+        - True if the pattern is valid
+        - False if the pattern is invalid
+        - None if the validity cannot be determined without consulting
+          the system's regex implementation
+    '''
+
+    # GNU grep removes duplicate patterns first
+    sub_patterns = list(dict.fromkeys(pattern.split('\n')))
+
+    if len(sub_patterns) > 1 and _is_fixed_strings('\n'.join(sub_patterns)):
+        return True
+
+    undecidable = False
+
+    for sub_pattern in sub_patterns:
+        try:
+            ExtendedRegexParser(sub_pattern).parse()
+        except ValueError:
+            return False
+        except Undecidable:
+            undecidable = True
+
+    return None if undecidable else True
+
+
+def test():
+    '''Tests.'''
+
+    tests = [
+        # Valid
+        ('',                        True),
+        ('a',                       True),
+        ('^[a-z]+[0-9]*$',          True),
+        ('foo|bar',                 True),
+        ('(foo|bar)+',              True),
+        (')',                       True),
+        ('a)',                      True),
+        ('()',                      True),
+        ('(a|)',                    True),
+        ('(|a)',                    True),
+        ('||',                      True),
+        ('*',                       True),
+        ('a**',                     True),
+        ('+a',                      True),
+        ('^*',                      True),
+        ('(*a)',                    True),
+        ('(*|a)',                   True),
+        ('a|*',                     True),
+        ('{',                       True),
+        ('a{',                      True),
+        ('a{1',                     True),
+        ('a{1}',                    True),
+        ('a{,2}',                   True),
+        ('a{1,}',                   True),
+        ('a{,}',                    True),
+        ('a{x}',                    True),
+        ('a{1,x}',                  True),
+        ('a{ 1}',                   True),
+        ('a{1\\,2}',                True),
+        ('{1}',                     True),
+        ('({1})',                   True),
+        ('a{1}{2}',                 True),
+        ('a{32767}',                True),
+        ('(a){2}\\1',               True),
+        ('(a)(b)\\2\\1',            True),
+        ('((a)\\2)',                True),
+        ('\\0',                     True),
+        ('\\w\\W\\s\\S\\<\\>\\b\\B',  True),
+        ('\\(\\)\\{\\.\\q',         True),
+        ('[]a]',                    True),
+        ('[^]a]',                   True),
+        ('[]]',                     True),
+        ('[^]]',                    True),
+        ('[a-]',                    True),
+        ('[a-z-]',                  True),
+        ('[]-a]',                   True),
+        ('[^-a]',                   True),
+        ('[--a]',                   True),
+        ('[%--]',                   True),
+        ('[---]',                   True),
+        ('[----]',                  True),
+        ('[\\]',                    True),
+        ('[[:alpha:][:digit:]]',    True),
+        ('[[:alpha:]-]',            True),
+        ('[[.a.]]',                 True),
+        ('[[=a=]b]',                True),
+        ('[[.-.]-z]',               True),
+        ('[a-[.z.]]',               True),
+        ('[:]',                     True),
+        ('[::]',                    True),
+        ('[:a-b:]',                 True),
+        ('a\nb',                    True),
+        ('\n\\',                   True),
+        ('a\n\\',                  True),
+        ('a\nb\\',                 True),
+        ('a\n\\.b)\\',             True),
+        ('\n\\\n',                 True),
+
+        # Invalid
+        ('(',                       False),
+        ('(a',                      False),
+        ('((a)',                    False),
+        ('(+)',                     False),
+        ('(*)',                     False),
+        ('(?)',                     False),
+        ('({)',                     False),
+        ('(|+)',                    False),
+        ('(a|*)',                   False),
+        ('(^+)',                    False),
+        ('a{}',                     False),
+        ('a{2,1}',                  False),
+        ('a{1,2,3}',                False),
+        ('a{1}{}',                  False),
+        ('a{32768}',                False),
+        ('a{32768,}',               False),
+        ('\\',                      False),
+        ('a\\',                     False),
+        ('\\1',                     False),
+        ('(a)\\2',                  False),
+        ('(a\\1)',                  False),
+        ('[',                       False),
+        ('[]',                      False),
+        ('[^]',                     False),
+        ('[a',                      False),
+        ('[\\',                     False),
+        ('[z-a]',                   False),
+        ('[a-z-9]',                 False),
+        ('[a--]',                   False),
+        ('[a-Z]',                   False),
+        ('[a-[:alpha:]]',           False),
+        ('[[:alpha:]-z]',           False),
+        ('[a-[=b=]]',               False),
+        ('[[:alpha:]',              False),
+        ('[[:alpha]]',              False),
+        ('[[:',                     False),
+        ('[[.a]',                   False),
+        ('[[::]]',                  False),
+        ('[:alpha:]',               False),
+        ('[^:a:]',                  False),
+        ('a\n(',                    False),
+        ('\\\n',                   False),
+        ('\\\na',                  False),
+        ('a\n\\\nb',               False),
+        ('a\n(\\',                 False),
+        ('a\nx{\\',                False),
+        ('a\nb\\w\\',              False),
+
+        # Depends on the locale
+        ('[[:foo:]]',               None),
+        ('[[.space.]]',             None),
+        ('[[=aa=]]',                None),
+        ('[ä-ü]',                   None),
+    ]
+
+    for pattern, expected in tests:
+        result = check_extended_regex(pattern)
+        if result != expected:
+            print('Pattern:  %r' % pattern)
+            print('Having:   %r' % result)
+            print('Expected: %r' % expected)
+            raise AssertionError('Test failed')
+
+
+if __name__ == '__main__':
+    test()
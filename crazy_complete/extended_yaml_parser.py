@@ -9,6 +9,7 @@ from yaml.events import (StreamStartEvent,
                          MappingStartEvent, MappingEndEvent,
                          SequenceStartEvent, SequenceEndEvent,
                          ScalarEvent, AliasEvent)
+from yaml.nodes import ScalarNode, SequenceNode, MappingNode
 
 from .value_with_trace import ValueWithTrace
 from .errors import CrazySchemaValidationError
@@ -16,42 +17,86 @@ from .errors import CrazySchemaValidationError
 
 _error = CrazySchemaValidationError
 
+# True if PyYAML was built with libyaml
+HAVE_LIBYAML = getattr(yaml, '__with_libyaml__', False)
+
+_STR_TAG = 'tag:yaml.org,2002:str'
+
 
 class ExtendedYAMLParser:
     '''Parse YAML with the ability to trace the origin of parsed values.'''
 
-    def __init__(self):
+    def __init__(self, use_libyaml=True):
+        '''Initializes the parser.
+
+        Args:
+            use_libyaml (bool):
+                Use the libyaml based parser if it is available. Otherwise
+                the pure Python parser is used.
+        '''
+
         self.src = None
         self.data = []
         self.current_stack = []
         self.current_key = None
+        self.use_libyaml = use_libyaml and HAVE_LIBYAML
+        self.resolver = yaml.resolver.Resolver()
+        self.constructor = yaml.constructor.SafeConstructor()
 
-    def parse(self, stream):
+        # Mapping of define names to their values (see `parse_documents()`)
+        self.defines = None
+
+    def parse(self, stream, source=None):
         """
         Parses the given YAML stream in a SAX-like way and reconstructs the
         structure.
 
+        The parsed values refer to `source` (e.g. the file name). If it is
+        None, they refer to `stream`.
+
         Raises:
             - yaml.parser.ParserError
             - errors.CrazySchemaValidationError
         """
-        self.src = stream
+        documents = self.parse_documents(stream, source)
+        return [document for document in documents if document is not None]
+
+    def parse_documents(self, stream, source=None):
+        """
+        Like `parse()`, but yields each document as soon as it is complete.
+
+        Only the document being parsed is held by the parser, so the
+        caller can release a document before the next one is parsed.
+
+        For empty documents None is yielded.
+
+        If the caller sets `defines` to a dictionary mapping names to parsed
+        values, each string value of the following documents that is a name
+        of a define is replaced by the value of the define. The value is not
+        copied, all uses of a define share the same object.
+        """
+        self.src = stream if source is None else source
         self.data = []
         self.current_stack = []
         self.current_key = None
+        self.defines = None
+
+        if self.use_libyaml:
+            loader = yaml.CLoader(stream)
+        else:
+            loader = yaml.Loader(stream)
 
-        loader = yaml.Loader(stream)
         try:
             while True:
                 event = loader.get_event()
                 if event is None:
                     break
                 self.handle_event(event)
+                if isinstance(event, DocumentEndEvent):
+                    yield self.data.pop() if self.data else None
         finally:
             loader.dispose()
 
-        return self.data
-
     def handle_event(self, event):
         """
         Handle each YAML parsing event and construct the corresponding data
@@ -65,26 +110,28 @@ class ExtendedYAMLParser:
             if self.current_stack:
                 self.data.append(self.current_stack.pop())
         elif isinstance(event, MappingStartEvent):
+            self.check_collection_tag(event, MappingNode)
             new_map = ValueWithTrace.from_yaml_event({}, self.src, event)
             self.add_to_current_structure(self.current_key, new_map)
             self.current_stack.append(new_map)
             self.current_key = None
         elif isinstance(event, SequenceStartEvent):
+            self.check_collection_tag(event, SequenceNode)
             new_seq = ValueWithTrace.from_yaml_event([], self.src, event)
             self.add_to_current_structure(self.current_key, new_seq)
             self.current_stack.append(new_seq)
             self.current_key = None
         elif isinstance(event, ScalarEvent):
-            value = self.convert_scalar(event.value, event.implicit)
+            value = self.convert_scalar(event)
             value = ValueWithTrace.from_yaml_event(value, self.src, event)
 
             if self.current_stack and isinstance(self.current_stack[-1].value, list):
-                self.add_to_current_structure(None, value)
+                self.add_to_current_structure(None, self.resolve_define(value))
             else:
                 if self.current_key is None:
                     self.current_key = value
                 else:
-                    self.add_to_current_structure(self.current_key, value)
+                    self.add_to_current_structure(self.current_key, self.resolve_define(value))
                     self.current_key = None
         elif isinstance(event, (MappingEndEvent, SequenceEndEvent)):
             self.current_stack.pop()
@@ -92,6 +139,14 @@ class ExtendedYAMLParser:
             value = ValueWithTrace.from_yaml_event(None, self.src, event)
             raise _error('Anchors not supported', value)
 
+    def resolve_define(self, value):
+        """
+        Return the value of the define named by `value`, or `value` itself.
+        """
+        if self.defines and isinstance(value.value, str):
+            return self.defines.get(value.value, value)
+        return value
+
     def add_to_current_structure(self, key, value):
         """
         Add a value to the current structure (either dict or list).
@@ -111,30 +166,42 @@ class ExtendedYAMLParser:
         else:
             raise _error("Invalid structure in YAML", value)
 
-    def convert_scalar(self, value, implicit):
+    def convert_scalar(self, event):
         """
-        Converts a scalar based on its type hints (implicit tuple).
+        Converts a scalar the same way `yaml.safe_load()` does.
+
+        The tag is resolved by the implicit resolvers of PyYAML (YAML 1.1)
+        and the value is constructed by `yaml.SafeConstructor`, so tags
+        that are not supported by the safe loader are rejected.
+
+        Raises:
+            - yaml.constructor.ConstructorError
         """
-        if implicit[0]:
-            lower = value.lower()
+        tag = event.tag
+        if tag is None or tag == '!':
+            tag = self.resolver.resolve(ScalarNode, event.value, event.implicit)
 
-            if lower in ("null", "~", ""):
-                return None
+        if tag == _STR_TAG:
+            return event.value
 
-            if lower in ("true", "on", "yes"):
-                return True
+        node = ScalarNode(tag, event.value, event.start_mark, event.end_mark, event.style)
 
-            if lower in ("false", "off", "no"):
-                return False
+        try:
+            return self.constructor.construct_object(node, deep=True)
+        finally:
+            self.constructor.constructed_objects.clear()
 
-            try:
-                return int(value)
-            except ValueError:
-                pass
+    def check_collection_tag(self, event, node_class):
+        """
+        Rejects tags on mappings and sequences that are not supported by
+        `yaml.safe_load()`.
 
-            try:
-                return float(value)
-            except ValueError:
-                pass
+        Raises:
+            - yaml.constructor.ConstructorError
+        """
+        if event.tag is None or event.tag == '!':
+            return
 
-        return value
+        if event.tag not in self.constructor.yaml_constructors:
+            node = node_class(event.tag, [], event.start_mark, event.end_mark)
+            self.constructor.construct_undefined(node)
@@ -10,6 +10,7 @@ from . import fish_prepare
 from . import fish_complete
 from . import fish_helpers
 from . import generation
+from . import profiler
 from .output import Output
 from .fish_utils import FishCompleteCommand, VariableManager
 from .fish_conditions import (
@@ -120,7 +121,7 @@ class FishCompletionGenerator:
         self.conditions = VariableManager('C')
         self.complete_definitions = []
 
-        for option in self.commandline.get_options():
+        for option in self.commandline.get_option_index().get_options():
             self.complete_definitions.append(
                 self._complete_option(option))
 
@@ -132,7 +133,8 @@ class FishCompletionGenerator:
             self.complete_definitions.append(self._complete_subcommands())
 
             for sub in self.subcommands.subcommands:
-                self.children.append(FishCompletionGenerator(ctxt, sub, self))
+                with profiler.phase('FishCompletionGenerator', sub.get_command_path()):
+                    self.children.append(FishCompletionGenerator(ctxt, sub, self))
 
         for definition in self.complete_definitions:
             if isinstance(definition.completion_obj, fish_complete.FishCompleteCommandArg):
@@ -284,7 +286,10 @@ def generate_completion(commandline, config=None):
     commandline = generation.enhance_commandline(commandline, config)
     helpers = fish_helpers.FishHelpers(config, commandline.prog)
     ctxt = generation.GenerationContext(config, helpers)
-    result = FishCompletionGenerator(ctxt, commandline)
+
+    with profiler.phase('FishCompletionGenerator', commandline.get_command_path()):
+        result = FishCompletionGenerator(ctxt, commandline)
+
     prepare = fish_prepare.get_prepare_function(commandline, ctxt)
 
     if helpers.is_used('query_init'):
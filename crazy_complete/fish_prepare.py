@@ -61,7 +61,7 @@ def _get_capture_code(commandline, ctxt):
     r = []
 
     for cmdline in commandline.get_all_commandlines():
-        for option in cmdline.get_options():
+        for option in cmdline.get_option_index().get_options():
             if option.capture is not None:
                 capture_func = ctxt.helpers.use_function('capture_option')
                 opts = ' '.join(option.option_strings)
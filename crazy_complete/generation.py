@@ -5,9 +5,9 @@
 
 from .errors import CrazyError
 from . import completion_validator
-from . import cli
-from . import config as _config
+from . import cli_view
 from . import when
+from . import profiler
 
 
 class GenerationContext:
@@ -41,61 +41,6 @@ class OptionGenerationContext(GenerationContext):
         self.option = option
 
 
-def _apply_config(commandline, config):
-    '''Applies configuration settings to a command line object.
-
-    If a setting in the CommandLine or Option object is set to cli.INHERIT,
-    it will be overridden by the corresponding setting from the config object.
-
-    Args:
-        commandline (CommandLine):
-            The command line object to apply the configuration to.
-
-        config (Config):
-            The configuration object containing the settings to apply.
-
-    Returns:
-        None
-    '''
-    assert isinstance(commandline, cli.CommandLine)
-    assert isinstance(config, _config.Config)
-
-    if commandline.abbreviate_commands == cli.INHERIT:
-        commandline.abbreviate_commands = config.abbreviate_commands
-
-    if commandline.abbreviate_options == cli.INHERIT:
-        commandline.abbreviate_options = config.abbreviate_options
-
-    if commandline.inherit_options == cli.INHERIT:
-        commandline.inherit_options = config.inherit_options
-
-    for option in commandline.options:
-        if option.repeatable == cli.INHERIT:
-            option.repeatable = config.repeatable_options
-
-        if option.long_opt_arg_sep == cli.INHERIT:
-            option.long_opt_arg_sep = config.long_opt_arg_sep
-
-        if config.disabled_hidden:
-            option.hidden = False
-
-        if config.disabled_final:
-            option.final = False
-
-        if config.disabled_groups:
-            option.groups = []
-
-        if config.disabled_repeatable:
-            option.repeatable = True
-
-        if config.disabled_when:
-            option.when = None
-
-    for positional in commandline.positionals:
-        if config.disabled_when:
-            positional.when = None
-
-
 def _add_parsed_when(commandline):
     for option in commandline.options:
         if option.when:
@@ -126,15 +71,16 @@ def _add_parsed_when(commandline):
 def enhance_commandline(commandline, config):
     '''Enhance commandline.
 
-    - Make a copy of commandline
-    - Apply configuration to it
+    - Make a view of commandline with the configuration applied
     - Add `when_parsed` attribute
+
+    The original commandline is not modified.
     '''
 
-    commandline = commandline.copy()
-    commandline.visit_commandlines(lambda c: _apply_config(c, config))
-    commandline.visit_commandlines(_add_parsed_when)
-    completion_validator.validate_commandlines(commandline)
+    with profiler.phase('enhance_commandline'):
+        commandline = cli_view.CommandLineView(commandline, config)
+        commandline.visit_commandlines(_add_parsed_when)
+        completion_validator.validate_commandlines(commandline)
     return commandline
 
 
@@ -144,7 +90,8 @@ def visit_commandlines(completion_class, ctxt, commandline):
     result = []
 
     def _call_generator(commandline):
-        result.append(completion_class(ctxt, commandline))
+        with profiler.phase(completion_class.__name__, commandline.get_command_path()):
+            result.append(completion_class(ctxt, commandline))
 
     commandline.visit_commandlines(_call_generator)
 
@@ -4,6 +4,7 @@
 '''Classes for including functions in the generation process.'''
 
 import re
+import functools
 
 from . import cli
 from . import shell
@@ -14,11 +15,86 @@ from .str_utils import (indent, strip_comments, strip_double_empty_lines)
 # pylint: disable=too-few-public-methods
 
 
-def replace_function_name(search, replace, s):
-    '''Safely replace a function name in code'''
+@functools.lru_cache(maxsize=None)
+def _get_function_names_pattern(names):
+    # Longer names first, so that no name matches the start of another one
+    names = sorted(names, key=len, reverse=True)
+    return re.compile('\\b(?:%s)\\b' % '|'.join(map(re.escape, names)))
 
-    pattern = f'\\b{search}\\b'
-    return re.sub(pattern, replace, s)
+
+def replace_function_names(replacements, s):
+    '''Safely replace multiple function names in code.
+
+    Args:
+        replacements (dict):
+            Mapping of function names to their replacements.
+
+        s (str):
+            The code.
+
+    Returns:
+        str: The code with all function names replaced in a single pass.
+    '''
+
+    if not replacements:
+        return s
+
+    pattern = _get_function_names_pattern(tuple(replacements))
+    return pattern.sub(lambda m: replacements[m[0]], s)
+
+
+@functools.lru_cache(maxsize=1024)
+def _render_function(function_class, funcname, code, dependencies,
+                     defines, prefix, keep_comments):
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+
+    function = function_class(funcname, code, list(dependencies))
+    realname = '%s__%s' % (prefix, funcname)
+    code = function.get_code(realname, defines)
+
+    replacements = {dep: '%s__%s' % (prefix, dep) for dep in dependencies}
+    code = replace_function_names(replacements, code)
+    code = code.replace('%PREFIX%', prefix)
+
+    if not keep_comments:
+        code = strip_comments(code)
+
+    return strip_double_empty_lines(code)
+
+
+def render_function(function, defines, prefix, keep_comments):
+    '''Return the final code of a builtin function.
+
+    The result is memoized by the contents of the function, the defines,
+    the function prefix and `keep_comments`. This makes the rendering of
+    the same helpers a lookup when generating multiple shells, files or
+    the same file again (`--watch`).
+
+    Args:
+        function (FunctionBase):
+            The function.
+
+        defines (frozenset):
+            The macros defined for the preprocessor.
+
+        prefix (str):
+            The function prefix.
+
+        keep_comments (bool):
+            If False, strip comments from the code.
+
+    Returns:
+        str: The code of the function.
+    '''
+
+    return _render_function(
+        type(function),
+        function.funcname,
+        function.code,
+        tuple(function.dependencies),
+        frozenset(defines),
+        prefix,
+        keep_comments)
 
 
 class FunctionBase:
@@ -192,22 +268,11 @@ class GeneralHelpers:
         r = []
 
         for funcname, defines in self.used_functions.items():
-            function = self.functions[funcname]
-            realname = self.get_real_function_name(funcname)
-            code = function.get_code(realname, self.global_defines | defines)
-
-            for dep_func in function.dependencies:
-                real_func = self.get_real_function_name(dep_func)
-                code = replace_function_name(dep_func, real_func, code)
-
-            code = code.replace('%PREFIX%', self.function_prefix)
-
-            if not self.config.keep_comments:
-                code = strip_comments(code)
-
-            code = strip_double_empty_lines(code)
-
-            r.append(code)
+            r.append(render_function(
+                self.functions[funcname],
+                self.global_defines | defines,
+                self.function_prefix,
+                self.config.keep_comments))
 
         r.extend(self.get_all_dynamic_functions())
 
@@ -1,2363 +1,74 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 # Copyright (C) 2025-2026 Benjamin Abendroth <braph93@gmx.de>
 
-'''Built-int Manual.'''
+'''Built-int Manual.
+
+The manual data is generated by `docs/mkdoc.py` and stored in the file
+`manual.data` next to this module.
+
+The file starts with a line containing the index of all topics as JSON,
+mapping each topic to the offset and length of its entry. The offsets are
+relative to the end of the index line. Each entry is a zlib-compressed
+JSON object. This way only the index and the requested entry have to be
+read and decompressed.
+'''
+
+import re
+import json
+import zlib
+import importlib.resources
 
 from .errors import CrazyError
 from .str_utils import indent, join_with_wrap
 
 
-# flake8: noqa: E501
-# pylint: disable=line-too-long
-# pylint: disable=too-many-lines
-
-
-COMMANDS = [{'also': {'alsa_device': 'For completing an ALSA device'},
-  'category': 'bonus',
-  'command': 'alsa_card',
-  'definition': 'prog: "example"\n'
-                'options:\n'
-                '  - option_strings: ["--alsa-card"]\n'
-                '    complete: ["alsa_card"]\n',
-  'definition_colored': '\x1b[94mprog\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mexample\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[94moptions\x1b[39;49;00m:\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m  \x1b[39;49;00m-\x1b[37m '
-                        '\x1b[39;49;00m\x1b[94moption_strings\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33m--alsa-card\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m    '
-                        '\x1b[39;49;00m\x1b[94mcomplete\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33malsa_card\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n',
-  'implemented': None,
-  'long': None,
-  'long_colored': None,
-  'notes': [],
-  'output': '~ > example --alsa-card=<TAB>\n0  1\n',
-  'short': 'Complete an ALSA card'},
- {'also': {'alsa_card': 'For completing an ALSA card'},
-  'category': 'bonus',
-  'command': 'alsa_device',
-  'definition': 'prog: "example"\n'
-                'options:\n'
-                '  - option_strings: ["--alsa-device"]\n'
-                '    complete: ["alsa_device"]\n',
-  'definition_colored': '\x1b[94mprog\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mexample\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[94moptions\x1b[39;49;00m:\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m  \x1b[39;49;00m-\x1b[37m '
-                        '\x1b[39;49;00m\x1b[94moption_strings\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33m--alsa-device\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m    '
-                        '\x1b[39;49;00m\x1b[94mcomplete\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33malsa_device\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n',
-  'implemented': None,
-  'long': None,
-  'long_colored': None,
-  'notes': [],
-  'output': '~ > example --alsa-device=<TAB>\nhw:0  hw:1\n',
-  'short': 'Complete an ALSA device'},
- {'also': None,
-  'category': 'bonus',
-  'command': 'charset',
-  'definition': 'prog: "example"\n'
-                'options:\n'
-                '  - option_strings: ["--charset"]\n'
-                '    complete: ["charset"]\n',
-  'definition_colored': '\x1b[94mprog\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mexample\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[94moptions\x1b[39;49;00m:\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m  \x1b[39;49;00m-\x1b[37m '
-                        '\x1b[39;49;00m\x1b[94moption_strings\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33m--charset\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m    '
-                        '\x1b[39;49;00m\x1b[94mcomplete\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33mcharset\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n',
-  'implemented': None,
-  'long': None,
-  'long_colored': None,
-  'notes': [],
-  'output': '~ > example --charset=A<TAB>\n'
-            'ANSI_X3.110-1983  ANSI_X3.4-1968    ARMSCII-8         ASMO_449\n',
-  'short': 'Complete a charset'},
- {'also': None,
-  'category': 'basic',
-  'command': 'choices',
-  'definition': 'prog: "example"\n'
-                'options:\n'
-                '  - option_strings: ["--choices-1"]\n'
-                '    complete: ["choices", ["Item 1", "Item 2"]]\n'
-                '\n'
-                '  - option_strings: ["--choices-2"]\n'
-                '    complete: ["choices", {"Item 1": "Description 1", "Item '
-                '2": "Description 2"}]\n'
-                '\n'
-                '  - option_strings: ["--choices-keep-order"]\n'
-                '    complete: ["choices", ["zebra", "cat", "monkey"]]\n'
-                '    nosort: true\n',
-  'definition_colored': '\x1b[94mprog\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mexample\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[94moptions\x1b[39;49;00m:\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m  \x1b[39;49;00m-\x1b[37m '
-                        '\x1b[39;49;00m\x1b[94moption_strings\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33m--choices-1\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m    '
-                        '\x1b[39;49;00m\x1b[94mcomplete\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33mchoices\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m,\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33mItem\x1b[39;49;00m\x1b[31m '
-                        '\x1b[39;49;00m\x1b[33m1\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m,\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mItem\x1b[39;49;00m\x1b[31m '
-                        '\x1b[39;49;00m\x1b[33m2\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m  \x1b[39;49;00m-\x1b[37m '
-                        '\x1b[39;49;00m\x1b[94moption_strings\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33m--choices-2\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m    '
-                        '\x1b[39;49;00m\x1b[94mcomplete\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33mchoices\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m,\x1b[37m '
-                        '\x1b[39;49;00m{\x1b[33m"\x1b[39;49;00m\x1b[33mItem\x1b[39;49;00m\x1b[31m '
-                        '\x1b[39;49;00m\x1b[33m1\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mDescription\x1b[39;49;00m\x1b[31m '
-                        '\x1b[39;49;00m\x1b[33m1\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m,\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mItem\x1b[39;49;00m\x1b[31m '
-                        '\x1b[39;49;00m\x1b[33m2\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mDescription\x1b[39;49;00m\x1b[31m '
-                        '\x1b[39;49;00m\x1b[33m2\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m}]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m  \x1b[39;49;00m-\x1b[37m '
-                        '\x1b[39;49;00m\x1b[94moption_strings\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33m--choices-keep-order\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m    '
-                        '\x1b[39;49;00m\x1b[94mcomplete\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33mchoices\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m,\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33mzebra\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m,\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mcat\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m,\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mmonkey\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m    '
-                        '\x1b[39;49;00m\x1b[94mnosort\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00mtrue\x1b[37m\x1b[39;49;00m\n',
-  'implemented': None,
-  'long': 'Items can be a list or a dictionary.\n'
-          ' \n'
-          'If a dictionary is supplied, the keys are used as items and the '
-          'values are used\n'
-          'as description.\n',
-  'long_colored': 'Items can be a list or a dictionary.\x1b[37m\x1b[39;49;00m\n'
-                  ' \x1b[37m\x1b[39;49;00m\n'
-                  'If a dictionary is supplied, the keys are used as items and '
-                  'the values are used\x1b[37m\x1b[39;49;00m\n'
-                  'as description.\x1b[37m\x1b[39;49;00m\n',
-  'notes': ['If the completion suggestions should appear in their original '
-            'order, set `nosort` to `true`'],
-  'output': '~ > example --choices-2=<TAB>\n'
-            'Item 1  (Description 1)  Item 2  (Description 2)\n',
-  'short': 'Complete from a set of words'},
- {'also': None,
-  'category': 'meta',
-  'command': 'combine',
-  'definition': 'prog: "example"\n'
-                'options:\n'
-                '  - option_strings: ["--combine"]\n'
-                '    complete: ["combine", [["user"], ["pid"]]]\n',
-  'definition_colored': '\x1b[94mprog\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mexample\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[94moptions\x1b[39;49;00m:\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m  \x1b[39;49;00m-\x1b[37m '
-                        '\x1b[39;49;00m\x1b[94moption_strings\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33m--combine\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m    '
-                        '\x1b[39;49;00m\x1b[94mcomplete\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33mcombine\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m,\x1b[37m '
-                        '\x1b[39;49;00m[[\x1b[33m"\x1b[39;49;00m\x1b[33muser\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m],\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33mpid\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]]]\x1b[37m\x1b[39;49;00m\n',
-  'implemented': None,
-  'long': 'With `combine` multiple completers can be combined into one.\n'
-          '\n'
-          'It takes a list of completers as its argument.\n',
-  'long_colored': 'With \x1b[33m`combine`\x1b[39;49;00m multiple completers '
-                  'can be combined into one.\x1b[37m\x1b[39;49;00m\n'
-                  '\x1b[37m\x1b[39;49;00m\n'
-                  'It takes a list of completers as its '
-                  'argument.\x1b[37m\x1b[39;49;00m\n',
-  'notes': [],
-  'output': '~ > example --user-list=avahi,daemon,<TAB>\n'
-            '1439404  3488332  3571716           3607235                 '
-            '4134206\n'
-            'alpm     avahi    bin               braph                   '
-            'daemon\n'
-            'root     rtkit    systemd-coredump  systemd-journal-remote  '
-            'systemd-network\n'
-            '[...]\n',
-  'short': 'Combine multiple completers'},
- {'also': {'command_arg': 'For completing arguments of a command',
-           'commandline_string': 'For completing a command line as a string'},
-  'category': 'basic',
-  'command': 'command',
-  'definition': 'prog: "example"\n'
-                'options:\n'
-                '  - option_strings: ["--command"]\n'
-                '    complete: ["command"]\n'
-                '  - option_strings: ["--command-sbin"]\n'
-                '    complete: ["command", {"path_append": '
-                '"/sbin:/usr/sbin"}]\n',
-  'definition_colored': '\x1b[94mprog\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mexample\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[94moptions\x1b[39;49;00m:\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m  \x1b[39;49;00m-\x1b[37m '
-                        '\x1b[39;49;00m\x1b[94moption_strings\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33m--command\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m    '
-                        '\x1b[39;49;00m\x1b[94mcomplete\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33mcommand\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m  \x1b[39;49;00m-\x1b[37m '
-                        '\x1b[39;49;00m\x1b[94moption_strings\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33m--command-sbin\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m    '
-                        '\x1b[39;49;00m\x1b[94mcomplete\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33mcommand\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m,\x1b[37m '
-                        '\x1b[39;49;00m{\x1b[33m"\x1b[39;49;00m\x1b[33mpath_append\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33m/sbin:/usr/sbin\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m}]\x1b[37m\x1b[39;49;00m\n',
-  'implemented': None,
-  'long': 'This completer provides completion suggestions for executable '
-          "commands available in the system's `$PATH`.\n"
-          ' \n'
-          '`$PATH` can be modified using these options:\n'
-          ' \n'
-          '`{"path": "<directory>:..."}`: Overrides the default `$PATH` '
-          'entirely.\n'
-          ' \n'
-          '`{"path_append": "<directory>:..."}`: Appends to the default '
-          '`$PATH`.\n'
-          ' \n'
-          '`{"path_prepend": "<directory>:..."}`: Prepends to the default '
-          '`$PATH`.\n',
-  'long_colored': 'This completer provides completion suggestions for '
-                  "executable commands available in the system's "
-                  '\x1b[33m`$PATH`\x1b[39;49;00m.\x1b[37m\x1b[39;49;00m\n'
-                  ' \n'
-                  '\x1b[33m`$PATH`\x1b[39;49;00m can be modified using these '
-                  'options:\x1b[37m\x1b[39;49;00m\n'
-                  ' \n'
-                  '\x1b[33m`{"path": "<directory>:..."}`\x1b[39;49;00m: '
-                  'Overrides the default \x1b[33m`$PATH`\x1b[39;49;00m '
-                  'entirely.\x1b[37m\x1b[39;49;00m\n'
-                  ' \n'
-                  '\x1b[33m`{"path_append": "<directory>:..."}`\x1b[39;49;00m: '
-                  'Appends to the default '
-                  '\x1b[33m`$PATH`\x1b[39;49;00m.\x1b[37m\x1b[39;49;00m\n'
-                  ' \n'
-                  '\x1b[33m`{"path_prepend": '
-                  '"<directory>:..."}`\x1b[39;49;00m: Prepends to the default '
-                  '\x1b[33m`$PATH`\x1b[39;49;00m.\x1b[37m\x1b[39;49;00m\n',
-  'notes': ['`path_append` and `path_prepend` can be used together, but both '
-            'are mutually exclusive with `path`.'],
-  'output': '~ > example --command=bas<TAB>\n'
-            'base32    base64    basename  basenc    bash      bashbug\n',
-  'short': 'Complete a command'},
- {'also': {'command': 'For completing a command',
-           'commandline_string': 'For completing a command line as a string'},
-  'category': 'basic',
-  'command': 'command_arg',
-  'definition': 'prog: "example"\n'
-                'positionals:\n'
-                '  - number: 1\n'
-                '    complete: ["command"]\n'
-                '\n'
-                '  - number: 2\n'
-                '    complete: ["command_arg"]\n'
-                '    repeatable: true\n',
-  'definition_colored': '\x1b[94mprog\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mexample\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[94mpositionals\x1b[39;49;00m:\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m  \x1b[39;49;00m-\x1b[37m '
-                        '\x1b[39;49;00m\x1b[94mnumber\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m1\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m    '
-                        '\x1b[39;49;00m\x1b[94mcomplete\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33mcommand\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m  \x1b[39;49;00m-\x1b[37m '
-                        '\x1b[39;49;00m\x1b[94mnumber\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m2\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m    '
-                        '\x1b[39;49;00m\x1b[94mcomplete\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33mcommand_arg\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m    '
-                        '\x1b[39;49;00m\x1b[94mrepeatable\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00mtrue\x1b[37m\x1b[39;49;00m\n',
-  'implemented': None,
-  'long': None,
-  'long_colored': None,
-  'notes': ['This completer can only be used in combination with a previously '
-            'defined `command` completer.',
-            'This completer requires `repeatable: true`.'],
-  'output': '~ > example sudo bas<TAB>\n'
-            'base32    base64    basename  basenc    bash      bashbug\n',
-  'short': 'Complete arguments of a command'},
- {'also': None,
-  'category': 'basic',
-  'command': 'commandline_string',
-  'definition': 'prog: "example"\n'
-                'options:\n'
-                '  - option_strings: ["--commandline"]\n'
-                '    complete: ["commandline_string"]\n',
-  'definition_colored': '\x1b[94mprog\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mexample\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[94moptions\x1b[39;49;00m:\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m  \x1b[39;49;00m-\x1b[37m '
-                        '\x1b[39;49;00m\x1b[94moption_strings\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33m--commandline\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m    '
-                        '\x1b[39;49;00m\x1b[94mcomplete\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33mcommandline_string\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n',
-  'implemented': None,
-  'long': None,
-  'long_colored': None,
-  'notes': [],
-  'output': "~ > example --commandline='sudo ba<TAB>\n"
-            'base32    base64    basename  basenc    bash      bashbug\n',
-  'short': 'Complete a command line as a string'},
- {'also': {'date_format': 'For completing a date format string'},
-  'category': 'basic',
-  'command': 'date',
-  'definition': 'prog: "example"\n'
-                'options:\n'
-                '  - option_strings: ["--date"]\n'
-                '    complete: ["date", \'%Y-%m-%d\']\n',
-  'definition_colored': '\x1b[94mprog\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mexample\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[94moptions\x1b[39;49;00m:\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m  \x1b[39;49;00m-\x1b[37m '
-                        '\x1b[39;49;00m\x1b[94moption_strings\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33m--date\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m    '
-                        '\x1b[39;49;00m\x1b[94mcomplete\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33mdate\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m,\x1b[37m '
-                        "\x1b[39;49;00m\x1b[33m'\x1b[39;49;00m\x1b[33m%Y-%m-%d\x1b[39;49;00m\x1b[33m'\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n",
-  'implemented': ['Zsh'],
-  'long': 'The argument is the date format as described in `strftime(3)`.\n',
-  'long_colored': 'The argument is the date format as described in '
-                  '\x1b[33m`strftime(3)`\x1b[39;49;00m.\x1b[37m\x1b[39;49;00m\n',
-  'notes': [],
-  'output': '~ > example --date=<TAB>\n'
-            '\n'
-            '         November\n'
-            'Mo  Tu  We  Th  Fr  Sa  Su\n'
-            '     1   2   3   4   5   6\n'
-            ' 7   8   9  10  11  12  13\n'
-            '14  15  16  17  18  19  20\n'
-            '21  22  23  24  25  26  27\n'
-            '28  29  30\n',
-  'short': 'Complete a date string'},
- {'also': {'date': 'For completing a date'},
-  'category': 'basic',
-  'command': 'date_format',
-  'definition': 'prog: "example"\n'
-                'options:\n'
-                '  - option_strings: ["--date-format"]\n'
-                '    complete: ["date_format"]\n',
-  'definition_colored': '\x1b[94mprog\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mexample\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[94moptions\x1b[39;49;00m:\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m  \x1b[39;49;00m-\x1b[37m '
-                        '\x1b[39;49;00m\x1b[94moption_strings\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33m--date-format\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m    '
-                        '\x1b[39;49;00m\x1b[94mcomplete\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33mdate_format\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n',
-  'implemented': ['Fish', 'Zsh'],
-  'long': None,
-  'long_colored': None,
-  'notes': [],
-  'output': "~ > example --date-format '%<TAB>\n"
-            'a     -- abbreviated day name\n'
-            'A     -- full day name\n'
-            'B     -- full month name\n'
-            'c     -- preferred locale date and time\n'
-            'C     -- 2-digit century\n'
-            'd     -- day of month (01-31)\n'
-            'D     -- American format month/day/year (%m/%d/%y)\n'
-            'e     -- day of month ( 1-31)\n'
-            '[...]\n',
-  'short': 'Complete a date format string'},
- {'also': {'directory_list': 'For completing a comma-separated list of '
-                             'directories'},
-  'category': 'basic',
-  'command': 'directory',
-  'definition': 'prog: "example"\n'
-                'options:\n'
-                '  - option_strings: ["--directory"]\n'
-                '    complete: ["directory"]\n'
-                '  - option_strings: ["--directory-tmp"]\n'
-                '    complete: ["directory", {"directory": "/tmp"}]\n',
-  'definition_colored': '\x1b[94mprog\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mexample\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[94moptions\x1b[39;49;00m:\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m  \x1b[39;49;00m-\x1b[37m '
-                        '\x1b[39;49;00m\x1b[94moption_strings\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33m--directory\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m    '
-                        '\x1b[39;49;00m\x1b[94mcomplete\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33mdirectory\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m  \x1b[39;49;00m-\x1b[37m '
-                        '\x1b[39;49;00m\x1b[94moption_strings\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33m--directory-tmp\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m    '
-                        '\x1b[39;49;00m\x1b[94mcomplete\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33mdirectory\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m,\x1b[37m '
-                        '\x1b[39;49;00m{\x1b[33m"\x1b[39;49;00m\x1b[33mdirectory\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33m/tmp\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m}]\x1b[37m\x1b[39;49;00m\n',
-  'implemented': None,
-  'long': 'You can restrict completion to a specific directory by adding '
-          '`{"directory": ...}`.\n',
-  'long_colored': 'You can restrict completion to a specific directory by '
-                  'adding \x1b[33m`{"directory": '
-                  '...}`\x1b[39;49;00m.\x1b[37m\x1b[39;49;00m\n',
-  'notes': [],
-  'output': '~ > example --directory=<TAB>\ndir1/  dir2/\n',
-  'short': 'Complete a directory'},
- {'also': {'directory': 'For completing a directory',
-           'file_list': 'For completing a comma-separated list of files',
-           'list': 'For completion a comma-separated list of any completer'},
-  'category': 'basic',
-  'command': 'directory_list',
-  'definition': 'prog: "example"\n'
-                'options:\n'
-                '  - option_strings: ["--directory-list"]\n'
-                '    complete: ["directory_list"]\n',
-  'definition_colored': '\x1b[94mprog\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mexample\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[94moptions\x1b[39;49;00m:\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m  \x1b[39;49;00m-\x1b[37m '
-                        '\x1b[39;49;00m\x1b[94moption_strings\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33m--directory-list\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m    '
-                        '\x1b[39;49;00m\x1b[94mcomplete\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33mdirectory_list\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n',
-  'implemented': None,
-  'long': "This is an alias for `['list', ['directory']]`.\n"
-          '\n'
-          'You can restrict completion to a specific directory by adding '
-          '`{"directory": ...}`.\n'
-          ' \n'
-          'The separator can be changed by adding `{"separator": ...}`\n'
-          ' \n'
-          'By default, duplicate values are not offered for completion. This '
-          'can be changed by adding `{"duplicates": true}`.\n',
-  'long_colored': "This is an alias for \x1b[33m`['list', "
-                  "['directory']]`\x1b[39;49;00m.\x1b[37m\x1b[39;49;00m\n"
-                  '\x1b[37m\x1b[39;49;00m\n'
-                  'You can restrict completion to a specific directory by '
-                  'adding \x1b[33m`{"directory": '
-                  '...}`\x1b[39;49;00m.\x1b[37m\x1b[39;49;00m\n'
-                  ' \x1b[37m\x1b[39;49;00m\n'
-                  'The separator can be changed by adding '
-                  '\x1b[33m`{"separator": '
-                  '...}`\x1b[39;49;00m\x1b[37m\x1b[39;49;00m\n'
-                  ' \x1b[37m\x1b[39;49;00m\n'
-                  'By default, duplicate values are not offered for '
-                  'completion. This can be changed by adding '
-                  '\x1b[33m`{"duplicates": '
-                  'true}`\x1b[39;49;00m.\x1b[37m\x1b[39;49;00m\n',
-  'notes': [],
-  'output': '~ > example --directory-list=directory1,directory2,<TAB>\n'
-            'directory3  directory4\n',
-  'short': 'Complete a comma-separated list of directories'},
- {'also': None,
-  'category': 'basic',
-  'command': 'environment',
-  'definition': 'prog: "example"\n'
-                'options:\n'
-                '  - option_strings: ["--environment"]\n'
-                '    complete: ["environment"]\n',
-  'definition_colored': '\x1b[94mprog\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mexample\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[94moptions\x1b[39;49;00m:\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m  \x1b[39;49;00m-\x1b[37m '
-                        '\x1b[39;49;00m\x1b[94moption_strings\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33m--environment\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m    '
-                        '\x1b[39;49;00m\x1b[94mcomplete\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33menvironment\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n',
-  'implemented': None,
-  'long': None,
-  'long_colored': None,
-  'notes': [],
-  'output': '~ > example --environment=X<TAB>\n'
-            'XDG_RUNTIME_DIR  XDG_SEAT  XDG_SESSION_CLASS  XDG_SESSION_ID\n'
-            'XDG_SESSION_TYPE XDG_VTNR\n',
-  'short': 'Complete a shell environment variable name'},
- {'also': {'exec_fast': 'Faster implementation of exec'},
-  'category': 'custom',
-  'command': 'exec',
-  'definition': 'prog: "example"\n'
-                'options:\n'
-                '  - option_strings: ["--exec"]\n'
-                '    complete: ["exec", "printf \'%s\\\\t%s\\\\n\' \'Item 1\' '
-                '\'Description 1\' \'Item 2\' \'Description 2\'"]\n',
-  'definition_colored': '\x1b[94mprog\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mexample\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[94moptions\x1b[39;49;00m:\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m  \x1b[39;49;00m-\x1b[37m '
-                        '\x1b[39;49;00m\x1b[94moption_strings\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33m--exec\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m    '
-                        '\x1b[39;49;00m\x1b[94mcomplete\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33mexec\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m,\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mprintf\x1b[39;49;00m\x1b[31m '
-                        "\x1b[39;49;00m\x1b[33m'%s\x1b[39;49;00m\x1b[33m\\\\\x1b[39;49;00m\x1b[33mt%s\x1b[39;49;00m\x1b[33m\\\\\x1b[39;49;00m\x1b[33mn'\x1b[39;49;00m\x1b[31m "
-                        "\x1b[39;49;00m\x1b[33m'Item\x1b[39;49;00m\x1b[31m "
-                        "\x1b[39;49;00m\x1b[33m1'\x1b[39;49;00m\x1b[31m "
-                        "\x1b[39;49;00m\x1b[33m'Description\x1b[39;49;00m\x1b[31m "
-                        "\x1b[39;49;00m\x1b[33m1'\x1b[39;49;00m\x1b[31m "
-                        "\x1b[39;49;00m\x1b[33m'Item\x1b[39;49;00m\x1b[31m "
-                        "\x1b[39;49;00m\x1b[33m2'\x1b[39;49;00m\x1b[31m "
-                        "\x1b[39;49;00m\x1b[33m'Description\x1b[39;49;00m\x1b[31m "
-                        '\x1b[39;49;00m\x1b[33m2\'\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n',
-  'implemented': None,
-  'long': 'The output must be in form of:\n'
-          '\n'
-          '```\n'
-          '<item_1>\\t<description_1>\\n\n'
-          '<item_2>\\t<description_2>\\n\n'
-          '[...]\n'
-          '```\n'
-          '\n'
-          'An item and its description are delimited by a tabulator.\n'
-          ' \n'
-          'These pairs are delimited by a newline.\n',
-  'long_colored': 'The output must be in form of:\x1b[37m\x1b[39;49;00m\n'
-                  '\x1b[33m\x1b[39;49;00m\n'
-                  '\x1b[33m```\x1b[39;49;00m\n'
-                  '\x1b[33m<item_1>\\t<description_1>\\n\x1b[39;49;00m\n'
-                  '\x1b[33m<item_2>\\t<description_2>\\n\x1b[39;49;00m\n'
-                  '\x1b[33m[...]\x1b[39;49;00m\n'
-                  '\x1b[33m```\x1b[39;49;00m\n'
-                  '\x1b[37m\x1b[39;49;00m\n'
-                  'An item and its description are delimited by a '
-                  'tabulator.\x1b[37m\x1b[39;49;00m\n'
-                  ' \x1b[37m\x1b[39;49;00m\n'
-                  'These pairs are delimited by a '
-                  'newline.\x1b[37m\x1b[39;49;00m\n',
-  'notes': ['Functions can be put inside a file and included with '
-            '`--include-file`'],
-  'output': '~ > example --exec=<TAB>\n'
-            'Item 1  (Description 1)  Item 2  (Description 2)\n',
-  'short': 'Complete by the output of a command or function'},
- {'also': None,
-  'category': 'custom',
-  'command': 'exec_fast',
-  'definition': 'prog: "example"\n'
-                'options:\n'
-                '  - option_strings: ["--exec-fast"]\n'
-                '    complete: ["exec_fast", "printf \'%s\\\\t%s\\\\n\' 1 one '
-                '2 two"]\n',
-  'definition_colored': '\x1b[94mprog\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mexample\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[94moptions\x1b[39;49;00m:\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m  \x1b[39;49;00m-\x1b[37m '
-                        '\x1b[39;49;00m\x1b[94moption_strings\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33m--exec-fast\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m    '
-                        '\x1b[39;49;00m\x1b[94mcomplete\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33mexec_fast\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m,\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mprintf\x1b[39;49;00m\x1b[31m '
-                        "\x1b[39;49;00m\x1b[33m'%s\x1b[39;49;00m\x1b[33m\\\\\x1b[39;49;00m\x1b[33mt%s\x1b[39;49;00m\x1b[33m\\\\\x1b[39;49;00m\x1b[33mn'\x1b[39;49;00m\x1b[31m "
-                        '\x1b[39;49;00m\x1b[33m1\x1b[39;49;00m\x1b[31m '
-                        '\x1b[39;49;00m\x1b[33mone\x1b[39;49;00m\x1b[31m '
-                        '\x1b[39;49;00m\x1b[33m2\x1b[39;49;00m\x1b[31m '
-                        '\x1b[39;49;00m\x1b[33mtwo\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n',
-  'implemented': None,
-  'long': 'Faster version of exec for handling large amounts of data.\n'
-          ' \n'
-          'This implementation requires that the items of the parsed output do '
-          'not include\n'
-          'special shell characters or whitespace.\n',
-  'long_colored': 'Faster version of exec for handling large amounts of '
-                  'data.\x1b[37m\x1b[39;49;00m\n'
-                  ' \x1b[37m\x1b[39;49;00m\n'
-                  'This implementation requires that the items of the parsed '
-                  'output do not include\x1b[37m\x1b[39;49;00m\n'
-                  'special shell characters or '
-                  'whitespace.\x1b[37m\x1b[39;49;00m\n',
-  'notes': ['Functions can be put inside a file and included with '
-            '`--include-file`'],
-  'output': '~ > example --exec-internal=<TAB>\n1  -- one\n2  -- one\n',
-  'short': 'Complete by the output of a command or function (fast and unsafe)'},
- {'also': None,
-  'category': 'custom',
-  'command': 'exec_internal',
-  'definition': 'prog: "example"\n'
-                'options:\n'
-                '  - option_strings: ["--exec-internal"]\n'
-                '    complete: ["exec_internal", "my_completion_func"]\n',
-  'definition_colored': '\x1b[94mprog\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mexample\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[94moptions\x1b[39;49;00m:\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m  \x1b[39;49;00m-\x1b[37m '
-                        '\x1b[39;49;00m\x1b[94moption_strings\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33m--exec-internal\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m    '
-                        '\x1b[39;49;00m\x1b[94mcomplete\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33mexec_internal\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m,\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mmy_completion_func\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n',
-  'implemented': None,
-  'long': 'Execute a function that internally modifies the completion state.\n'
-          '\n'
-          'This is useful if a more advanced completion is needed.\n'
-          '\n'
-          'For **Bash**, it might look like:\n'
-          '\n'
-          '```sh\n'
-          'my_completion_func() {\n'
-          '    COMPREPLY=( $(compgen -W "read write append" -- "$cur") )\n'
-          '}\n'
-          '```\n'
-          '\n'
-          'For **Zsh**, it might look like:\n'
-          '\n'
-          '```sh\n'
-          'my_completion_func() {\n'
-          '    local items=(\n'
-          "        read:'Read data from a file'\n"
-          "        write:'Write data from a file'\n"
-          "        append:'Append data to a file'\n"
-          '    )\n'
-          '\n'
-          "    _describe 'my items' items\n"
-          '}\n'
-          '```\n'
-          '\n'
-          'For **Fish**, it might look like:\n'
-          '\n'
-          '```sh\n'
-          'function my_completion_func\n'
-          "    printf '%s\\t%s\\n' \\\n"
-          "        read 'Read data from a file'  \\\n"
-          "        write 'Write data from a file' \\\n"
-          "        append 'Append data to a file'\n"
-          'end\n'
-          '```\n',
-  'long_colored': 'Execute a function that internally modifies the completion '
-                  'state.\x1b[37m\x1b[39;49;00m\n'
-                  '\x1b[37m\x1b[39;49;00m\n'
-                  'This is useful if a more advanced completion is '
-                  'needed.\x1b[37m\x1b[39;49;00m\n'
-                  '\x1b[37m\x1b[39;49;00m\n'
-                  'For **Bash**, it might look like:\x1b[37m\x1b[39;49;00m\n'
-                  '\x1b[33m\x1b[39;49;00m\n'
-                  '\x1b[33m```\x1b[39;49;00m\x1b[33msh\x1b[39;49;00m\x1b[37m\x1b[39;49;00m\n'
-                  'my_completion_func()\x1b[37m '
-                  '\x1b[39;49;00m{\x1b[37m\x1b[39;49;00m\n'
-                  '\x1b[37m    '
-                  '\x1b[39;49;00m\x1b[31mCOMPREPLY\x1b[39;49;00m=(\x1b[37m '
-                  '\x1b[39;49;00m\x1b[34m$(\x1b[39;49;00m\x1b[36mcompgen\x1b[39;49;00m\x1b[37m '
-                  '\x1b[39;49;00m-W\x1b[37m \x1b[39;49;00m\x1b[33m"read write '
-                  'append"\x1b[39;49;00m\x1b[37m \x1b[39;49;00m--\x1b[37m '
-                  '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[31m$cur\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[34m)\x1b[39;49;00m\x1b[37m '
-                  '\x1b[39;49;00m)\x1b[37m\x1b[39;49;00m\n'
-                  '}\x1b[37m\x1b[39;49;00m\n'
-                  '\x1b[33m```\x1b[39;49;00m\n'
-                  '\x1b[37m\x1b[39;49;00m\n'
-                  'For **Zsh**, it might look like:\x1b[37m\x1b[39;49;00m\n'
-                  '\x1b[33m\x1b[39;49;00m\n'
-                  '\x1b[33m```\x1b[39;49;00m\x1b[33msh\x1b[39;49;00m\x1b[37m\x1b[39;49;00m\n'
-                  'my_completion_func()\x1b[37m '
-                  '\x1b[39;49;00m{\x1b[37m\x1b[39;49;00m\n'
-                  '\x1b[37m    '
-                  '\x1b[39;49;00m\x1b[36mlocal\x1b[39;49;00m\x1b[37m '
-                  '\x1b[39;49;00m\x1b[31mitems\x1b[39;49;00m=(\x1b[37m\x1b[39;49;00m\n'
-                  "\x1b[37m        \x1b[39;49;00mread:\x1b[33m'Read data from "
-                  "a file'\x1b[39;49;00m\x1b[37m\x1b[39;49;00m\n"
-                  "\x1b[37m        \x1b[39;49;00mwrite:\x1b[33m'Write data "
-                  "from a file'\x1b[39;49;00m\x1b[37m\x1b[39;49;00m\n"
-                  "\x1b[37m        \x1b[39;49;00mappend:\x1b[33m'Append data "
-                  "to a file'\x1b[39;49;00m\x1b[37m\x1b[39;49;00m\n"
-                  '\x1b[37m    \x1b[39;49;00m)\x1b[37m\x1b[39;49;00m\n'
-                  '\x1b[37m\x1b[39;49;00m\n'
-                  '\x1b[37m    \x1b[39;49;00m_describe\x1b[37m '
-                  "\x1b[39;49;00m\x1b[33m'my items'\x1b[39;49;00m\x1b[37m "
-                  '\x1b[39;49;00mitems\x1b[37m\x1b[39;49;00m\n'
-                  '}\x1b[37m\x1b[39;49;00m\n'
-                  '\x1b[33m```\x1b[39;49;00m\n'
-                  '\x1b[37m\x1b[39;49;00m\n'
-                  'For **Fish**, it might look like:\x1b[37m\x1b[39;49;00m\n'
-                  '\x1b[33m\x1b[39;49;00m\n'
-                  '\x1b[33m```\x1b[39;49;00m\x1b[33msh\x1b[39;49;00m\x1b[37m\x1b[39;49;00m\n'
-                  '\x1b[34mfunction\x1b[39;49;00m\x1b[37m '
-                  '\x1b[39;49;00mmy_completion_func\x1b[37m\x1b[39;49;00m\n'
-                  '\x1b[37m    '
-                  '\x1b[39;49;00m\x1b[36mprintf\x1b[39;49;00m\x1b[37m '
-                  "\x1b[39;49;00m\x1b[33m'%s\\t%s\\n'\x1b[39;49;00m\x1b[37m "
-                  '\x1b[39;49;00m\x1b[33m\\\x1b[39;49;00m\n'
-                  '\x1b[37m        '
-                  '\x1b[39;49;00m\x1b[36mread\x1b[39;49;00m\x1b[37m '
-                  "\x1b[39;49;00m\x1b[33m'Read data from a "
-                  "file'\x1b[39;49;00m\x1b[37m  "
-                  '\x1b[39;49;00m\x1b[33m\\\x1b[39;49;00m\n'
-                  '\x1b[37m        \x1b[39;49;00mwrite\x1b[37m '
-                  "\x1b[39;49;00m\x1b[33m'Write data from a "
-                  "file'\x1b[39;49;00m\x1b[37m "
-                  '\x1b[39;49;00m\x1b[33m\\\x1b[39;49;00m\n'
-                  '\x1b[37m        \x1b[39;49;00mappend\x1b[37m '
-                  "\x1b[39;49;00m\x1b[33m'Append data to a "
-                  "file'\x1b[39;49;00m\x1b[37m\x1b[39;49;00m\n"
-                  'end\x1b[37m\x1b[39;49;00m\n'
-                  '\x1b[33m```\x1b[39;49;00m\n',
-  'notes': ['Functions can be put inside a file and included with '
-            '`--include-file`'],
-  'output': '~ > example --exec-internal=<TAB>\n'
-            'append  -- Append data to a file\n'
-            'read    -- Read data from a file\n'
-            'write   -- Write data from a file\n',
-  'short': "Complete by a function that uses the shell's internal completion "
-           'mechanisms'},
- {'also': {'file_list': 'For completing a comma-separated list of files',
-           'mime_file': "For completing a file based on it's MIME-type"},
-  'category': 'basic',
-  'command': 'file',
-  'definition': 'prog: "example"\n'
-                'options:\n'
-                '  - option_strings: ["--file"]\n'
-                '    complete: ["file"]\n'
-                '\n'
-                '  - option_strings: ["--file-tmp"]\n'
-                '    complete: ["file", {"directory": "/tmp"}]\n'
-                '\n'
-                '  - option_strings: ["--file-ext"]\n'
-                '    complete: ["file", {"extensions": ["c", "cpp"]}]\n'
-                '\n'
-                '  - option_strings: ["--file-ignore"]\n'
-                '    complete: ["file", {"ignore_globs": ["*.[tT][xX][tT]", '
-                '"*.c++"]}]\n',
-  'definition_colored': '\x1b[94mprog\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mexample\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[94moptions\x1b[39;49;00m:\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m  \x1b[39;49;00m-\x1b[37m '
-                        '\x1b[39;49;00m\x1b[94moption_strings\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33m--file\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m    '
-                        '\x1b[39;49;00m\x1b[94mcomplete\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33mfile\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m  \x1b[39;49;00m-\x1b[37m '
-                        '\x1b[39;49;00m\x1b[94moption_strings\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33m--file-tmp\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m    '
-                        '\x1b[39;49;00m\x1b[94mcomplete\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33mfile\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m,\x1b[37m '
-                        '\x1b[39;49;00m{\x1b[33m"\x1b[39;49;00m\x1b[33mdirectory\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33m/tmp\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m}]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m  \x1b[39;49;00m-\x1b[37m '
-                        '\x1b[39;49;00m\x1b[94moption_strings\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33m--file-ext\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m    '
-                        '\x1b[39;49;00m\x1b[94mcomplete\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33mfile\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m,\x1b[37m '
-                        '\x1b[39;49;00m{\x1b[33m"\x1b[39;49;00m\x1b[33mextensions\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33mc\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m,\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mcpp\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]}]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m  \x1b[39;49;00m-\x1b[37m '
-                        '\x1b[39;49;00m\x1b[94moption_strings\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33m--file-ignore\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m    '
-                        '\x1b[39;49;00m\x1b[94mcomplete\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33mfile\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m,\x1b[37m '
-                        '\x1b[39;49;00m{\x1b[33m"\x1b[39;49;00m\x1b[33mignore_globs\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33m*.[tT][xX][tT]\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m,\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33m*.c++\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]}]\x1b[37m\x1b[39;49;00m\n',
-  'implemented': None,
-  'long': 'You can restrict completion to a specific directory by adding '
-          '`{"directory": ...}`.\n'
-          ' \n'
-          'You can restrict completion to specific extensions by adding '
-          '`{"extensions": [...]}`.\n'
-          ' \n'
-          'You can make matching extensions *fuzzy* by adding `{"fuzzy": '
-          'true}`.\n'
-          'Fuzzy means that the files do not have to end with the exact '
-          'extension. For example `foo.txt.1`.\n'
-          '\n'
-          'You can ignore files by adding a list of Bash globs using '
-          '`{"ignore_globs": [...]}`\n'
-          '\n'
-          '**NOTE:** Restricting completion to specific file extensions only '
-          'makes sense if the program being completed actually expects files '
-          'of those types.\n'
-          'On Unix-like systems, file extensions generally have no inherent '
-          'meaning -- they are purely conventional and not required for '
-          'determining file types.\n',
-  'long_colored': 'You can restrict completion to a specific directory by '
-                  'adding \x1b[33m`{"directory": '
-                  '...}`\x1b[39;49;00m.\x1b[37m\x1b[39;49;00m\n'
-                  ' \x1b[37m\x1b[39;49;00m\n'
-                  'You can restrict completion to specific extensions by '
-                  'adding \x1b[33m`{"extensions": '
-                  '[...]}`\x1b[39;49;00m.\x1b[37m\x1b[39;49;00m\n'
-                  ' \x1b[37m\x1b[39;49;00m\n'
-                  'You can make matching extensions *fuzzy* by adding '
-                  '\x1b[33m`{"fuzzy": '
-                  'true}`\x1b[39;49;00m.\x1b[37m\x1b[39;49;00m\n'
-                  'Fuzzy means that the files do not have to end with the '
-                  'exact extension. For example '
-                  '\x1b[33m`foo.txt.1`\x1b[39;49;00m.\x1b[37m\x1b[39;49;00m\n'
-                  '\x1b[37m\x1b[39;49;00m\n'
-                  'You can ignore files by adding a list of Bash globs using '
-                  '\x1b[33m`{"ignore_globs": '
-                  '[...]}`\x1b[39;49;00m\x1b[37m\x1b[39;49;00m\n'
-                  '\n'
-                  '**NOTE:** Restricting completion to specific file '
-                  'extensions only makes sense if the program being completed '
-                  'actually expects files of those '
-                  'types.\x1b[37m\x1b[39;49;00m\n'
-                  'On Unix-like systems, file extensions generally have no '
-                  'inherent meaning -- they are purely conventional and not '
-                  'required for determining file '
-                  'types.\x1b[37m\x1b[39;49;00m\n',
-  'notes': [],
-  'output': '~ > example --file=<TAB>\n'
-            'dir1/  dir2/  file1  file2\n'
-            '~ > example --file-ext=<TAB>\n'
-            'dir1/  dir2/  file.c  file.cpp\n',
-  'short': 'Complete a file'},
- {'also': {'directory_list': 'For completing a comma-separated list of '
-                             'directories',
-           'file': 'For completing a file',
-           'list': 'For completing a comma-separted list using any completer'},
-  'category': 'basic',
-  'command': 'file_list',
-  'definition': 'prog: "example"\n'
-                'options:\n'
-                '  - option_strings: ["--file-list"]\n'
-                '    complete: ["file_list"]\n',
-  'definition_colored': '\x1b[94mprog\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mexample\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[94moptions\x1b[39;49;00m:\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m  \x1b[39;49;00m-\x1b[37m '
-                        '\x1b[39;49;00m\x1b[94moption_strings\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33m--file-list\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m    '
-                        '\x1b[39;49;00m\x1b[94mcomplete\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33mfile_list\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n',
-  'implemented': None,
-  'long': "This is an alias for `['list', ['file']]`.\n"
-          '\n'
-          'You can restrict completion to a specific directory by adding '
-          '`{"directory": ...}`.\n'
-          '\n'
-          'You can restrict completion to specific extensions by adding '
-          '`{"extensions": [...]}`.\n'
-          '\n'
-          'You can make matching extensions *fuzzy* by adding `{"fuzzy": '
-          'true}`.\n'
-          'Fuzzy means that the files do not have to end with the exact '
-          'extension. For example `foo.txt.1`.\n'
-          '\n'
-          'You can ignore files by adding a list of Bash globs using '
-          '`{"ignore_globs": [...]}`\n'
-          '\n'
-          'By default, duplicate values are not offered for completion. This '
-          'can be changed by adding `{"duplicates": true}`.\n'
-          '\n'
-          'The separator can be changed by adding `{"separator": ...}`\n',
-  'long_colored': "This is an alias for \x1b[33m`['list', "
-                  "['file']]`\x1b[39;49;00m.\x1b[37m\x1b[39;49;00m\n"
-                  '\x1b[37m\x1b[39;49;00m\n'
-                  'You can restrict completion to a specific directory by '
-                  'adding \x1b[33m`{"directory": '
-                  '...}`\x1b[39;49;00m.\x1b[37m\x1b[39;49;00m\n'
-                  '\x1b[37m\x1b[39;49;00m\n'
-                  'You can restrict completion to specific extensions by '
-                  'adding \x1b[33m`{"extensions": '
-                  '[...]}`\x1b[39;49;00m.\x1b[37m\x1b[39;49;00m\n'
-                  '\x1b[37m\x1b[39;49;00m\n'
-                  'You can make matching extensions *fuzzy* by adding '
-                  '\x1b[33m`{"fuzzy": '
-                  'true}`\x1b[39;49;00m.\x1b[37m\x1b[39;49;00m\n'
-                  'Fuzzy means that the files do not have to end with the '
-                  'exact extension. For example '
-                  '\x1b[33m`foo.txt.1`\x1b[39;49;00m.\x1b[37m\x1b[39;49;00m\n'
-                  '\x1b[37m\x1b[39;49;00m\n'
-                  'You can ignore files by adding a list of Bash globs using '
-                  '\x1b[33m`{"ignore_globs": '
-                  '[...]}`\x1b[39;49;00m\x1b[37m\x1b[39;49;00m\n'
-                  '\x1b[37m\x1b[39;49;00m\n'
-                  'By default, duplicate values are not offered for '
-                  'completion. This can be changed by adding '
-                  '\x1b[33m`{"duplicates": '
-                  'true}`\x1b[39;49;00m.\x1b[37m\x1b[39;49;00m\n'
-                  '\x1b[37m\x1b[39;49;00m\n'
-                  'The separator can be changed by adding '
-                  '\x1b[33m`{"separator": '
-                  '...}`\x1b[39;49;00m\x1b[37m\x1b[39;49;00m\n',
-  'notes': [],
-  'output': '~ > example --file-list=file1,file2,<TAB>\nfile3  file4\n',
-  'short': 'Complete a comma-separated list of files'},
- {'also': None,
-  'category': 'basic',
-  'command': 'filesystem_type',
-  'definition': 'prog: "example"\n'
-                'options:\n'
-                '  - option_strings: ["--filesystem-type"]\n'
-                '    complete: ["filesystem_type"]\n',
-  'definition_colored': '\x1b[94mprog\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mexample\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[94moptions\x1b[39;49;00m:\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m  \x1b[39;49;00m-\x1b[37m '
-                        '\x1b[39;49;00m\x1b[94moption_strings\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33m--filesystem-type\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m    '
-                        '\x1b[39;49;00m\x1b[94mcomplete\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33mfilesystem_type\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n',
-  'implemented': None,
-  'long': None,
-  'long_colored': None,
-  'notes': [],
-  'output': '~ > example --filesystem-type=<TAB>\n'
-            'adfs     autofs   bdev      bfs     binder     binfmt_misc  bpf\n'
-            'cgroup   cgroup2  configfs  cramfs  debugfs    devpts       '
-            'devtmpfs\n'
-            '[...]\n',
-  'short': 'Complete a filesystem type'},
- {'also': {'integer': 'For completing an integer'},
-  'category': 'basic',
-  'command': 'float',
-  'definition': 'prog: "example"\n'
-                'options:\n'
-                '  - option_strings: ["--time"]\n'
-                '    complete: ["float", {"suffixes": {"s": "seconds", "m": '
-                '"minutes", "h": "hours"}}]\n',
-  'definition_colored': '\x1b[94mprog\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mexample\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[94moptions\x1b[39;49;00m:\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m  \x1b[39;49;00m-\x1b[37m '
-                        '\x1b[39;49;00m\x1b[94moption_strings\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33m--time\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m    '
-                        '\x1b[39;49;00m\x1b[94mcomplete\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33mfloat\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m,\x1b[37m '
-                        '\x1b[39;49;00m{\x1b[33m"\x1b[39;49;00m\x1b[33msuffixes\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m{\x1b[33m"\x1b[39;49;00m\x1b[33ms\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mseconds\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m,\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mm\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mminutes\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m,\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mh\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mhours\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m}}]\x1b[37m\x1b[39;49;00m\n',
-  'implemented': None,
-  'long': 'A min value can be specified by using `{"min": <VALUE>}`.\n'
-          '\n'
-          'A max value can be specified by using `{"max": <VALUE>}`.\n'
-          '\n'
-          'A list of suffixes can be specified by using `{"suffixes": '
-          '{"<SUFFIX>": "<DESCRIPTION", ...}}`\n'
-          '\n'
-          'A help text can be set by using `{"help": "<TEXT>"}`. If not '
-          'supplied, the `help` attribute of the option is used.\n',
-  'long_colored': 'A min value can be specified by using \x1b[33m`{"min": '
-                  '<VALUE>}`\x1b[39;49;00m.\x1b[37m\x1b[39;49;00m\n'
-                  '\x1b[37m\x1b[39;49;00m\n'
-                  'A max value can be specified by using \x1b[33m`{"max": '
-                  '<VALUE>}`\x1b[39;49;00m.\x1b[37m\x1b[39;49;00m\n'
-                  '\x1b[37m\x1b[39;49;00m\n'
-                  'A list of suffixes can be specified by using '
-                  '\x1b[33m`{"suffixes": {"<SUFFIX>": "<DESCRIPTION", '
-                  '...}}`\x1b[39;49;00m\x1b[37m\x1b[39;49;00m\n'
-                  '\x1b[37m\x1b[39;49;00m\n'
-                  'A help text can be set by using \x1b[33m`{"help": '
-                  '"<TEXT>"}`\x1b[39;49;00m. If not supplied, the '
-                  '\x1b[33m`help`\x1b[39;49;00m attribute of the option is '
-                  'used.\x1b[37m\x1b[39;49;00m\n',
-  'notes': [],
-  'output': '~ > example --time=3.0<TAB>\n'
-            's -- seconds  m -- minutes  h -- hours\n',
-  'short': 'Complete a floating point number'},
- {'also': {'group': 'For completing a group name'},
-  'category': 'basic',
-  'command': 'gid',
-  'definition': 'prog: "example"\n'
-                'options:\n'
-                '  - option_strings: ["--gid"]\n'
-                '    complete: ["gid"]\n',
-  'definition_colored': '\x1b[94mprog\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mexample\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[94moptions\x1b[39;49;00m:\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m  \x1b[39;49;00m-\x1b[37m '
-                        '\x1b[39;49;00m\x1b[94moption_strings\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33m--gid\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m    '
-                        '\x1b[39;49;00m\x1b[94mcomplete\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33mgid\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n',
-  'implemented': None,
-  'long': None,
-  'long_colored': None,
-  'notes': [],
-  'output': '~ > example --gid=<TAB>\n'
-            '0      -- root\n'
-            '1000   -- braph\n'
-            '102    -- polkitd\n'
-            '108    -- vboxusers\n'
-            '11     -- ftp\n'
-            '12     -- mail\n'
-            '133    -- rtkit\n'
-            '19     -- log\n'
-            '[...]\n',
-  'short': 'Complete a group id'},
- {'also': {'gid': 'For completing a group id'},
-  'category': 'basic',
-  'command': 'group',
-  'definition': 'prog: "example"\n'
-                'options:\n'
-                '  - option_strings: ["--group"]\n'
-                '    complete: ["group"]\n',
-  'definition_colored': '\x1b[94mprog\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mexample\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[94moptions\x1b[39;49;00m:\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m  \x1b[39;49;00m-\x1b[37m '
-                        '\x1b[39;49;00m\x1b[94moption_strings\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33m--group\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m    '
-                        '\x1b[39;49;00m\x1b[94mcomplete\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33mgroup\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n',
-  'implemented': None,
-  'long': None,
-  'long_colored': None,
-  'notes': [],
-  'output': '~ > example --group=<TAB>\n'
-            'adm                     audio                   avahi\n'
-            'bin                     braph                   colord\n'
-            'daemon                  dbus                    dhcpcd\n'
-            'disk                    floppy                  ftp\n'
-            'games                   git                     groups\n'
-            '[...]\n',
-  'short': 'Complete a group'},
- {'also': None,
-  'category': 'basic',
-  'command': 'history',
-  'definition': 'prog: "example"\n'
-                'options:\n'
-                '  - option_strings: ["--history"]\n'
-                '    complete: ["history", \'[a-zA-Z0-9]+@[a-zA-Z0-9]+\']\n',
-  'definition_colored': '\x1b[94mprog\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mexample\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[94moptions\x1b[39;49;00m:\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m  \x1b[39;49;00m-\x1b[37m '
-                        '\x1b[39;49;00m\x1b[94moption_strings\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33m--history\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m    '
-                        '\x1b[39;49;00m\x1b[94mcomplete\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33mhistory\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m,\x1b[37m '
-                        "\x1b[39;49;00m\x1b[33m'\x1b[39;49;00m\x1b[33m[a-zA-Z0-9]+@[a-zA-Z0-9]+\x1b[39;49;00m\x1b[33m'\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n",
-  'implemented': None,
-  'long': 'The argument is an extended regular expression passed to `grep '
-          '-E`.\n',
-  'long_colored': 'The argument is an extended regular expression passed to '
-                  '\x1b[33m`grep -E`\x1b[39;49;00m.\x1b[37m\x1b[39;49;00m\n',
-  'notes': [],
-  'output': '~ > example --history=<TAB>\nfoo@bar mymail@myprovider\n',
-  'short': "Complete based on a shell's history"},
- {'also': None,
-  'category': 'basic',
-  'command': 'hostname',
-  'definition': 'prog: "example"\n'
-                'options:\n'
-                '  - option_strings: ["--hostname"]\n'
-                '    complete: ["hostname"]\n',
-  'definition_colored': '\x1b[94mprog\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mexample\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[94moptions\x1b[39;49;00m:\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m  \x1b[39;49;00m-\x1b[37m '
-                        '\x1b[39;49;00m\x1b[94moption_strings\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33m--hostname\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m    '
-                        '\x1b[39;49;00m\x1b[94mcomplete\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33mhostname\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n',
-  'implemented': None,
-  'long': None,
-  'long_colored': None,
-  'notes': [],
-  'output': '~ > example --hostname=<TAB>\nlocalhost\n',
-  'short': 'Complete a hostname'},
- {'also': {'float': 'For completing a floating point number',
-           'range': 'For completing a range of integers'},
-  'category': 'basic',
-  'command': 'integer',
-  'definition': 'prog: "example"\n'
-                'options:\n'
-                '  - option_strings: ["--time"]\n'
-                '    complete: ["integer", {"suffixes": {"s": "seconds", "m": '
-                '"minutes", "h": "hours"}}]\n',
-  'definition_colored': '\x1b[94mprog\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mexample\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[94moptions\x1b[39;49;00m:\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m  \x1b[39;49;00m-\x1b[37m '
-                        '\x1b[39;49;00m\x1b[94moption_strings\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33m--time\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m    '
-                        '\x1b[39;49;00m\x1b[94mcomplete\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33minteger\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m,\x1b[37m '
-                        '\x1b[39;49;00m{\x1b[33m"\x1b[39;49;00m\x1b[33msuffixes\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m{\x1b[33m"\x1b[39;49;00m\x1b[33ms\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mseconds\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m,\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mm\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mminutes\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m,\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mh\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mhours\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m}}]\x1b[37m\x1b[39;49;00m\n',
-  'implemented': None,
-  'long': 'A min value can be specified by using `{"min": <VALUE>}`.\n'
-          '\n'
-          'A max value can be specified by using `{"max": <VALUE>}`.\n'
-          '\n'
-          'A list of suffixes can be specified by using `{"suffixes": '
-          '{"<SUFFIX>": "<DESCRIPTION", ...}}`\n'
-          '\n'
-          'A help text can be set by using `{"help": "<TEXT>"}`. If not '
-          'supplied, the `help` attribute of the option is used.\n',
-  'long_colored': 'A min value can be specified by using \x1b[33m`{"min": '
-                  '<VALUE>}`\x1b[39;49;00m.\x1b[37m\x1b[39;49;00m\n'
-                  '\x1b[37m\x1b[39;49;00m\n'
-                  'A max value can be specified by using \x1b[33m`{"max": '
-                  '<VALUE>}`\x1b[39;49;00m.\x1b[37m\x1b[39;49;00m\n'
-                  '\x1b[37m\x1b[39;49;00m\n'
-                  'A list of suffixes can be specified by using '
-                  '\x1b[33m`{"suffixes": {"<SUFFIX>": "<DESCRIPTION", '
-                  '...}}`\x1b[39;49;00m\x1b[37m\x1b[39;49;00m\n'
-                  '\x1b[37m\x1b[39;49;00m\n'
-                  'A help text can be set by using \x1b[33m`{"help": '
-                  '"<TEXT>"}`\x1b[39;49;00m. If not supplied, the '
-                  '\x1b[33m`help`\x1b[39;49;00m attribute of the option is '
-                  'used.\x1b[37m\x1b[39;49;00m\n',
-  'notes': [],
-  'output': '~ > example --integer=3<TAB>\n'
-            's -- seconds  m -- minutes  h -- hours\n',
-  'short': 'Complete an integer'},
- {'also': {'net_interface': 'For completing a network interface'},
-  'category': 'basic',
-  'command': 'ip_address',
-  'definition': 'prog: "example"\n'
-                'options:\n'
-                '  - option_strings: ["--ip-address"]\n'
-                '    complete: ["ip_address"]\n'
-                '\n'
-                '  - option_strings: ["--ip-address-v4"]\n'
-                '    complete: ["ip_address", "ipv4"]\n'
-                '\n'
-                '  - option_strings: ["--ip-address-v6"]\n'
-                '    complete: ["ip_address", "ipv6"]\n',
-  'definition_colored': '\x1b[94mprog\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mexample\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[94moptions\x1b[39;49;00m:\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m  \x1b[39;49;00m-\x1b[37m '
-                        '\x1b[39;49;00m\x1b[94moption_strings\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33m--ip-address\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m    '
-                        '\x1b[39;49;00m\x1b[94mcomplete\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33mip_address\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m  \x1b[39;49;00m-\x1b[37m '
-                        '\x1b[39;49;00m\x1b[94moption_strings\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33m--ip-address-v4\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m    '
-                        '\x1b[39;49;00m\x1b[94mcomplete\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33mip_address\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m,\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mipv4\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m  \x1b[39;49;00m-\x1b[37m '
-                        '\x1b[39;49;00m\x1b[94moption_strings\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33m--ip-address-v6\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m    '
-                        '\x1b[39;49;00m\x1b[94mcomplete\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33mip_address\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m,\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mipv6\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n',
-  'implemented': None,
-  'long': 'The first argument is the type of ip addresses to be completed:\n'
-          '\n'
-          '- `ipv4`: IPv4 addresses\n'
-          '- `ipv6`: IPv6 addresses\n'
-          '- `all`:  Both IPv4 and IPv6 addresses\n'
-          '\n'
-          'Append `+` to include the unspecified address of the selected '
-          'family:\n'
-          '\n'
-          '- `ipv4+`: Includes 0.0.0.0\n'
-          '- `ipv6+`: Includes ::\n'
-          '- `all+`:  Includes both 0.0.0.0 and ::\n',
-  'long_colored': 'The first argument is the type of ip addresses to be '
-                  'completed:\x1b[37m\x1b[39;49;00m\n'
-                  '\x1b[37m\x1b[39;49;00m\n'
-                  '\x1b[34m-\x1b[39;49;00m\x1b[37m '
-                  '\x1b[39;49;00m\x1b[33m`ipv4`\x1b[39;49;00m: IPv4 '
-                  'addresses\x1b[37m\x1b[39;49;00m\n'
-                  '\x1b[34m-\x1b[39;49;00m\x1b[37m '
-                  '\x1b[39;49;00m\x1b[33m`ipv6`\x1b[39;49;00m: IPv6 '
-                  'addresses\x1b[37m\x1b[39;49;00m\n'
-                  '\x1b[34m-\x1b[39;49;00m\x1b[37m '
-                  '\x1b[39;49;00m\x1b[33m`all`\x1b[39;49;00m:  Both IPv4 and '
-                  'IPv6 addresses\x1b[37m\x1b[39;49;00m\n'
-                  '\x1b[37m\x1b[39;49;00m\n'
-                  'Append \x1b[33m`+`\x1b[39;49;00m to include the unspecified '
-                  'address of the selected family:\x1b[37m\x1b[39;49;00m\n'
-                  '\x1b[37m\x1b[39;49;00m\n'
-                  '\x1b[34m-\x1b[39;49;00m\x1b[37m '
-                  '\x1b[39;49;00m\x1b[33m`ipv4+`\x1b[39;49;00m: Includes '
-                  '0.0.0.0\x1b[37m\x1b[39;49;00m\n'
-                  '\x1b[34m-\x1b[39;49;00m\x1b[37m '
-                  '\x1b[39;49;00m\x1b[33m`ipv6+`\x1b[39;49;00m: Includes '
-                  '::\x1b[37m\x1b[39;49;00m\n'
-                  '\x1b[34m-\x1b[39;49;00m\x1b[37m '
-                  '\x1b[39;49;00m\x1b[33m`all+`\x1b[39;49;00m:  Includes both '
-                  '0.0.0.0 and ::\x1b[37m\x1b[39;49;00m\n',
-  'notes': [],
-  'output': '~ > example --ip-address=<TAB>\n'
-            '::1    10.0.0.71   127.0.0.1   fe80::f567:7a1a:3c98:808d\n'
-            '\n'
-            '~ > example --ip-address-v4=<TAB>\n'
-            '10.0.0.71   127.0.0.1\n'
-            '\n'
-            '~ > example --ip-address-v6=<TAB>\n'
-            '::1   fe80::f567:7a1a:3c98:808d\n',
-  'short': 'Complete a bound ip address'},
- {'also': {'key_value_list_exec': 'For completing a comma-separated list of '
-                                  'key=value pairs (dynamically generated by a '
-                                  'function)',
-           'key_value_pair': 'For completing a single key=value pair',
-           'list': 'For completing a comma-separated list of any completer',
-           'value_list': 'For completing a comma-separated list of values'},
-  'category': 'meta',
-  'command': 'key_value_list',
-  'definition': 'prog: "example"\n'
-                'options:\n'
-                '  - option_strings: ["--key-value-list"]\n'
-                '    complete: ["key_value_list", ",", "=", [\n'
-                "      ['flag',        'An option flag', null],\n"
-                "      ['nodesc',      null, null],\n"
-                "      ['nocomp',      'An option with arg but without "
-                "completer', ['none']],\n"
-                "      ['user',        'Takes a username', ['user']],\n"
-                "      ['*repeatable', 'This option is repeatable', null],\n"
-                "      ['exclusive',   'This option disables other options', "
-                "null, ['flag', 'nodesc', 'nocomp']],\n"
-                "      ['check',       'Specify file name conversions', "
-                "['choices', {\n"
-                '        \'relaxed\': "convert to lowercase before lookup",\n'
-                '        \'strict\': "no conversion"\n'
-                '      }]]\n'
-                '    ]]\n',
-  'definition_colored': '\x1b[94mprog\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mexample\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[94moptions\x1b[39;49;00m:\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m  \x1b[39;49;00m-\x1b[37m '
-                        '\x1b[39;49;00m\x1b[94moption_strings\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33m--key-value-list\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m    '
-                        '\x1b[39;49;00m\x1b[94mcomplete\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33mkey_value_list\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m,\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33m,\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m,\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33m=\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m,\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m      '
-                        "\x1b[39;49;00m[\x1b[33m'\x1b[39;49;00m\x1b[33mflag\x1b[39;49;00m\x1b[33m'\x1b[39;49;00m,\x1b[37m        "
-                        "\x1b[39;49;00m\x1b[33m'\x1b[39;49;00m\x1b[33mAn\x1b[39;49;00m\x1b[31m "
-                        '\x1b[39;49;00m\x1b[33moption\x1b[39;49;00m\x1b[31m '
-                        "\x1b[39;49;00m\x1b[33mflag\x1b[39;49;00m\x1b[33m'\x1b[39;49;00m,\x1b[37m "
-                        '\x1b[39;49;00m\x1b[31mnull\x1b[39;49;00m],\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m      '
-                        "\x1b[39;49;00m[\x1b[33m'\x1b[39;49;00m\x1b[33mnodesc\x1b[39;49;00m\x1b[33m'\x1b[39;49;00m,\x1b[37m      "
-                        '\x1b[39;49;00m\x1b[31mnull\x1b[39;49;00m,\x1b[37m '
-                        '\x1b[39;49;00m\x1b[31mnull\x1b[39;49;00m],\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m      '
-                        "\x1b[39;49;00m[\x1b[33m'\x1b[39;49;00m\x1b[33mnocomp\x1b[39;49;00m\x1b[33m'\x1b[39;49;00m,\x1b[37m      "
-                        "\x1b[39;49;00m\x1b[33m'\x1b[39;49;00m\x1b[33mAn\x1b[39;49;00m\x1b[31m "
-                        '\x1b[39;49;00m\x1b[33moption\x1b[39;49;00m\x1b[31m '
-                        '\x1b[39;49;00m\x1b[33mwith\x1b[39;49;00m\x1b[31m '
-                        '\x1b[39;49;00m\x1b[33marg\x1b[39;49;00m\x1b[31m '
-                        '\x1b[39;49;00m\x1b[33mbut\x1b[39;49;00m\x1b[31m '
-                        '\x1b[39;49;00m\x1b[33mwithout\x1b[39;49;00m\x1b[31m '
-                        "\x1b[39;49;00m\x1b[33mcompleter\x1b[39;49;00m\x1b[33m'\x1b[39;49;00m,\x1b[37m "
-                        "\x1b[39;49;00m[\x1b[33m'\x1b[39;49;00m\x1b[33mnone\x1b[39;49;00m\x1b[33m'\x1b[39;49;00m]],\x1b[37m\x1b[39;49;00m\n"
-                        '\x1b[37m      '
-                        "\x1b[39;49;00m[\x1b[33m'\x1b[39;49;00m\x1b[33muser\x1b[39;49;00m\x1b[33m'\x1b[39;49;00m,\x1b[37m        "
-                        "\x1b[39;49;00m\x1b[33m'\x1b[39;49;00m\x1b[33mTakes\x1b[39;49;00m\x1b[31m "
-                        '\x1b[39;49;00m\x1b[33ma\x1b[39;49;00m\x1b[31m '
-                        "\x1b[39;49;00m\x1b[33musername\x1b[39;49;00m\x1b[33m'\x1b[39;49;00m,\x1b[37m "
-                        "\x1b[39;49;00m[\x1b[33m'\x1b[39;49;00m\x1b[33muser\x1b[39;49;00m\x1b[33m'\x1b[39;49;00m]],\x1b[37m\x1b[39;49;00m\n"
-                        '\x1b[37m      '
-                        "\x1b[39;49;00m[\x1b[33m'\x1b[39;49;00m\x1b[33m*repeatable\x1b[39;49;00m\x1b[33m'\x1b[39;49;00m,\x1b[37m "
-                        "\x1b[39;49;00m\x1b[33m'\x1b[39;49;00m\x1b[33mThis\x1b[39;49;00m\x1b[31m "
-                        '\x1b[39;49;00m\x1b[33moption\x1b[39;49;00m\x1b[31m '
-                        '\x1b[39;49;00m\x1b[33mis\x1b[39;49;00m\x1b[31m '
-                        "\x1b[39;49;00m\x1b[33mrepeatable\x1b[39;49;00m\x1b[33m'\x1b[39;49;00m,\x1b[37m "
-                        '\x1b[39;49;00m\x1b[31mnull\x1b[39;49;00m],\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m      '
-                        "\x1b[39;49;00m[\x1b[33m'\x1b[39;49;00m\x1b[33mexclusive\x1b[39;49;00m\x1b[33m'\x1b[39;49;00m,\x1b[37m   "
-                        "\x1b[39;49;00m\x1b[33m'\x1b[39;49;00m\x1b[33mThis\x1b[39;49;00m\x1b[31m "
-                        '\x1b[39;49;00m\x1b[33moption\x1b[39;49;00m\x1b[31m '
-                        '\x1b[39;49;00m\x1b[33mdisables\x1b[39;49;00m\x1b[31m '
-                        '\x1b[39;49;00m\x1b[33mother\x1b[39;49;00m\x1b[31m '
-                        "\x1b[39;49;00m\x1b[33moptions\x1b[39;49;00m\x1b[33m'\x1b[39;49;00m,\x1b[37m "
-                        '\x1b[39;49;00m\x1b[31mnull\x1b[39;49;00m,\x1b[37m '
-                        "\x1b[39;49;00m[\x1b[33m'\x1b[39;49;00m\x1b[33mflag\x1b[39;49;00m\x1b[33m'\x1b[39;49;00m,\x1b[37m "
-                        "\x1b[39;49;00m\x1b[33m'\x1b[39;49;00m\x1b[33mnodesc\x1b[39;49;00m\x1b[33m'\x1b[39;49;00m,\x1b[37m "
-                        "\x1b[39;49;00m\x1b[33m'\x1b[39;49;00m\x1b[33mnocomp\x1b[39;49;00m\x1b[33m'\x1b[39;49;00m]],\x1b[37m\x1b[39;49;00m\n"
-                        '\x1b[37m      '
-                        "\x1b[39;49;00m[\x1b[33m'\x1b[39;49;00m\x1b[33mcheck\x1b[39;49;00m\x1b[33m'\x1b[39;49;00m,\x1b[37m       "
-                        "\x1b[39;49;00m\x1b[33m'\x1b[39;49;00m\x1b[33mSpecify\x1b[39;49;00m\x1b[31m "
-                        '\x1b[39;49;00m\x1b[33mfile\x1b[39;49;00m\x1b[31m '
-                        '\x1b[39;49;00m\x1b[33mname\x1b[39;49;00m\x1b[31m '
-                        "\x1b[39;49;00m\x1b[33mconversions\x1b[39;49;00m\x1b[33m'\x1b[39;49;00m,\x1b[37m "
-                        "\x1b[39;49;00m[\x1b[33m'\x1b[39;49;00m\x1b[33mchoices\x1b[39;49;00m\x1b[33m'\x1b[39;49;00m,\x1b[37m "
-                        '\x1b[39;49;00m{\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m        '
-                        "\x1b[39;49;00m\x1b[33m'\x1b[39;49;00m\x1b[33mrelaxed\x1b[39;49;00m\x1b[33m'\x1b[39;49;00m:\x1b[37m "
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mconvert\x1b[39;49;00m\x1b[31m '
-                        '\x1b[39;49;00m\x1b[33mto\x1b[39;49;00m\x1b[31m '
-                        '\x1b[39;49;00m\x1b[33mlowercase\x1b[39;49;00m\x1b[31m '
-                        '\x1b[39;49;00m\x1b[33mbefore\x1b[39;49;00m\x1b[31m '
-                        '\x1b[39;49;00m\x1b[33mlookup\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m,\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m        '
-                        "\x1b[39;49;00m\x1b[33m'\x1b[39;49;00m\x1b[33mstrict\x1b[39;49;00m\x1b[33m'\x1b[39;49;00m:\x1b[37m "
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mno\x1b[39;49;00m\x1b[31m '
-                        '\x1b[39;49;00m\x1b[33mconversion\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m      '
-                        '\x1b[39;49;00m}]]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m    \x1b[39;49;00m]]\x1b[37m\x1b[39;49;00m\n',
-  'implemented': None,
-  'long': 'The first argument is the separator used for delimiting the '
-          'key-value pairs.\n'
-          '\n'
-          'The second argument is the separator used for delimiting the value '
-          'from the key.\n'
-          '\n'
-          'The third argument is a list of definitions, like:\n'
-          '\n'
-          '  `[ [<key>, <description>, <completer>], ... ]`\n'
-          '\n'
-          '  -- OR --\n'
-          '\n'
-          '  `[ [<key>, <description>, <completer>, <excludes>], ... ]`\n'
-          '\n'
-          '`excludes` is a list of keys that should no longer be offered once '
-          'a key has been used.\n'
-          '\n'
-          'By default, each key is offered for completion only once.\n'
-          'To allow a key to be completed multiple times, prefix its name with '
-          '`*`.\n'
-          '\n'
-          'If a key does not take an argument, use `null` as completer.\n'
-          '\n'
-          'If a key does take an argument but cannot be completed, use '
-          "`['none']` as completer.\n",
-  'long_colored': 'The first argument is the separator used for delimiting the '
-                  'key-value pairs.\x1b[37m\x1b[39;49;00m\n'
-                  '\x1b[37m\x1b[39;49;00m\n'
-                  'The second argument is the separator used for delimiting '
-                  'the value from the key.\x1b[37m\x1b[39;49;00m\n'
-                  '\x1b[37m\x1b[39;49;00m\n'
-                  'The third argument is a list of definitions, '
-                  'like:\x1b[37m\x1b[39;49;00m\n'
-                  '\x1b[37m\x1b[39;49;00m\n'
-                  '  \x1b[33m`[ [<key>, <description>, <completer>], ... '
-                  ']`\x1b[39;49;00m\x1b[37m\x1b[39;49;00m\n'
-                  '\x1b[37m\x1b[39;49;00m\n'
-                  '  -- OR --\x1b[37m\x1b[39;49;00m\n'
-                  '\x1b[37m\x1b[39;49;00m\n'
-                  '  \x1b[33m`[ [<key>, <description>, <completer>, '
-                  '<excludes>], ... ]`\x1b[39;49;00m\x1b[37m\x1b[39;49;00m\n'
-                  '\n'
-                  '\x1b[33m`excludes`\x1b[39;49;00m is a list of keys that '
-                  'should no longer be offered once a key has been '
-                  'used.\x1b[37m\x1b[39;49;00m\n'
-                  '\x1b[37m\x1b[39;49;00m\n'
-                  'By default, each key is offered for completion only '
-                  'once.\x1b[37m\x1b[39;49;00m\n'
-                  'To allow a key to be completed multiple times, prefix its '
-                  'name with \x1b[33m`*`\x1b[39;49;00m.\x1b[37m\x1b[39;49;00m\n'
-                  '\x1b[37m\x1b[39;49;00m\n'
-                  'If a key does not take an argument, use '
-                  '\x1b[33m`null`\x1b[39;49;00m as '
-                  'completer.\x1b[37m\x1b[39;49;00m\n'
-                  '\x1b[37m\x1b[39;49;00m\n'
-                  'If a key does take an argument but cannot be completed, use '
-                  "\x1b[33m`['none']`\x1b[39;49;00m as "
-                  'completer.\x1b[37m\x1b[39;49;00m\n',
-  'notes': [],
-  'output': '~ > example --key-value-list flag,user=<TAB>\n'
-            'bin                     braph\n'
-            'colord                  dbus\n'
-            'dhcpcd                  git\n',
-  'short': 'Complete a comma-separated list of key=value pairs'},
- {'also': {'key_value_list': 'For completing a comma-separated list of '
-                             'key=value pairs'},
-  'category': 'custom',
-  'command': 'key_value_list_exec',
-  'definition': 'prog: "example"\n'
-                'options:\n'
-                '  - option_strings: ["-o"]\n'
-                '    complete: ["key_value_list_exec", ",", "=", '
-                '"_complete_key_value_list"]\n',
-  'definition_colored': '\x1b[94mprog\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mexample\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[94moptions\x1b[39;49;00m:\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m  \x1b[39;49;00m-\x1b[37m '
-                        '\x1b[39;49;00m\x1b[94moption_strings\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33m-o\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m    '
-                        '\x1b[39;49;00m\x1b[94mcomplete\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33mkey_value_list_exec\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m,\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33m,\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m,\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33m=\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m,\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33m_complete_key_value_list\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n',
-  'implemented': None,
-  'long': 'The first argument is the separator used for delimiting the '
-          'key-value pairs.\n'
-          '\n'
-          'The second argument is the separator used for delimiting the value '
-          'from the key.\n'
-          '\n'
-          'The third argument is a command for generating the available '
-          'options and their\n'
-          'possible values.\n'
-          '\n'
-          'If the command is called without any arguments, then a list of '
-          'available keys\n'
-          'is expected.\n'
-          'The output must be in form of:\n'
-          '\n'
-          '```\n'
-          '[*]<key_1>[=][?]\\t<description_1>\\t<excludes>\\n\n'
-          '[*]<key_2>[=][?]\\t<description_2>\\t<excludes>\\n\n'
-          '[...]\n'
-          '```\n'
-          '\n'
-          'If the command is called with one argument, then a list of '
-          'completions for\n'
-          'the given key is expected.\n'
-          '\n'
-          '```\n'
-          '<item_1>\\t<description_1>\\n\n'
-          '<item_2>\\t<description_2>\\n\n'
-          '[...]\n'
-          '```\n'
-          '\n'
-          'Example function:\n'
-          '\n'
-          '```\n'
-          '_complete_key_value_list() {\n'
-          '  if (( $# == 0 )); then\n'
-          "    printf '%s\\t%s\\t%s\\n'                                 \\\n"
-          "      'flag'        'option without an argument'       '' \\\n"
-          "      'argument='   'option with an argument'          '' \\\n"
-          "      'optional=?'  'option with an optional argument' '' \\\n"
-          "      '*repeatable' 'a repeatable option'              '' \\\n"
-          "      'excludes'    'disable options'                  'flag "
-          "argument'\n"
-          '  else\n'
-          '    case "$1" in\n'
-          '      argument|optional)\n'
-          "        printf '%s\\t%s\\n'     \\\n"
-          "          'foo' 'a foo value' \\\n"
-          "          'bar' 'a bar value';;\n"
-          '      esac\n'
-          '  fi\n'
-          '}\n'
-          '```\n',
-  'long_colored': 'The first argument is the separator used for delimiting the '
-                  'key-value pairs.\x1b[37m\x1b[39;49;00m\n'
-                  '\x1b[37m\x1b[39;49;00m\n'
-                  'The second argument is the separator used for delimiting '
-                  'the value from the key.\x1b[37m\x1b[39;49;00m\n'
-                  '\x1b[37m\x1b[39;49;00m\n'
-                  'The third argument is a command for generating the '
-                  'available options and their\x1b[37m\x1b[39;49;00m\n'
-                  'possible values.\x1b[37m\x1b[39;49;00m\n'
-                  '\x1b[37m\x1b[39;49;00m\n'
-                  'If the command is called without any arguments, then a list '
-                  'of available keys\x1b[37m\x1b[39;49;00m\n'
-                  'is expected.\x1b[37m\x1b[39;49;00m\n'
-                  'The output must be in form of:\x1b[37m\x1b[39;49;00m\n'
-                  '\x1b[33m\x1b[39;49;00m\n'
-                  '\x1b[33m```\x1b[39;49;00m\n'
-                  '\x1b[33m[*]<key_1>[=][?]\\t<description_1>\\t<excludes>\\n\x1b[39;49;00m\n'
-                  '\x1b[33m[*]<key_2>[=][?]\\t<description_2>\\t<excludes>\\n\x1b[39;49;00m\n'
-                  '\x1b[33m[...]\x1b[39;49;00m\n'
-                  '\x1b[33m```\x1b[39;49;00m\n'
-                  '\x1b[37m\x1b[39;49;00m\n'
-                  'If the command is called with one argument, then a list of '
-                  'completions for\x1b[37m\x1b[39;49;00m\n'
-                  'the given key is expected.\x1b[37m\x1b[39;49;00m\n'
-                  '\x1b[33m\x1b[39;49;00m\n'
-                  '\x1b[33m```\x1b[39;49;00m\n'
-                  '\x1b[33m<item_1>\\t<description_1>\\n\x1b[39;49;00m\n'
-                  '\x1b[33m<item_2>\\t<description_2>\\n\x1b[39;49;00m\n'
-                  '\x1b[33m[...]\x1b[39;49;00m\n'
-                  '\x1b[33m```\x1b[39;49;00m\n'
-                  '\x1b[37m\x1b[39;49;00m\n'
-                  'Example function:\x1b[37m\x1b[39;49;00m\n'
-                  '\x1b[33m\x1b[39;49;00m\n'
-                  '\x1b[33m```\x1b[39;49;00m\n'
-                  '\x1b[33m_complete_key_value_list() {\x1b[39;49;00m\n'
-                  '\x1b[33m  if (( $# == 0 )); then\x1b[39;49;00m\n'
-                  '\x1b[33m    printf '
-                  "'%s\\t%s\\t%s\\n'                                 "
-                  '\\\x1b[39;49;00m\n'
-                  "\x1b[33m      'flag'        'option without an "
-                  "argument'       '' \\\x1b[39;49;00m\n"
-                  "\x1b[33m      'argument='   'option with an "
-                  "argument'          '' \\\x1b[39;49;00m\n"
-                  "\x1b[33m      'optional=?'  'option with an optional "
-                  "argument' '' \\\x1b[39;49;00m\n"
-                  "\x1b[33m      '*repeatable' 'a repeatable "
-                  "option'              '' \\\x1b[39;49;00m\n"
-                  "\x1b[33m      'excludes'    'disable "
-                  "options'                  'flag argument'\x1b[39;49;00m\n"
-                  '\x1b[33m  else\x1b[39;49;00m\n'
-                  '\x1b[33m    case "$1" in\x1b[39;49;00m\n'
-                  '\x1b[33m      argument|optional)\x1b[39;49;00m\n'
-                  "\x1b[33m        printf '%s\\t%s\\n'     \\\x1b[39;49;00m\n"
-                  "\x1b[33m          'foo' 'a foo value' \\\x1b[39;49;00m\n"
-                  "\x1b[33m          'bar' 'a bar value';;\x1b[39;49;00m\n"
-                  '\x1b[33m      esac\x1b[39;49;00m\n'
-                  '\x1b[33m  fi\x1b[39;49;00m\n'
-                  '\x1b[33m}\x1b[39;49;00m\n'
-                  '\x1b[33m```\x1b[39;49;00m\n',
-  'notes': ['Functions can be put inside a file and included with '
-            '`--include-file`'],
-  'output': '~ > example -o <TAB>\n'
-            'argument      -- option with an argument\n'
-            'excludes      -- disable options\n'
-            'flag          -- option without an argument\n'
-            'optional      -- option with an optional argument\n'
-            'repeatable    -- a repeatable option\n'
-            '\n'
-            '~ > example -o argument=<TAB>\n'
-            'foo    -- a foo value\n'
-            'bar    -- a bar value\n'
-            '\n'
-            '~ > example -o excludes,<TAB>\n'
-            'optional    -- option with an optional argument\n'
-            'repeatable  -- a repeatable option\n',
-  'short': 'Complete a comma-separted list of key=value pairs (dynamically '
-           'generated by a function)'},
- {'also': {'key_value_list': 'For completing a comma-separated list of '
-                             'key=value pairs',
-           'key_value_pair_exec': 'For completing a single key=value pair '
-                                  '(dynamically generated by a function)'},
-  'category': 'meta',
-  'command': 'key_value_pair',
-  'definition': 'prog: "example"\n'
-                'options:\n'
-                '  - option_strings: ["--key-value-pair"]\n'
-                '    complete: ["key_value_pair", "=", [\n'
-                "      ['flag',   'An option flag', null],\n"
-                "      ['nodesc', null, null],\n"
-                "      ['nocomp', 'An option with arg but without completer', "
-                "['none']],\n"
-                "      ['user',   'Takes a username',  ['user']],\n"
-                "      ['check',  'Specify file name conversions', ['choices', "
-                '{\n'
-                '        \'relaxed\': "convert to lowercase before lookup",\n'
-                '        \'strict\': "no conversion"\n'
-                '      }]]\n'
-                '    ]]\n',
-  'definition_colored': '\x1b[94mprog\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mexample\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[94moptions\x1b[39;49;00m:\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m  \x1b[39;49;00m-\x1b[37m '
-                        '\x1b[39;49;00m\x1b[94moption_strings\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33m--key-value-pair\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m    '
-                        '\x1b[39;49;00m\x1b[94mcomplete\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33mkey_value_pair\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m,\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33m=\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m,\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m      '
-                        "\x1b[39;49;00m[\x1b[33m'\x1b[39;49;00m\x1b[33mflag\x1b[39;49;00m\x1b[33m'\x1b[39;49;00m,\x1b[37m   "
-                        "\x1b[39;49;00m\x1b[33m'\x1b[39;49;00m\x1b[33mAn\x1b[39;49;00m\x1b[31m "
-                        '\x1b[39;49;00m\x1b[33moption\x1b[39;49;00m\x1b[31m '
-                        "\x1b[39;49;00m\x1b[33mflag\x1b[39;49;00m\x1b[33m'\x1b[39;49;00m,\x1b[37m "
-                        '\x1b[39;49;00m\x1b[31mnull\x1b[39;49;00m],\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m      '
-                        "\x1b[39;49;00m[\x1b[33m'\x1b[39;49;00m\x1b[33mnodesc\x1b[39;49;00m\x1b[33m'\x1b[39;49;00m,\x1b[37m "
-                        '\x1b[39;49;00m\x1b[31mnull\x1b[39;49;00m,\x1b[37m '
-                        '\x1b[39;49;00m\x1b[31mnull\x1b[39;49;00m],\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m      '
-                        "\x1b[39;49;00m[\x1b[33m'\x1b[39;49;00m\x1b[33mnocomp\x1b[39;49;00m\x1b[33m'\x1b[39;49;00m,\x1b[37m "
-                        "\x1b[39;49;00m\x1b[33m'\x1b[39;49;00m\x1b[33mAn\x1b[39;49;00m\x1b[31m "
-                        '\x1b[39;49;00m\x1b[33moption\x1b[39;49;00m\x1b[31m '
-                        '\x1b[39;49;00m\x1b[33mwith\x1b[39;49;00m\x1b[31m '
-                        '\x1b[39;49;00m\x1b[33marg\x1b[39;49;00m\x1b[31m '
-                        '\x1b[39;49;00m\x1b[33mbut\x1b[39;49;00m\x1b[31m '
-                        '\x1b[39;49;00m\x1b[33mwithout\x1b[39;49;00m\x1b[31m '
-                        "\x1b[39;49;00m\x1b[33mcompleter\x1b[39;49;00m\x1b[33m'\x1b[39;49;00m,\x1b[37m "
-                        "\x1b[39;49;00m[\x1b[33m'\x1b[39;49;00m\x1b[33mnone\x1b[39;49;00m\x1b[33m'\x1b[39;49;00m]],\x1b[37m\x1b[39;49;00m\n"
-                        '\x1b[37m      '
-                        "\x1b[39;49;00m[\x1b[33m'\x1b[39;49;00m\x1b[33muser\x1b[39;49;00m\x1b[33m'\x1b[39;49;00m,\x1b[37m   "
-                        "\x1b[39;49;00m\x1b[33m'\x1b[39;49;00m\x1b[33mTakes\x1b[39;49;00m\x1b[31m "
-                        '\x1b[39;49;00m\x1b[33ma\x1b[39;49;00m\x1b[31m '
-                        "\x1b[39;49;00m\x1b[33musername\x1b[39;49;00m\x1b[33m'\x1b[39;49;00m,\x1b[37m  "
-                        "\x1b[39;49;00m[\x1b[33m'\x1b[39;49;00m\x1b[33muser\x1b[39;49;00m\x1b[33m'\x1b[39;49;00m]],\x1b[37m\x1b[39;49;00m\n"
-                        '\x1b[37m      '
-                        "\x1b[39;49;00m[\x1b[33m'\x1b[39;49;00m\x1b[33mcheck\x1b[39;49;00m\x1b[33m'\x1b[39;49;00m,\x1b[37m  "
-                        "\x1b[39;49;00m\x1b[33m'\x1b[39;49;00m\x1b[33mSpecify\x1b[39;49;00m\x1b[31m "
-                        '\x1b[39;49;00m\x1b[33mfile\x1b[39;49;00m\x1b[31m '
-                        '\x1b[39;49;00m\x1b[33mname\x1b[39;49;00m\x1b[31m '
-                        "\x1b[39;49;00m\x1b[33mconversions\x1b[39;49;00m\x1b[33m'\x1b[39;49;00m,\x1b[37m "
-                        "\x1b[39;49;00m[\x1b[33m'\x1b[39;49;00m\x1b[33mchoices\x1b[39;49;00m\x1b[33m'\x1b[39;49;00m,\x1b[37m "
-                        '\x1b[39;49;00m{\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m        '
-                        "\x1b[39;49;00m\x1b[33m'\x1b[39;49;00m\x1b[33mrelaxed\x1b[39;49;00m\x1b[33m'\x1b[39;49;00m:\x1b[37m "
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mconvert\x1b[39;49;00m\x1b[31m '
-                        '\x1b[39;49;00m\x1b[33mto\x1b[39;49;00m\x1b[31m '
-                        '\x1b[39;49;00m\x1b[33mlowercase\x1b[39;49;00m\x1b[31m '
-                        '\x1b[39;49;00m\x1b[33mbefore\x1b[39;49;00m\x1b[31m '
-                        '\x1b[39;49;00m\x1b[33mlookup\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m,\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m        '
-                        "\x1b[39;49;00m\x1b[33m'\x1b[39;49;00m\x1b[33mstrict\x1b[39;49;00m\x1b[33m'\x1b[39;49;00m:\x1b[37m "
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mno\x1b[39;49;00m\x1b[31m '
-                        '\x1b[39;49;00m\x1b[33mconversion\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m      '
-                        '\x1b[39;49;00m}]]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m    \x1b[39;49;00m]]\x1b[37m\x1b[39;49;00m\n',
-  'implemented': None,
-  'long': 'The first argument is the separator used for delimiting the value '
-          'from the key.\n'
-          '\n'
-          'The second argument is a list of key-description-completer '
-          'definitions, like:\n'
-          '\n'
-          '  `[ [<key>, <description>, <completer>], ... ]`\n'
-          '\n'
-          'If a key does not take an argument, use `null` as completer.\n'
-          '\n'
-          'If a key does take an argument but cannot be completed, use '
-          "`['none']` as completer.\n",
-  'long_colored': 'The first argument is the separator used for delimiting the '
-                  'value from the key.\x1b[37m\x1b[39;49;00m\n'
-                  '\x1b[37m\x1b[39;49;00m\n'
-                  'The second argument is a list of key-description-completer '
-                  'definitions, like:\x1b[37m\x1b[39;49;00m\n'
-                  '\x1b[37m\x1b[39;49;00m\n'
-                  '  \x1b[33m`[ [<key>, <description>, <completer>], ... '
-                  ']`\x1b[39;49;00m\x1b[37m\x1b[39;49;00m\n'
-                  '\x1b[37m\x1b[39;49;00m\n'
-                  'If a key does not take an argument, use '
-                  '\x1b[33m`null`\x1b[39;49;00m as '
-                  'completer.\x1b[37m\x1b[39;49;00m\n'
-                  '\x1b[37m\x1b[39;49;00m\n'
-                  'If a key does take an argument but cannot be completed, use '
-                  "\x1b[33m`['none']`\x1b[39;49;00m as "
-                  'completer.\x1b[37m\x1b[39;49;00m\n',
-  'notes': [],
-  'output': '~ > example --key-value-pair <TAB>\n'
-            'animal  -- select an animal\n'
-            'async   -- set async mode\n'
-            'nocomp  -- no completer\n'
-            'number  -- select a number\n'
-            'proc    -- select a process\n'
-            'user    -- sel\n'
-            '\n'
-            '~ > example --key-value-pair user=<TAB>\n'
-            'bin                     braph\n'
-            'colord                  dbus\n'
-            'dhcpcd                  git\n',
-  'short': 'Complete a single key=value pair'},
- {'also': {'key_value_pair': 'For completing a single key=value pair'},
-  'category': 'custom',
-  'command': 'key_value_pair_exec',
-  'definition': 'prog: "example"\n'
-                'options:\n'
-                '  - option_strings: ["-o"]\n'
-                '    complete: ["key_value_pair_exec", "=", '
-                '"_complete_key_value_pair"]\n',
-  'definition_colored': '\x1b[94mprog\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mexample\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[94moptions\x1b[39;49;00m:\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m  \x1b[39;49;00m-\x1b[37m '
-                        '\x1b[39;49;00m\x1b[94moption_strings\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33m-o\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m    '
-                        '\x1b[39;49;00m\x1b[94mcomplete\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33mkey_value_pair_exec\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m,\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33m=\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m,\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33m_complete_key_value_pair\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n',
-  'implemented': None,
-  'long': 'The first argument is the separator used for delimiting the value '
-          'from the key.\n'
-          '\n'
-          'The second argument is a command for generating the available '
-          'options and their\n'
-          'possible values.\n'
-          '\n'
-          'The third argument is a command for generating the available '
-          'options and their\n'
-          'possible values.\n'
-          '\n'
-          'If the command is called without any arguments, then a list of '
-          'available keys\n'
-          'is expected.\n'
-          'The output must be in form of:\n'
-          '\n'
-          '```\n'
-          '<key_1>[=]\\t<description_1>\\n\n'
-          '<key_2>[=]\\t<description_2>\\n\n'
-          '[...]\n'
-          '```\n'
-          '\n'
-          'If the command is called with one argument, then a list of '
-          'completions for\n'
-          'the given key is expected.\n'
-          '\n'
-          '```\n'
-          '<item_1>\\t<description_1>\\n\n'
-          '<item_2>\\t<description_2>\\n\n'
-          '[...]\n'
-          '```\n'
-          '\n'
-          'Example function:\n'
-          '\n'
-          '```\n'
-          '_complete_key_value_pair() {\n'
-          '  if (( $# == 0 )); then\n'
-          "    printf '%s\\t%s\\n'    \\\n"
-          "      'flag'    'a flag' \\\n"
-          "      'option=' 'option with value'\n"
-          '  else\n'
-          '    case "$1" in\n'
-          '      option)\n'
-          "        printf '%s\\t%s\\n'     \\\n"
-          "          'foo' 'a foo value' \\\n"
-          "          'bar' 'a bar value';;\n"
-          '      esac\n'
-          '  fi\n'
-          '}\n'
-          '```\n',
-  'long_colored': 'The first argument is the separator used for delimiting the '
-                  'value from the key.\x1b[37m\x1b[39;49;00m\n'
-                  '\x1b[37m\x1b[39;49;00m\n'
-                  'The second argument is a command for generating the '
-                  'available options and their\x1b[37m\x1b[39;49;00m\n'
-                  'possible values.\x1b[37m\x1b[39;49;00m\n'
-                  '\x1b[37m\x1b[39;49;00m\n'
-                  'The third argument is a command for generating the '
-                  'available options and their\x1b[37m\x1b[39;49;00m\n'
-                  'possible values.\x1b[37m\x1b[39;49;00m\n'
-                  '\x1b[37m\x1b[39;49;00m\n'
-                  'If the command is called without any arguments, then a list '
-                  'of available keys\x1b[37m\x1b[39;49;00m\n'
-                  'is expected.\x1b[37m\x1b[39;49;00m\n'
-                  'The output must be in form of:\x1b[37m\x1b[39;49;00m\n'
-                  '\x1b[33m\x1b[39;49;00m\n'
-                  '\x1b[33m```\x1b[39;49;00m\n'
-                  '\x1b[33m<key_1>[=]\\t<description_1>\\n\x1b[39;49;00m\n'
-                  '\x1b[33m<key_2>[=]\\t<description_2>\\n\x1b[39;49;00m\n'
-                  '\x1b[33m[...]\x1b[39;49;00m\n'
-                  '\x1b[33m```\x1b[39;49;00m\n'
-                  '\x1b[37m\x1b[39;49;00m\n'
-                  'If the command is called with one argument, then a list of '
-                  'completions for\x1b[37m\x1b[39;49;00m\n'
-                  'the given key is expected.\x1b[37m\x1b[39;49;00m\n'
-                  '\x1b[33m\x1b[39;49;00m\n'
-                  '\x1b[33m```\x1b[39;49;00m\n'
-                  '\x1b[33m<item_1>\\t<description_1>\\n\x1b[39;49;00m\n'
-                  '\x1b[33m<item_2>\\t<description_2>\\n\x1b[39;49;00m\n'
-                  '\x1b[33m[...]\x1b[39;49;00m\n'
-                  '\x1b[33m```\x1b[39;49;00m\n'
-                  '\x1b[37m\x1b[39;49;00m\n'
-                  'Example function:\x1b[37m\x1b[39;49;00m\n'
-                  '\x1b[33m\x1b[39;49;00m\n'
-                  '\x1b[33m```\x1b[39;49;00m\n'
-                  '\x1b[33m_complete_key_value_pair() {\x1b[39;49;00m\n'
-                  '\x1b[33m  if (( $# == 0 )); then\x1b[39;49;00m\n'
-                  "\x1b[33m    printf '%s\\t%s\\n'    \\\x1b[39;49;00m\n"
-                  "\x1b[33m      'flag'    'a flag' \\\x1b[39;49;00m\n"
-                  "\x1b[33m      'option=' 'option with value'\x1b[39;49;00m\n"
-                  '\x1b[33m  else\x1b[39;49;00m\n'
-                  '\x1b[33m    case "$1" in\x1b[39;49;00m\n'
-                  '\x1b[33m      option)\x1b[39;49;00m\n'
-                  "\x1b[33m        printf '%s\\t%s\\n'     \\\x1b[39;49;00m\n"
-                  "\x1b[33m          'foo' 'a foo value' \\\x1b[39;49;00m\n"
-                  "\x1b[33m          'bar' 'a bar value';;\x1b[39;49;00m\n"
-                  '\x1b[33m      esac\x1b[39;49;00m\n'
-                  '\x1b[33m  fi\x1b[39;49;00m\n'
-                  '\x1b[33m}\x1b[39;49;00m\n'
-                  '\x1b[33m```\x1b[39;49;00m\n',
-  'notes': ['Functions can be put inside a file and included with '
-            '`--include-file`'],
-  'output': '~ > example -o <TAB>\n'
-            'flag    -- a flag\n'
-            'option  -- option with value\n'
-            '\n'
-            '~ > example -o option=<TAB>\n'
-            'foo     -- a foo value\n'
-            'bar     -- a bar value\n',
-  'short': 'Complete a key=value pair (dynamically generated by a function)'},
- {'also': {'directory_list': 'For completing a comma-separated list of '
-                             'directories',
-           'file_list': 'For completing a comma-separated list of files',
-           'key_value_list': 'For completing a comma-separated list of '
-                             'key=value pairs',
-           'value_list': 'For completing a comma-separated list of values'},
-  'category': 'meta',
-  'command': 'list',
-  'definition': 'prog: "example"\n'
-                'options:\n'
-                '  - option_strings: ["--user-list"]\n'
-                '    complete: ["list", ["user"]]\n'
-                '  - option_strings: ["--option-list"]\n'
-                '    complete: ["list", ["choices", ["setuid", "async", '
-                '"block"]], {"separator": ":"}]\n',
-  'definition_colored': '\x1b[94mprog\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mexample\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[94moptions\x1b[39;49;00m:\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m  \x1b[39;49;00m-\x1b[37m '
-                        '\x1b[39;49;00m\x1b[94moption_strings\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33m--user-list\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m    '
-                        '\x1b[39;49;00m\x1b[94mcomplete\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33mlist\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m,\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33muser\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m  \x1b[39;49;00m-\x1b[37m '
-                        '\x1b[39;49;00m\x1b[94moption_strings\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33m--option-list\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m    '
-                        '\x1b[39;49;00m\x1b[94mcomplete\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33mlist\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m,\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33mchoices\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m,\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33msetuid\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m,\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33masync\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m,\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mblock\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]],\x1b[37m '
-                        '\x1b[39;49;00m{\x1b[33m"\x1b[39;49;00m\x1b[33mseparator\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33m:\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m}]\x1b[37m\x1b[39;49;00m\n',
-  'implemented': None,
-  'long': 'The separator can be changed by adding `{"separator": ...}`.\n'
-          '\n'
-          'By default, duplicate values are not offered for completion. This '
-          'can be changed by adding `{"duplicates": true}`.\n',
-  'long_colored': 'The separator can be changed by adding '
-                  '\x1b[33m`{"separator": '
-                  '...}`\x1b[39;49;00m.\x1b[37m\x1b[39;49;00m\n'
-                  '\x1b[37m\x1b[39;49;00m\n'
-                  'By default, duplicate values are not offered for '
-                  'completion. This can be changed by adding '
-                  '\x1b[33m`{"duplicates": '
-                  'true}`\x1b[39;49;00m.\x1b[37m\x1b[39;49;00m\n',
-  'notes': [],
-  'output': '~ > example --user-list=avahi,daemon,<TAB>\n'
-            'bin                     braph\n'
-            'colord                  dbus\n'
-            'dhcpcd                  git\n',
-  'short': 'Complete a comma-separated list of any completer'},
- {'also': None,
-  'category': 'bonus',
-  'command': 'locale',
-  'definition': 'prog: "example"\n'
-                'options:\n'
-                '  - option_strings: ["--locale"]\n'
-                '    complete: ["locale"]\n',
-  'definition_colored': '\x1b[94mprog\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mexample\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[94moptions\x1b[39;49;00m:\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m  \x1b[39;49;00m-\x1b[37m '
-                        '\x1b[39;49;00m\x1b[94moption_strings\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33m--locale\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m    '
-                        '\x1b[39;49;00m\x1b[94mcomplete\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33mlocale\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n',
-  'implemented': None,
-  'long': None,
-  'long_colored': None,
-  'notes': [],
-  'output': '~ > example --locale=<TAB>\n'
-            'C  C.UTF-8  de_DE  de_DE@euro  de_DE.iso88591  '
-            'de_DE.iso885915@euro\n'
-            'de_DE.UTF-8  deutsch  en_US  en_US.iso88591  en_US.UTF-8  german  '
-            'POSIX\n',
-  'short': 'Complete a locale'},
- {'also': None,
-  'category': 'bonus',
-  'command': 'login_shell',
-  'definition': 'prog: "example"\n'
-                'options:\n'
-                '  - option_strings: ["--login-shell"]\n'
-                '    complete: ["login_shell"]\n',
-  'definition_colored': '\x1b[94mprog\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mexample\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[94moptions\x1b[39;49;00m:\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m  \x1b[39;49;00m-\x1b[37m '
-                        '\x1b[39;49;00m\x1b[94moption_strings\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33m--login-shell\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m    '
-                        '\x1b[39;49;00m\x1b[94mcomplete\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33mlogin_shell\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n',
-  'implemented': None,
-  'long': None,
-  'long_colored': None,
-  'notes': [],
-  'output': '~ > example --login-shell=<TAB>\n'
-            '/bin/bash   /bin/sh         /usr/bin/fish       /usr/bin/sh\n'
-            '[...]\n',
-  'short': 'Complete a login shell'},
- {'also': None,
-  'category': 'basic',
-  'command': 'mime_file',
-  'definition': 'prog: "example"\n'
-                'options:\n'
-                '  - option_strings: ["--image"]\n'
-                '    complete: ["mime_file", \'image/\']\n',
-  'definition_colored': '\x1b[94mprog\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mexample\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[94moptions\x1b[39;49;00m:\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m  \x1b[39;49;00m-\x1b[37m '
-                        '\x1b[39;49;00m\x1b[94moption_strings\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33m--image\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m    '
-                        '\x1b[39;49;00m\x1b[94mcomplete\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33mmime_file\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m,\x1b[37m '
-                        "\x1b[39;49;00m\x1b[33m'\x1b[39;49;00m\x1b[33mimage/\x1b[39;49;00m\x1b[33m'\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n",
-  'implemented': None,
-  'long': 'This completer takes an extended regex passed to `grep -E` to '
-          'filter the results.\n',
-  'long_colored': 'This completer takes an extended regex passed to '
-                  '\x1b[33m`grep -E`\x1b[39;49;00m to filter the '
-                  'results.\x1b[37m\x1b[39;49;00m\n',
-  'notes': [],
-  'output': '~ > example --image=<TAB>\ndir1/  dir2/  img.png  img.jpg\n',
-  'short': "Complete a file based on it's MIME-type"},
- {'also': None,
-  'category': 'bonus',
-  'command': 'mountpoint',
-  'definition': 'prog: "example"\n'
-                'options:\n'
-                '  - option_strings: ["--mountpoint"]\n'
-                '    complete: ["mountpoint"]\n',
-  'definition_colored': '\x1b[94mprog\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mexample\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[94moptions\x1b[39;49;00m:\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m  \x1b[39;49;00m-\x1b[37m '
-                        '\x1b[39;49;00m\x1b[94moption_strings\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33m--mountpoint\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m    '
-                        '\x1b[39;49;00m\x1b[94mcomplete\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33mmountpoint\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n',
-  'implemented': None,
-  'long': None,
-  'long_colored': None,
-  'notes': [],
-  'output': '~ > example --mountpoint=<TAB>\n'
-            '/  /boot  /home  /proc  /run  /sys  /tmp\n'
-            '[...]\n',
-  'short': 'Complete a mountpoint'},
- {'also': {'ip_address': 'For completing an ip address'},
-  'category': 'bonus',
-  'command': 'net_interface',
-  'definition': 'prog: "example"\n'
-                'options:\n'
-                '  - option_strings: ["--net-interface"]\n'
-                '    complete: ["net_interface"]\n',
-  'definition_colored': '\x1b[94mprog\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mexample\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[94moptions\x1b[39;49;00m:\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m  \x1b[39;49;00m-\x1b[37m '
-                        '\x1b[39;49;00m\x1b[94moption_strings\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33m--net-interface\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m    '
-                        '\x1b[39;49;00m\x1b[94mcomplete\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33mnet_interface\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n',
-  'implemented': None,
-  'long': None,
-  'long_colored': None,
-  'notes': [],
-  'output': '~ > example --net-interface=<TAB>\n'
-            'eno1  enp1s0  lo  wlo1  wlp2s0\n'
-            '[...]\n',
-  'short': 'Complete a network interface'},
- {'also': None,
-  'category': 'meta',
-  'command': 'none',
-  'definition': 'prog: "example"\n'
-                'options:\n'
-                '  - option_strings: ["--none"]\n'
-                '    complete: ["none"]\n',
-  'definition_colored': '\x1b[94mprog\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mexample\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[94moptions\x1b[39;49;00m:\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m  \x1b[39;49;00m-\x1b[37m '
-                        '\x1b[39;49;00m\x1b[94moption_strings\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33m--none\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m    '
-                        '\x1b[39;49;00m\x1b[94mcomplete\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33mnone\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n',
-  'implemented': None,
-  'long': 'Disables autocompletion for an option but still marks it as '
-          'requiring an argument.\n'
-          '\n'
-          'Without specifying `complete`, the option would not take an '
-          'argument.\n',
-  'long_colored': 'Disables autocompletion for an option but still marks it as '
-                  'requiring an argument.\x1b[37m\x1b[39;49;00m\n'
-                  '\x1b[37m\x1b[39;49;00m\n'
-                  'Without specifying \x1b[33m`complete`\x1b[39;49;00m, the '
-                  'option would not take an argument.\x1b[37m\x1b[39;49;00m\n',
-  'notes': [],
-  'output': '~ > example --none=<TAB>\n<NO OUTPUT>\n',
-  'short': 'No completion, but specifies that an argument is required'},
- {'also': {'process': 'For completing a process name'},
-  'category': 'basic',
-  'command': 'pid',
-  'definition': 'prog: "example"\n'
-                'options:\n'
-                '  - option_strings: ["--pid"]\n'
-                '    complete: ["pid"]\n',
-  'definition_colored': '\x1b[94mprog\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mexample\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[94moptions\x1b[39;49;00m:\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m  \x1b[39;49;00m-\x1b[37m '
-                        '\x1b[39;49;00m\x1b[94moption_strings\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33m--pid\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m    '
-                        '\x1b[39;49;00m\x1b[94mcomplete\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33mpid\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n',
-  'implemented': None,
-  'long': None,
-  'long_colored': None,
-  'notes': [],
-  'output': '~ > example --pid=<TAB>\n'
-            '1       13      166     19      254     31      45\n'
-            '1006    133315  166441  19042   26      32      46\n'
-            '10150   1392    166442  195962  27      33      4609\n',
-  'short': 'Complete a PID'},
- {'also': None,
-  'category': 'meta',
-  'command': 'prefix',
-  'definition': 'prog: "example"\n'
-                'options:\n'
-                '  - option_strings: ["--prefix"]\n'
-                '    complete: ["prefix", "input:", [\'file\']]\n',
-  'definition_colored': '\x1b[94mprog\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mexample\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[94moptions\x1b[39;49;00m:\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m  \x1b[39;49;00m-\x1b[37m '
-                        '\x1b[39;49;00m\x1b[94moption_strings\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33m--prefix\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m    '
-                        '\x1b[39;49;00m\x1b[94mcomplete\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33mprefix\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m,\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33minput:\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m,\x1b[37m '
-                        "\x1b[39;49;00m[\x1b[33m'\x1b[39;49;00m\x1b[33mfile\x1b[39;49;00m\x1b[33m'\x1b[39;49;00m]]\x1b[37m\x1b[39;49;00m\n",
-  'implemented': None,
-  'long': 'The first argument is the prefix that should be used.\n'
-          '\n'
-          'The second argument is a completer.\n',
-  'long_colored': 'The first argument is the prefix that should be '
-                  'used.\x1b[37m\x1b[39;49;00m\n'
-                  '\x1b[37m\x1b[39;49;00m\n'
-                  'The second argument is a completer.\x1b[37m\x1b[39;49;00m\n',
-  'notes': [],
-  'output': '~ > example --prefix=<TAB>\n'
-            '~ > example --prefix=input:\n'
-            '\n'
-            '~ > example --prefix=input:<TAB>\n'
-            '~ > example --prefix=input:file1.txt\n',
-  'short': 'Prefix completion by a string'},
- {'also': {'pid': 'For completing a PID'},
-  'category': 'basic',
-  'command': 'process',
-  'definition': 'prog: "example"\n'
-                'options:\n'
-                '  - option_strings: ["--process"]\n'
-                '    complete: ["process"]\n',
-  'definition_colored': '\x1b[94mprog\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mexample\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[94moptions\x1b[39;49;00m:\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m  \x1b[39;49;00m-\x1b[37m '
-                        '\x1b[39;49;00m\x1b[94moption_strings\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33m--process\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m    '
-                        '\x1b[39;49;00m\x1b[94mcomplete\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33mprocess\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n',
-  'implemented': None,
-  'long': None,
-  'long_colored': None,
-  'notes': [],
-  'output': '~ > example --process=s<TAB>\n'
-            'scsi_eh_0         scsi_eh_1       scsi_eh_2      scsi_eh_3  '
-            'scsi_eh_4\n'
-            'scsi_eh_5         sh              sudo           syndaemon  '
-            'systemd\n'
-            'systemd-journald  systemd-logind  systemd-udevd\n',
-  'short': 'Complete a process name'},
- {'also': None,
-  'category': 'basic',
-  'command': 'range',
-  'definition': 'prog: "example"\n'
-                'options:\n'
-                '  - option_strings: ["--range-1"]\n'
-                '    complete: ["range", 1, 9]\n'
-                '  - option_strings: ["--range-2"]\n'
-                '    complete: ["range", 1, 9, 2]\n',
-  'definition_colored': '\x1b[94mprog\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mexample\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[94moptions\x1b[39;49;00m:\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m  \x1b[39;49;00m-\x1b[37m '
-                        '\x1b[39;49;00m\x1b[94moption_strings\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33m--range-1\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m    '
-                        '\x1b[39;49;00m\x1b[94mcomplete\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33mrange\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m,\x1b[37m '
-                        '\x1b[39;49;00m\x1b[31m1\x1b[39;49;00m,\x1b[37m '
-                        '\x1b[39;49;00m\x1b[31m9\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m  \x1b[39;49;00m-\x1b[37m '
-                        '\x1b[39;49;00m\x1b[94moption_strings\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33m--range-2\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m    '
-                        '\x1b[39;49;00m\x1b[94mcomplete\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33mrange\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m,\x1b[37m '
-                        '\x1b[39;49;00m\x1b[31m1\x1b[39;49;00m,\x1b[37m '
-                        '\x1b[39;49;00m\x1b[31m9\x1b[39;49;00m,\x1b[37m '
-                        '\x1b[39;49;00m\x1b[31m2\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n',
-  'implemented': None,
-  'long': None,
-  'long_colored': None,
-  'notes': [],
-  'output': '~ > example --range-1=<TAB>\n'
-            '1  2  3  4  5  6  7  8  9\n'
-            '~ > example --range-2=<TAB>\n'
-            '1  3  5  7  9\n',
-  'short': 'Complete a range of integers'},
- {'also': None,
-  'category': 'basic',
-  'command': 'service',
-  'definition': 'prog: "example"\n'
-                'options:\n'
-                '  - option_strings: ["--service"]\n'
-                '    complete: ["service"]\n',
-  'definition_colored': '\x1b[94mprog\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mexample\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[94moptions\x1b[39;49;00m:\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m  \x1b[39;49;00m-\x1b[37m '
-                        '\x1b[39;49;00m\x1b[94moption_strings\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33m--service\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m    '
-                        '\x1b[39;49;00m\x1b[94mcomplete\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33mservice\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n',
-  'implemented': None,
-  'long': None,
-  'long_colored': None,
-  'notes': [],
-  'output': '~ > example --service=<TAB>\nTODO\n[...]\n',
-  'short': 'Complete a SystemD service'},
- {'also': None,
-  'category': 'basic',
-  'command': 'signal',
-  'definition': 'prog: "example"\n'
-                'options:\n'
-                '  - option_strings: ["--signal"]\n'
-                '    complete: ["signal"]\n',
-  'definition_colored': '\x1b[94mprog\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mexample\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[94moptions\x1b[39;49;00m:\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m  \x1b[39;49;00m-\x1b[37m '
-                        '\x1b[39;49;00m\x1b[94moption_strings\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33m--signal\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m    '
-                        '\x1b[39;49;00m\x1b[94mcomplete\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33msignal\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n',
-  'implemented': None,
-  'long': None,
-  'long_colored': None,
-  'notes': [],
-  'output': '~ > example --signal=<TAB>\n'
-            'ABRT    -- Process abort signal\n'
-            'ALRM    -- Alarm clock\n'
-            'BUS     -- Access to an undefined portion of a memory object\n'
-            'CHLD    -- Child process terminated, stopped, or continued\n'
-            'CONT    -- Continue executing, if stopped\n'
-            'FPE     -- Erroneous arithmetic operation\n'
-            'HUP     -- Hangup\n'
-            'ILL     -- Illegal instruction\n'
-            'INT     -- Terminal interrupt signal\n'
-            '[...]\n',
-  'short': 'Complete signal names'},
- {'also': None,
-  'category': 'bonus',
-  'command': 'timezone',
-  'definition': 'prog: "example"\n'
-                'options:\n'
-                '  - option_strings: ["--timezone"]\n'
-                '    complete: ["timezone"]\n',
-  'definition_colored': '\x1b[94mprog\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mexample\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[94moptions\x1b[39;49;00m:\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m  \x1b[39;49;00m-\x1b[37m '
-                        '\x1b[39;49;00m\x1b[94moption_strings\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33m--timezone\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m    '
-                        '\x1b[39;49;00m\x1b[94mcomplete\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33mtimezone\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n',
-  'implemented': None,
-  'long': None,
-  'long_colored': None,
-  'notes': [],
-  'output': '~ > example --timezone=Europe/B<TAB>\n'
-            'Belfast     Belgrade    Berlin      Bratislava\n'
-            'Brussels    Bucharest   Budapest    Busingen\n',
-  'short': 'Complete a timezone'},
- {'also': {'user': 'For completing a user name'},
-  'category': 'basic',
-  'command': 'uid',
-  'definition': 'prog: "example"\n'
-                'options:\n'
-                '  - option_strings: ["--uid"]\n'
-                '    complete: ["uid"]\n',
-  'definition_colored': '\x1b[94mprog\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mexample\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[94moptions\x1b[39;49;00m:\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m  \x1b[39;49;00m-\x1b[37m '
-                        '\x1b[39;49;00m\x1b[94moption_strings\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33m--uid\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m    '
-                        '\x1b[39;49;00m\x1b[94mcomplete\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33muid\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n',
-  'implemented': None,
-  'long': None,
-  'long_colored': None,
-  'notes': [],
-  'output': '~ > example --uid=<TAB>\n'
-            '0      -- root\n'
-            '1000   -- braph\n'
-            '102    -- polkitd\n'
-            '133    -- rtkit\n'
-            '14     -- ftp\n'
-            '1      -- bin\n'
-            '2      -- daemon\n'
-            '33     -- http\n'
-            '65534  -- nobody\n'
-            '[...]\n',
-  'short': 'Complete a user id'},
- {'also': {'uid': 'For completing a user id'},
-  'category': 'basic',
-  'command': 'user',
-  'definition': 'prog: "example"\n'
-                'options:\n'
-                '  - option_strings: ["--user"]\n'
-                '    complete: ["user"]\n',
-  'definition_colored': '\x1b[94mprog\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mexample\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[94moptions\x1b[39;49;00m:\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m  \x1b[39;49;00m-\x1b[37m '
-                        '\x1b[39;49;00m\x1b[94moption_strings\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33m--user\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m    '
-                        '\x1b[39;49;00m\x1b[94mcomplete\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33muser\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n',
-  'implemented': None,
-  'long': None,
-  'long_colored': None,
-  'notes': [],
-  'output': '~ > example --user=<TAB>\n'
-            'avahi                   bin                     braph\n'
-            'colord                  daemon                  dbus\n'
-            'dhcpcd                  ftp                     git\n'
-            '[...]\n',
-  'short': 'Complete a username'},
- {'also': {'key_value_list': 'For completing a comma-separated list of '
-                             'key=value pairs',
-           'list': 'For completing a comma-separated list of any completer'},
-  'category': 'basic',
-  'command': 'value_list',
-  'definition': 'prog: "example"\n'
-                'options:\n'
-                '  - option_strings: ["--value-list-1"]\n'
-                '    complete: ["value_list", {"values": ["exec", "noexec"]}]\n'
-                '  - option_strings: ["--value-list-2"]\n'
-                '    complete: ["value_list", {"values": {"one": "Description '
-                '1", "two": "Description 2"}}]\n',
-  'definition_colored': '\x1b[94mprog\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mexample\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[94moptions\x1b[39;49;00m:\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m  \x1b[39;49;00m-\x1b[37m '
-                        '\x1b[39;49;00m\x1b[94moption_strings\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33m--value-list-1\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m    '
-                        '\x1b[39;49;00m\x1b[94mcomplete\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33mvalue_list\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m,\x1b[37m '
-                        '\x1b[39;49;00m{\x1b[33m"\x1b[39;49;00m\x1b[33mvalues\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33mexec\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m,\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mnoexec\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]}]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m  \x1b[39;49;00m-\x1b[37m '
-                        '\x1b[39;49;00m\x1b[94moption_strings\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33m--value-list-2\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m    '
-                        '\x1b[39;49;00m\x1b[94mcomplete\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33mvalue_list\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m,\x1b[37m '
-                        '\x1b[39;49;00m{\x1b[33m"\x1b[39;49;00m\x1b[33mvalues\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m{\x1b[33m"\x1b[39;49;00m\x1b[33mone\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mDescription\x1b[39;49;00m\x1b[31m '
-                        '\x1b[39;49;00m\x1b[33m1\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m,\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mtwo\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mDescription\x1b[39;49;00m\x1b[31m '
-                        '\x1b[39;49;00m\x1b[33m2\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m}}]\x1b[37m\x1b[39;49;00m\n',
-  'implemented': None,
-  'long': 'Complete one or more items from a list of items. Similar to `mount '
-          '-o`.\n'
-          ' \n'
-          'Arguments are supplied by adding `{"values": ...}`.\n'
-          ' \n'
-          'A separator can be supplied by adding `{"separator": ...}` (the '
-          'default is `","`).\n'
-          ' \n'
-          'By default, duplicate values are not offered for completion. This '
-          'can be changed by adding `{"duplicates": true}`.\n',
-  'long_colored': 'Complete one or more items from a list of items. Similar to '
-                  '\x1b[33m`mount -o`\x1b[39;49;00m.\x1b[37m\x1b[39;49;00m\n'
-                  ' \x1b[37m\x1b[39;49;00m\n'
-                  'Arguments are supplied by adding \x1b[33m`{"values": '
-                  '...}`\x1b[39;49;00m.\x1b[37m\x1b[39;49;00m\n'
-                  ' \x1b[37m\x1b[39;49;00m\n'
-                  'A separator can be supplied by adding '
-                  '\x1b[33m`{"separator": ...}`\x1b[39;49;00m (the default is '
-                  '\x1b[33m`","`\x1b[39;49;00m).\x1b[37m\x1b[39;49;00m\n'
-                  ' \x1b[37m\x1b[39;49;00m\n'
-                  'By default, duplicate values are not offered for '
-                  'completion. This can be changed by adding '
-                  '\x1b[33m`{"duplicates": '
-                  'true}`\x1b[39;49;00m.\x1b[37m\x1b[39;49;00m\n',
-  'notes': [],
-  'output': '~ > example --value-list-1=<TAB>\n'
-            'exec    noexec\n'
-            '~ > example --value-list-1=exec,<TAB>\n'
-            'noexec\n'
-            '~ > example --value-list-2=<TAB>\n'
-            'one  -- Description 1\n'
-            'two  -- Description 2\n',
-  'short': 'Complete a comma-separated list of values'},
- {'also': {'environment': 'For completing an environment variable'},
-  'category': 'basic',
-  'command': 'variable',
-  'definition': 'prog: "example"\n'
-                'options:\n'
-                '  - option_strings: ["--variable"]\n'
-                '    complete: ["variable"]\n',
-  'definition_colored': '\x1b[94mprog\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[33mexample\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[94moptions\x1b[39;49;00m:\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m  \x1b[39;49;00m-\x1b[37m '
-                        '\x1b[39;49;00m\x1b[94moption_strings\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33m--variable\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n'
-                        '\x1b[37m    '
-                        '\x1b[39;49;00m\x1b[94mcomplete\x1b[39;49;00m:\x1b[37m '
-                        '\x1b[39;49;00m[\x1b[33m"\x1b[39;49;00m\x1b[33mvariable\x1b[39;49;00m\x1b[33m"\x1b[39;49;00m]\x1b[37m\x1b[39;49;00m\n',
-  'implemented': None,
-  'long': None,
-  'long_colored': None,
-  'notes': [],
-  'output': '~ > example --variable=HO<TAB>\nHOME      HOSTNAME  HOSTTYPE\n',
-  'short': 'Complete a shell variable name'}]
+DATA_FILE = 'manual.data'
+
+
+def _open_data_file():
+    return importlib.resources.files(__package__).joinpath(DATA_FILE).open('rb')
+
+
+def _read_index(fh):
+    return json.loads(fh.readline())
+
+
+def get_topics():
+    '''Return a list of all topics.'''
+
+    with _open_data_file() as fh:
+        return list(_read_index(fh))
+
+
+def get_command(name):
+    '''Return the manual entry for command `name`.
+
+    Raises:
+        CrazyError: If there is no entry for `name`.
+    '''
+
+    with _open_data_file() as fh:
+        index = _read_index(fh)
+
+        try:
+            offset, length = index[name]
+        except KeyError:
+            raise CrazyError("Command not found: %s" % name) from None
+
+        fh.seek(offset, 1)
+        data = fh.read(length)
+
+    return json.loads(zlib.decompress(data))
 
 
 class TerminalFormatter:
     '''Format string for terminals.'''
 
+    # ANSI color codes
+    BLUE    = 94
+    YELLOW  = 33
+    GRAY    = 90
+
     def __init__(self, use_colors, tab_width):
         self.use_colors = use_colors
         self.tab_width = tab_width
@@ -2379,6 +90,55 @@ class TerminalFormatter:
 
         return f"\033[4m{s}\033[0m"
 
+    def color(self, s, color):
+        '''Make colored string.'''
+
+        if not self.use_colors:
+            return s
+
+        return f"\033[{color}m{s}\033[39m"
+
+
+_YAML_KEY = re.compile(r'^([ ]*(?:-[ ]+)?)([\w-]+)(:)', re.MULTILINE)
+
+_YAML_VALUE = re.compile(r'''("(?:[^"\\]|\\.)*"|'[^']*'|(?<!\S)\#.*$)''', re.MULTILINE)
+
+_MARKDOWN_CODE = re.compile(r'(```.*?```|`[^`\n]+`)', re.DOTALL)
+
+
+def _highlight_yaml(text, formatter):
+    '''Colorize a YAML definition.'''
+
+    if not formatter.use_colors:
+        return text
+
+    def highlight_value(match):
+        value = match[1]
+        if value.startswith('#'):
+            return formatter.color(value, formatter.GRAY)
+        return formatter.color(value, formatter.YELLOW)
+
+    lines = []
+    for line in text.split('\n'):
+        key = _YAML_KEY.match(line)
+        if key:
+            prefix = key[1] + formatter.color(key[2], formatter.BLUE) + key[3]
+            line = line[key.end():]
+        else:
+            prefix = ''
+        lines.append(prefix + _YAML_VALUE.sub(highlight_value, line))
+
+    return '\n'.join(lines)
+
+
+def _highlight_markdown(text, formatter):
+    '''Colorize code in a Markdown text.'''
+
+    if not formatter.use_colors:
+        return text
+
+    return _MARKDOWN_CODE.sub(lambda m: formatter.color(m[1], formatter.YELLOW), text)
+
 
 def _make_command_section(command, formatter):
     r = formatter.bold('COMMAND')
@@ -2392,11 +152,8 @@ def _make_description_section(command, formatter):
 
     if command['long']:
         r += '\n\n'
-
-        if formatter.use_colors:
-            r += indent(command['long_colored'].strip(), formatter.tab_width)
-        else:
-            r += indent(command['long'].strip(), formatter.tab_width)
+        r += indent(_highlight_markdown(command['long'].strip(), formatter),
+                    formatter.tab_width)
 
     return r
 
@@ -2404,12 +161,8 @@ def _make_description_section(command, formatter):
 def _make_example_section(command, formatter):
     r = formatter.bold('EXAMPLE')
     r += '\n'
-
-    if formatter.use_colors:
-        r += indent(command['definition_colored'].strip(), formatter.tab_width)
-    else:
-        r += indent(command['definition'].strip(), formatter.tab_width)
-
+    r += indent(_highlight_yaml(command['definition'].strip(), formatter),
+                formatter.tab_width)
     return r
 
 
@@ -2449,14 +202,7 @@ def _make_see_also_section(command, formatter):
 def print_help_for_command(name, use_colors):
     '''Print a manual like help for command `name`.'''
 
-    command = None
-    for cmd in COMMANDS:
-        if cmd['command'] == name:
-            command = cmd
-            break
-
-    if not command:
-        raise CrazyError("Command not found: %s" % name)
+    command = get_command(name)
 
     formatter = TerminalFormatter(use_colors, 4)
 
@@ -2489,8 +235,7 @@ def print_help_topic(topic, use_colors):
     try:
         print_help_for_command(topic, use_colors)
     except CrazyError:
-        commands = [cmd['command'] for cmd in COMMANDS]
         print('Topic not found')
         print('')
         print('Available completers:')
-        print(indent(join_with_wrap(' ', '\n', 40, commands), 4))
+        print(indent(join_with_wrap(' ', '\n', 40, get_topics()), 4))
@@ -3,6 +3,8 @@
 
 '''Classes for generating file output.'''
 
+from . import profiler
+
 
 _GENERATION_NOTICE = '''\
 # This script was generated by crazy-complete.
@@ -68,8 +70,9 @@ class Output:
 
     def add_helper_functions_code(self):
         '''Add helper functions.'''
-        for code in self.helpers.get_used_functions_code():
-            self.add(code)
+        with profiler.phase('helpers'):
+            for code in self.helpers.get_used_functions_code():
+                self.add(code)
 
     def add_vim_modeline(self, shell):
         '''Add the vim modeline.'''
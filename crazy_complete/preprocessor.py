@@ -4,43 +4,106 @@
 '''Contains code for preprocessing text.'''
 
 
-def preprocess(string, defines):
-    '''Simple preprocessor function with #ifdef, #else, and #endif support.'''
+import functools
 
-    defines = set(defines)
-    output = []
-    stack = []  # stack of booleans: is this block currently active?
 
-    lines = string.splitlines(keepends=True)
+class Template:
+    '''A template compiled into a tree of blocks.
 
-    for line in lines:
-        stripped_line = line.lstrip()
+    The tree consists of strings (lines of text) and conditionals. A
+    conditional is a tuple of the define name and its branches. The first
+    branch is active if the define is set, every `#else` flips the state.
 
-        if stripped_line.startswith("#ifdef"):
-            define = stripped_line.split()[1]
-            active = define in defines
-            stack.append(active)
+    Attributes:
+        defines (frozenset):
+            The names of all defines referenced by the template.
+    '''
+
+    def __init__(self, string):
+        self.defines = set()
+        self.tree = []
+
+        current = self.tree
+        stack = []  # stack of (parent block, conditional)
+        text = []
+
+        def flush():
+            if text:
+                current.append(''.join(text))
+                text.clear()
+
+        for line in string.splitlines(keepends=True):
+            stripped_line = line.lstrip()
+
+            if stripped_line.startswith("#ifdef"):
+                define = stripped_line.split()[1]
+                self.defines.add(define)
+                flush()
+                conditional = (define, [[]])
+                current.append(conditional)
+                stack.append((current, conditional))
+                current = conditional[1][0]
+
+            elif stripped_line.startswith("#else"):
+                if not stack:
+                    raise SyntaxError("#else without #ifdef")
+                flush()
+                current = []
+                stack[-1][1][1].append(current)
+
+            elif stripped_line.startswith("#endif"):
+                if not stack:
+                    raise SyntaxError("#endif without #ifdef")
+                flush()
+                current = stack.pop()[0]
+
+            else:
+                text.append(line)
+
+        if stack:
+            raise SyntaxError("Unclosed #ifdef")
 
-        elif stripped_line.startswith("#else"):
-            if not stack:
-                raise SyntaxError("#else without #ifdef")
-            # flip only the current (top of stack)
-            stack[-1] = not stack[-1]
+        flush()
+        self.defines = frozenset(self.defines)
 
-        elif stripped_line.startswith("#endif"):
-            if not stack:
-                raise SyntaxError("#endif without #ifdef")
-            stack.pop()
+    def render(self, defines):
+        '''Return the text with all inactive blocks removed.'''
 
+        if not self.defines:
+            return ''.join(self.tree)
+
+        output = []
+        _render(self.tree, defines, output)
+        return ''.join(output)
+
+
+def _render(blocks, defines, output):
+    for block in blocks:
+        if isinstance(block, str):
+            output.append(block)
         else:
-            # output only if all enclosing blocks are active
-            if not stack or all(stack):
-                output.append(line)
+            define, branches = block
+            active = define in defines
+            for branch in branches:
+                if active:
+                    _render(branch, defines, output)
+                active = not active
+
+
+@functools.lru_cache(maxsize=256)
+def compile_template(string):
+    '''Return the compiled `Template` of `string`.
 
-    if stack:
-        raise SyntaxError("Unclosed #ifdef")
+    Compiled templates are cached.
+    '''
+
+    return Template(string)
+
+
+def preprocess(string, defines):
+    '''Simple preprocessor function with #ifdef, #else, and #endif support.'''
 
-    return ''.join(output)
+    return compile_template(string).render(set(defines))
 
 
 def _test():
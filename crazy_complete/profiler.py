@@ -0,0 +1,230 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2025-2026 Benjamin Abendroth <braph93@gmx.de>
+
+'''Profiling of the generation phases.
+
+The code that should be measured is wrapped in `phase()`:
+
+    with profiler.phase('BashCompletionGenerator', commandline.get_command_path()):
+        ...
+
+If no profiler is active (see `start()`), `phase()` returns a context
+manager that does nothing, so the phases cost almost nothing in normal
+runs.
+
+For each phase the wall time and the change in the number of allocated
+memory blocks (`sys.getallocatedblocks()`) is recorded. Phases can be
+nested; the time spent in nested phases is subtracted from the self time
+of the enclosing phase.
+'''
+
+import sys
+import time
+import contextlib
+
+
+# Phases that generate the code for a single command line
+GENERATOR_PHASES = (
+    'BashCompletionGenerator',
+    'FishCompletionGenerator',
+    'ZshCompletionFunction',
+)
+
+
+class Phase:
+    '''A recorded phase.'''
+
+    # pylint: disable=too-few-public-methods
+
+    __slots__ = ('name', 'subject', 'depth', 'recursive', 'seconds', 'blocks',
+                 'child_seconds', 'child_blocks')
+
+    def __init__(self, name, subject, depth, recursive):
+        self.name = name
+        self.subject = subject
+        self.depth = depth
+        self.recursive = recursive
+        self.seconds = 0.0
+        self.blocks = 0
+        self.child_seconds = 0.0
+        self.child_blocks = 0
+
+    @property
+    def self_seconds(self):
+        '''The time spent in this phase, excluding nested phases.'''
+
+        return self.seconds - self.child_seconds
+
+    @property
+    def self_blocks(self):
+        '''The allocated blocks of this phase, excluding nested phases.'''
+
+        return self.blocks - self.child_blocks
+
+
+class Profiler:
+    '''Records phases.'''
+
+    def __init__(self):
+        self.phases = []
+        self.stack = []
+
+    @contextlib.contextmanager
+    def phase(self, name, subject=None):
+        '''Context manager for recording a phase.'''
+
+        recursive = any(p.name == name and p.subject == subject for p in self.stack)
+        record = Phase(name, subject, len(self.stack), recursive)
+        self.stack.append(record)
+        blocks = sys.getallocatedblocks()
+        start = time.perf_counter()
+
+        try:
+            yield record
+        finally:
+            record.seconds = time.perf_counter() - start
+            record.blocks = sys.getallocatedblocks() - blocks
+            self.stack.pop()
+
+            if self.stack:
+                self.stack[-1].child_seconds += record.seconds
+                self.stack[-1].child_blocks += record.blocks
+
+            self.phases.append(record)
+
+    def get_summary(self):
+        '''Return the phases grouped by name and subject, sorted by self time.
+
+        Returns:
+            list: Dictionaries with the keys `name`, `subject`, `calls`,
+                  `seconds`, `self_seconds` and `blocks`.
+        '''
+
+        groups = {}
+
+        for record in self.phases:
+            key = (record.name, record.subject)
+
+            try:
+                group = groups[key]
+            except KeyError:
+                group = groups[key] = {
+                    'name':         record.name,
+                    'subject':      record.subject,
+                    'calls':        0,
+                    'seconds':      0.0,
+                    'self_seconds': 0.0,
+                    'blocks':       0,
+                }
+
+            group['calls'] += 1
+            group['self_seconds'] += record.self_seconds
+            group['blocks'] += record.self_blocks
+
+            # The time of a phase nested in a phase of the same name and
+            # subject is already included in the outer phase
+            if not record.recursive:
+                group['seconds'] += record.seconds
+
+        return sorted(groups.values(), key=lambda g: g['self_seconds'], reverse=True)
+
+    def get_commandline_subtrees(self):
+        '''Return the generation time of each command line and its subcommands.
+
+        Only the phases in `GENERATOR_PHASES` are taken into account.
+
+        Returns:
+            list: Tuples of (command path, seconds), sorted by seconds.
+        '''
+
+        subtrees = {}
+
+        for record in self.phases:
+            if record.name in GENERATOR_PHASES and record.subject is not None:
+                # Add the time to the command line and all of its parents
+                path = record.subject.split(' ')
+                for i in range(1, len(path) + 1):
+                    prefix = ' '.join(path[:i])
+                    subtrees[prefix] = subtrees.get(prefix, 0.0) + record.self_seconds
+
+        return sorted(subtrees.items(), key=lambda r: r[1], reverse=True)
+
+    def to_dict(self):
+        '''Return the results as a dictionary suitable for JSON.'''
+
+        return {
+            'phases': [{
+                'name':         record.name,
+                'subject':      record.subject,
+                'depth':        record.depth,
+                'seconds':      record.seconds,
+                'self_seconds': record.self_seconds,
+                'blocks':       record.blocks,
+                'self_blocks':  record.self_blocks,
+            } for record in self.phases],
+            'summary': self.get_summary(),
+            'commandlines': dict(self.get_commandline_subtrees()),
+        }
+
+    def format_table(self):
+        '''Return the results as a table, sorted by self time.'''
+
+        total = sum(record.seconds for record in self.phases if record.depth == 0)
+
+        lines = []
+        lines.append('%10s %10s %6s %10s %6s  %s' % (
+            'self ms', 'total ms', '%', 'blocks', 'calls', 'phase'))
+
+        for group in self.get_summary():
+            name = group['name']
+            if group['subject'] is not None:
+                name += f" ({group['subject']})"
+
+            percent = group['self_seconds'] / total * 100 if total else 0.0
+
+            lines.append('%10.2f %10.2f %6.1f %10d %6d  %s' % (
+                group['self_seconds'] * 1000, group['seconds'] * 1000, percent,
+                group['blocks'], group['calls'], name))
+
+        subtrees = self.get_commandline_subtrees()
+
+        if subtrees:
+            lines.append('')
+            lines.append('%10s  %s' % ('ms', 'command line (including subcommands)'))
+
+            for path, seconds in subtrees:
+                lines.append('%10.2f  %s' % (seconds * 1000, path))
+
+        return '\n'.join(lines)
+
+
+_NULL_PHASE = contextlib.nullcontext()
+
+_active = None
+
+
+def start():
+    '''Start profiling and return the active profiler.'''
+
+    global _active # pylint: disable=global-statement
+    _active = Profiler()
+    return _active
+
+
+def stop():
+    '''Stop profiling.'''
+
+    global _active # pylint: disable=global-statement
+    _active = None
+
+
+def phase(name, subject=None):
+    '''Return a context manager recording a phase.
+
+    If no profiler is active, the returned context manager does nothing.
+    '''
+
+    if _active is None:
+        return _NULL_PHASE
+
+    return _active.phase(name, subject)
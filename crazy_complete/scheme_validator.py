@@ -15,6 +15,7 @@ from .str_utils import (
     is_valid_option_string, is_valid_variable_name,
     is_valid_extended_regex, validate_prog)
 from . import messages as m
+from . import profiler
 
 
 _error = CrazySchemaValidationError
@@ -689,9 +690,15 @@ def _check_complete(ctxt, args):
         raise _error(msg, e.value_with_trace) from e
 
 
-def _check_positionals_repeatable0(definition_tree, definition):
+def _check_positionals_repeatable0(definition):
+    '''Check the order of repeatable positionals.
+
+    Returns:
+        bool: True if the definition has a repeatable positional.
+    '''
+
     if not _has_set(definition, 'positionals'):
-        return
+        return False
 
     positionals = definition.value['positionals'].value
     repeatable_number = None
@@ -713,15 +720,12 @@ def _check_positionals_repeatable0(definition_tree, definition):
             msg = m.positional_argument_after_repeatable()
             raise _error(msg, positional)
 
-    node = definition_tree.get_definition(definition.value['prog'].value)
-    if repeatable_number is not None and len(node.subcommands) > 0:
-        msg = m.repeatable_with_subcommands()
-        raise _error(msg, definition)
+    return repeatable_number is not None
 
 
-def _check_positionals_repeatable(definition_tree, definition):
+def _check_positionals_repeatable(definition):
     try:
-        _check_positionals_repeatable0(definition_tree, definition)
+        return _check_positionals_repeatable0(definition)
     except _error as e:
         prog = definition.value['prog'].value
         msg = '%s: %s' % (prog, e.message)
@@ -929,7 +933,7 @@ class DefinitionTree:
         self.subcommands = {}
 
     def add_definition(self, definition):
-        '''Add a definition to subcommands.'''
+        '''Add a definition to subcommands and return its node.'''
 
         _check_type(definition, (dict,))
 
@@ -960,6 +964,7 @@ class DefinitionTree:
             raise _error(msg, definition)
 
         node.subcommands[subcommand] = DefinitionTree(definition)
+        return node.subcommands[subcommand]
 
     def get_definition(self, prog):
         '''Get definition by prog.'''
@@ -1000,23 +1005,72 @@ class DefinitionTree:
         return root
 
 
+def _get_prog(definition):
+    try:
+        return definition.value['prog'].value
+    except (KeyError, TypeError, AttributeError):
+        return None
+
+
+class Validator:
+    '''Validate the definitions of a file one at a time.
+
+    Between the calls to `add_definition()` only the program names and the
+    positions of the definitions are kept, so a definition can be released
+    as soon as it has been validated.
+    '''
+
+    def __init__(self):
+        self.context = Context()
+        self.tree = DefinitionTree(None)
+        self.repeatable = []
+
+    def add_definition(self, definition):
+        '''Validate a single definition.
+
+        Definitions of subcommands have to be added after the definition
+        of their parent command.
+        '''
+
+        with profiler.phase('validate', _get_prog(definition)):
+            self._add_definition(definition)
+
+    def _add_definition(self, definition):
+        node = self.tree.add_definition(definition)
+
+        if len(self.tree.subcommands) > 1:
+            value = ValueWithTrace(None, '', 1, 1)
+            progs = list(self.tree.subcommands.keys())
+            msg = m.too_many_programs_defined()
+            raise _error('%s: %s' % (msg, progs), value)
+
+        self.context.definition = definition
+        _check_commandline_definition(self.context, definition)
+        if _check_positionals_repeatable(definition):
+            self.repeatable.append((definition.value['prog'].value, node))
+        self.context.definition = None
+
+        node.definition = definition.without_value()
+
+    def finish(self):
+        '''Run the checks that need all definitions.'''
+
+        if len(self.tree.subcommands) == 0:
+            msg = m.no_programs_defined()
+            raise _error(msg, ValueWithTrace(None, '', 1, 1))
+
+        for prog, node in self.repeatable:
+            if len(node.subcommands) > 0:
+                msg = '%s: %s' % (prog, m.repeatable_with_subcommands())
+                raise _error(msg, node.definition)
+
+
 def validate(definition_list):
     '''Validate a list of definitions.'''
 
-    context = Context()
-    commandline_root = DefinitionTree.make_tree(definition_list)
-
-    if len(commandline_root.subcommands) == 0:
-        msg = m.no_programs_defined()
-        raise _error(msg, ValueWithTrace(None, '', 1, 1))
+    validator = Validator()
 
-    if len(commandline_root.subcommands) > 1:
-        value = ValueWithTrace(None, '', 1, 1)
-        progs = list(commandline_root.subcommands.keys())
-        msg = m.too_many_programs_defined()
-        raise _error('%s: %s' % (msg, progs), value)
+    for definition in definition_list:
+        validator.add_definition(definition)
 
-    for cmdline in commandline_root.get_first_commandline().get_all():
-        context.definition = cmdline.definition
-        _check_commandline_definition(context, cmdline.definition)
-        _check_positionals_repeatable(commandline_root, cmdline.definition)
+    validator.finish()
@@ -4,9 +4,10 @@
 '''String utility functions.'''
 
 import re
-import subprocess
+import functools
 
 from .errors import CrazyError
+from .extended_regex import check_extended_regex
 
 
 _VALID_OPTION_STRING_RE = re.compile('-[^\\s,]+')
@@ -25,8 +26,20 @@ def is_empty_or_whitespace(string):
     return not string.strip()
 
 
+@functools.lru_cache(maxsize=None)
 def is_valid_extended_regex(string):
-    '''Check if string is a valid extended regular expression.'''
+    '''Check if string is a valid extended regular expression.
+
+    The check is done in-process. Only if the result depends on the
+    locale, `grep -E` is asked.
+    '''
+
+    result = check_extended_regex(string)
+    if result is not None:
+        return result
+
+    # Only imported if needed, since this is rarely the case
+    import subprocess  # pylint: disable=import-outside-toplevel
 
     try:
         r = subprocess.run(
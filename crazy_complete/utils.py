@@ -20,6 +20,18 @@ def print_err(*a):
     print(*a, file=sys.stderr)
 
 
+class _TrieNode:
+    '''A node of a prefix trie.'''
+
+    # pylint: disable=too-few-public-methods
+
+    __slots__ = ('children', 'count')
+
+    def __init__(self):
+        self.children = {}
+        self.count = 0
+
+
 class GeneralAbbreviationGenerator:
     '''A class for generating abbreviations from a list of words.
 
@@ -48,28 +60,44 @@ class GeneralAbbreviationGenerator:
         assert isinstance(min_abbreviated_length, int)
         assert is_list_type(words)
 
-        # pylint: disable=cell-var-from-loop
-
         self.min_abbreviated_length = min_abbreviated_length
         self.abbreviations = {}
         self.min_lengths = {}
 
-        for word in words:
-            self.abbreviations[word] = []
-            self.min_lengths[word] = len(word)
-
-            for length in range(len(word), self.min_abbreviated_length - 1, -1):
-                abbrev = word[0:length]
+        # Build a prefix trie. Each node counts the distinct words that
+        # start with the prefix the node represents.
+        root = _TrieNode()
+
+        for word in dict.fromkeys(words):
+            node = root
+            for char in word:
+                try:
+                    node = node.children[char]
+                except KeyError:
+                    child = _TrieNode()
+                    node.children[char] = child
+                    node = child
+                node.count += 1
 
-                can_abbreviate = True
-                for other_word in filter(lambda w: w != word, words):
-                    if other_word.startswith(abbrev):
-                        can_abbreviate = False
-                        break
-
-                if can_abbreviate or abbrev == word:
-                    self.abbreviations[word].append(abbrev)
-                    self.min_lengths[word] = length
+        for word in words:
+            # Find the length of the shortest prefix that is unique to `word`
+            unique_length = len(word)
+            node = root
+            for length, char in enumerate(word, 1):
+                node = node.children[char]
+                if node.count == 1:
+                    unique_length = length
+                    break
+
+            shortest = max(unique_length, min_abbreviated_length)
+
+            if len(word) < min_abbreviated_length:
+                self.abbreviations[word] = []
+                self.min_lengths[word] = len(word)
+            else:
+                self.abbreviations[word] = [
+                    word[0:length] for length in range(len(word), shortest - 1, -1)]
+                self.min_lengths[word] = min(shortest, len(word))
 
     def get_abbreviations(self, word):
         '''Get the list of abbreviations for a given word.
@@ -160,7 +188,8 @@ def get_option_abbreviator(commandline):
     if not commandline.abbreviate_options:
         return DummyAbbreviationGenerator()
 
-    options = commandline.get_options(with_parent_options=commandline.inherit_options)
+    index = commandline.get_option_index()
+    options = index.get_options(with_parent_options=commandline.inherit_options)
     option_strings = []
 
     for option in options:
@@ -263,7 +292,8 @@ def get_query_option_strings(commandline, with_parent_options=True):
 
     r = []
 
-    for option in commandline.get_options(with_parent_options=with_parent_options):
+    index = commandline.get_option_index()
+    for option in index.get_options(with_parent_options=with_parent_options):
         if option.has_required_arg():
             r.extend('%s=' % s for s in option.option_strings)
         elif option.has_optional_arg():
@@ -296,7 +326,7 @@ def is_worth_a_function(commandline):
         else:
             return True
 
-    options = commandline.get_options()
+    options = commandline.get_option_index().get_options()
     options = list(filter(lambda o: '--help' not in o.option_strings and
                                     '--version' not in o.option_strings, options))
     if len(options) > 0:
@@ -14,11 +14,13 @@ class ValueWithTrace:
 
     Attributes:
         value (Any): The value extracted from the configuration file.
-        src (str): The source of the configuration file.
+        source (str): The source of the configuration file.
         line (int): The line number of the value in the source.
         column (int): The column number of the value in the source.
     '''
 
+    __slots__ = ('value', 'source', 'line', 'column')
+
     def __init__(self, value, source, line, column):
         self.value = value
         self.source = source
@@ -40,6 +42,16 @@ class ValueWithTrace:
 
         return f'line {self.line}, column {self.column}'
 
+    def without_value(self):
+        '''Return a copy holding only the position of the value.'''
+
+        copy = ValueWithTrace.__new__(ValueWithTrace)
+        copy.value = None
+        copy.source = self.source
+        copy.line = self.line
+        copy.column = self.column
+        return copy
+
     def __hash__(self):
         return hash(self.value)
 
@@ -53,6 +65,8 @@ class ValueWithTrace:
 class ValueWithOutTrace:
     '''Class holding a value without metadata. '''
 
+    __slots__ = ('value',)
+
     def __init__(self, value):
         self.value = value
 
@@ -61,6 +75,11 @@ class ValueWithOutTrace:
 
         return ''
 
+    def without_value(self):
+        '''Return a copy without the value.'''
+
+        return ValueWithOutTrace(None)
+
     def __hash__(self):
         return hash(self.value)
 
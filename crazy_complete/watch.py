@@ -0,0 +1,159 @@
+# SPDX-License-Identifier: GPL-3.0-or-later
+# Copyright (C) 2025-2026 Benjamin Abendroth <braph93@gmx.de>
+
+'''Classes for watching files for changes.
+
+On Linux, inotify is used. On other systems (or if inotify is not available),
+the modification times of the files are polled.
+'''
+
+import os
+import time
+import errno
+import select
+import struct
+import ctypes
+import ctypes.util
+
+
+# pylint: disable=too-few-public-methods
+
+
+class PollingWatcher:
+    '''Watch files by polling their modification time.'''
+
+    def __init__(self, files, interval=0.5):
+        self.files = [os.path.abspath(f) for f in files]
+        self.interval = interval
+        self.stats = {file: self._stat(file) for file in self.files}
+
+    @staticmethod
+    def _stat(file):
+        try:
+            st = os.stat(file)
+            return (st.st_mtime_ns, st.st_size, st.st_ino)
+        except OSError:
+            return None
+
+    def wait(self):
+        '''Block until at least one file changed.
+
+        Returns:
+            set: The absolute paths of the changed files.
+        '''
+
+        while True:
+            time.sleep(self.interval)
+
+            changed = set()
+
+            for file in self.files:
+                stat = self._stat(file)
+                if stat != self.stats[file]:
+                    self.stats[file] = stat
+                    changed.add(file)
+
+            if changed:
+                return changed
+
+
+class InotifyWatcher:
+    '''Watch files using inotify.
+
+    The directories containing the files are watched instead of the files
+    themselves, because many editors save files by replacing them.
+    '''
+
+    IN_MODIFY       = 0x00000002
+    IN_CLOSE_WRITE  = 0x00000008
+    IN_MOVED_TO     = 0x00000080
+    IN_CREATE       = 0x00000100
+
+    _EVENT = struct.Struct('iIII')
+
+    # Time to wait for more events after a change
+    DEBOUNCE = 0.05
+
+    def __init__(self, files):
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+
+        self.files = set(os.path.abspath(f) for f in files)
+        self.directories = {}
+        self.fd = libc.inotify_init1(os.O_CLOEXEC)
+
+        if self.fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+
+        mask = self.IN_MODIFY | self.IN_CLOSE_WRITE | self.IN_MOVED_TO | self.IN_CREATE
+
+        for directory in set(os.path.dirname(f) for f in self.files):
+            wd = libc.inotify_add_watch(self.fd, os.fsencode(directory), mask)
+
+            if wd < 0:
+                err = ctypes.get_errno()
+                os.close(self.fd)
+                raise OSError(err, os.strerror(err), directory)
+
+            self.directories[wd] = directory
+
+    def _read_events(self):
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except InterruptedError:
+            return set()
+
+        changed = set()
+        offset = 0
+
+        while offset < len(data):
+            wd, _, _, length = self._EVENT.unpack_from(data, offset)
+            offset += self._EVENT.size
+            name = data[offset:offset + length].rstrip(b'\0')
+            offset += length
+
+            if wd in self.directories:
+                path = os.path.join(self.directories[wd], os.fsdecode(name))
+                if path in self.files:
+                    changed.add(path)
+
+        return changed
+
+    def wait(self):
+        '''Block until at least one file changed.
+
+        Returns:
+            set: The absolute paths of the changed files.
+        '''
+
+        changed = set()
+
+        while not changed:
+            changed = self._read_events()
+
+        # Collect the events of a save operation that consists of
+        # multiple writes or renames.
+        while select.select([self.fd], [], [], self.DEBOUNCE)[0]:
+            changed |= self._read_events()
+
+        return changed
+
+    def close(self):
+        '''Close the inotify file descriptor.'''
+
+        os.close(self.fd)
+
+
+def make_watcher(files):
+    '''Return a watcher for `files`.
+
+    Uses inotify if available, else falls back to polling.
+    '''
+
+    try:
+        return InotifyWatcher(files)
+    except (OSError, AttributeError) as e:
+        if isinstance(e, OSError) and e.errno not in (None, errno.ENOSYS, errno.EMFILE,
+                                                     errno.ENOSPC, errno.EPERM):
+            raise
+        return PollingWatcher(files)
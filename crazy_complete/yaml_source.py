@@ -13,6 +13,7 @@ from . import dictionary_source
 from . import scheme_validator
 from .str_utils import indent
 from .extended_yaml_parser import ExtendedYAMLParser
+from .value_with_trace import ValueWithTrace
 from .cli import INHERIT
 
 
@@ -138,69 +139,124 @@ def commandline_to_yaml(commandline):
     return '\n---\n'.join(r)
 
 
-def replace_defines_in_documents(documents):
-    '''Replaces defines in a list of documents.
+def _is_defines_document(document):
+    return (isinstance(document.value, dict) and
+            'prog' in document.value and
+            document.value['prog'].value == '%defines%')
 
-    Example:
-        prog: '%defines%'
-        my_completer: ['choices', ['foo', 'bar']]
-        ---
-        prog: 'example'
-        options:
-          - option_strings: ['-o']
-            complete: 'my_completer'
+
+def _to_dictionary(document, shared):
+    '''Turn a parsed document into plain Python objects.
+
+    `shared` maps the ids of already converted values (the values of the
+    defines) to their conversion, so each define is converted only once.
     '''
 
-    defines = None
+    try:
+        return shared[id(document)]
+    except KeyError:
+        pass
+
+    value = document.value
 
-    for document in documents:
-        if not isinstance(document.value, dict):
-            continue
+    if isinstance(value, dict):
+        return {key.value: _to_dictionary(val, shared) for key, val in value.items()}
 
-        if 'prog' in document.value and document.value['prog'].value == '%defines%':
-            defines = document
-            break
+    if isinstance(value, list):
+        # Copying the list trims its over-allocation
+        return list([_to_dictionary(val, shared) for val in value])
 
-    if defines is None:
-        return documents
+    return value
 
-    documents.remove(defines)
-    defines.value.pop('prog')
 
-    def replace_defines(obj):
-        if isinstance(obj.value, str):
-            return defines.value.get(obj.value, obj)
-        if isinstance(obj.value, list):
-            obj.value = [replace_defines(sub) for sub in obj.value]
-            return obj
-        if isinstance(obj.value, dict):
-            obj.value = {key: replace_defines(val) for key, val in obj.value.items()}
-            return obj
-        return obj
+def _check_syntax(file):
+    '''Load `file` using the pure Python loader.
 
-    new = []
-    for document in documents:
-        new.append(replace_defines(document))
-    return new
+    It gives better error messages in case of syntax errors.
+    '''
+
+    with open(file, 'r', encoding='utf-8') as fh:
+        for _ in yaml.safe_load_all(fh):
+            pass
+
+
+def _replace_defines(document, defines):
+    # Replaces the defines in a document that was parsed before the defines.
+    # The document is not modified, the containers are copied.
+    value = document.value
+
+    if isinstance(value, str):
+        return defines.get(value, document)
+
+    if isinstance(value, list):
+        value = [_replace_defines(val, defines) for val in value]
+    elif isinstance(value, dict):
+        value = {key: _replace_defines(val, defines) for key, val in value.items()}
+    else:
+        return document
+
+    return ValueWithTrace(value, document.source, document.line, document.column)
+
+
+def _iter_documents(parser, content, file):
+    # Yields the documents of `content` with the defines resolved.
+    #
+    # The defines are resolved by the parser for the documents that follow
+    # the defines document. The documents before it have to be held back
+    # until the defines document has been parsed. If `content` cannot
+    # contain a defines document, no document is held back.
+    pending = [] if '%defines%' in content else None
+
+    try:
+        for document in parser.parse_documents(content, file):
+            if document is None:
+                continue
+
+            if parser.defines is None and _is_defines_document(document):
+                document.value.pop('prog')
+                parser.defines = {key.value: val for key, val in document.value.items()}
+                yield from (_replace_defines(doc, parser.defines) for doc in pending)
+                pending = None
+            elif pending is not None:
+                pending.append(document)
+            else:
+                yield document
+    except yaml.YAMLError:
+        _check_syntax(file)
+        raise
+
+    if pending:
+        yield from pending
 
 
 def load_from_file(file):
-    '''Load a YAML file and turn it into a cli.CommandLine object.'''
+    '''Load a YAML file and turn it into a cli.CommandLine object.
 
-    # First, load using normal yaml loader. It gives better error messages
-    # in case of syntax errors.
-    with open(file, 'r', encoding='utf-8') as fh:
-        dictionaries = list(yaml.safe_load_all(fh))
+    Each document is validated and converted to cli.CommandLine objects as
+    soon as it is parsed, and its parsed values are released before the
+    next document is parsed. Only the documents preceding a `%defines%`
+    document are held until the defines are known.
+
+    Defines are resolved by the parser (see `ExtendedYAMLParser.defines`).
+    '''
 
-    # Then load using extended yaml loader...
     with open(file, 'r', encoding='utf-8') as fh:
         content = fh.read()
 
-    # Validate YAML...
     parser = ExtendedYAMLParser()
-    parsed = parser.parse(content)
-    parsed = replace_defines_in_documents(parsed)
-    scheme_validator.validate(parsed)
+    validator = scheme_validator.Validator()
+    builder = dictionary_source.CommandLineBuilder()
+    shared = {}
+    defines = None
+
+    for document in _iter_documents(parser, content, file):
+        if defines is not parser.defines:
+            defines = parser.defines
+            for value in defines.values():
+                shared[id(value)] = _to_dictionary(value, shared)
+
+        validator.add_definition(document)
+        builder.add_dictionary(_to_dictionary(document, shared))
 
-    # Finally convert the config structure to CommandLine objects
-    return dictionary_source.dictionaries_to_commandline(dictionaries)
+    validator.finish()
+    return builder.get_commandline(validated=True)
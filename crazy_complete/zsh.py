@@ -164,10 +164,11 @@ class ZshCompletionFunction:
     def _generate_option_parsing(self):
         args = []
 
+        index = self.commandline.get_option_index()
         if self.commandline.inherit_options:
-            options = self.commandline.get_options(with_parent_options=True)
+            options = index.get_options(with_parent_options=True)
         else:
-            options = self.commandline.get_options()
+            options = index.get_options()
 
         for option in options:
             args.append(self._complete_option(option))
@@ -137,7 +137,7 @@ def generate_wrapper(ctxt, commandline):
     short_opts_flag = []
     short_opts_optional = []
 
-    for option in commandline.get_options():
+    for option in commandline.get_option_index().get_options():
         if option.has_required_arg():
             long_opts_arg += option.get_long_option_strings()
             long_opts_arg += option.get_old_option_strings()
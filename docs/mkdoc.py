@@ -1,14 +1,11 @@
 #!/usr/bin/python3
 
 import os
-import pprint
+import json
+import zlib
 from collections import defaultdict
 
 import yaml
-from pygments import highlight
-from pygments.lexers import YamlLexer
-from pygments.lexers import MarkdownLexer
-from pygments.formatters import TerminalFormatter
 
 os.chdir(os.path.dirname(os.path.abspath(__file__)))
 
@@ -18,8 +15,7 @@ OPTIONS_INFILE          = 'options.yaml'
 OPTIONS_OUTFILE         = 'options.md'
 DOCUMENTATION_INFILE    = 'documentation.md.in'
 DOCUMENTATION_OUTFILE   = 'documentation.md'
-MANUAL_INFILE           = 'manual.in.py'
-MANUAL_OUTFILE          = '../crazy_complete/manual.py'
+MANUAL_OUTFILE          = '../crazy_complete/manual.data'
 
 OPTIONS                 = []
 COMMANDS                = []
@@ -295,32 +291,32 @@ def options_markup(options):
     return '\n\n---\n\n'.join(r)
 
 
-def make_python_commands(commands):
-    data = []
+def make_manual_data(commands):
+    # See crazy_complete/manual.py for a description of the format
+    # The `also` entries are sorted, as they were by pprint before
+    index = {}
+    entries = []
+    offset = 0
 
     for command in commands:
-        def_colored = highlight(command.definition, YamlLexer(), TerminalFormatter())
-
-        if command.long:
-            long_colored = highlight(command.long, MarkdownLexer(), TerminalFormatter())
-        else:
-            long_colored = None
-
-        data.append({
+        entry = json.dumps({
             'command':              command.command,
-            'category':             command.category,
             'short':                command.short,
             'long':                 command.long,
-            'long_colored':         long_colored,
             'notes':                command.notes,
             'implemented':          command.implemented,
             'definition':           command.definition,
-            'definition_colored':   def_colored,
             'output':               command.output,
-            'also':                 command.also
-        })
+            'also':                 dict(sorted(command.also.items())) if command.also else command.also
+        }, separators=(',', ':')).encode('utf-8')
 
-    return 'COMMANDS = ' + pprint.pformat(data)
+        entry = zlib.compress(entry, 9)
+        index[command.command] = [offset, len(entry)]
+        entries.append(entry)
+        offset += len(entry)
+
+    header = json.dumps(index, separators=(',', ':')).encode('utf-8')
+    return header + b'\n' + b''.join(entries)
 
 # =============================================================================
 # Read commands and options
@@ -362,14 +358,8 @@ with open(DOCUMENTATION_OUTFILE, 'w', encoding='utf-8') as fh:
     fh.write(content)
 
 # =============================================================================
-# Generate python manual data
+# Generate manual data
 # =============================================================================
 
-with open(MANUAL_INFILE, 'r', encoding='utf-8') as fh:
-    content = fh.read()
-
-commands_python = make_python_commands(COMMANDS)
-content = content.replace('%COMMANDS%', commands_python)
-
-with open(MANUAL_OUTFILE, 'w', encoding='utf-8') as fh:
-    fh.write(content)
+with open(MANUAL_OUTFILE, 'wb') as fh:
+    fh.write(make_manual_data(COMMANDS))
@@ -8,6 +8,7 @@ setup(
     author='Benjamin Abendroth',
     author_email='braph93@gmx.de',
     packages=['crazy_complete'],
+    package_data={'crazy_complete': ['manual.data']},
     scripts=['crazy-complete'],
     description='Generate shell completion files for all major shells',
     url='https://github.com/crazy-complete/crazy-complete',
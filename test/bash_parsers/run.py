@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+
+'''This script checks that the Bash command line parsers give the same results.
+
+For each definition file in `../tests` (including the Python definition
+`crazy-complete-test`), the parsers `bash_parser_v2` and
+`bash_parser_v3` are generated. Random command lines made of the option
+strings, subcommands and other words of the definition are parsed by each
+parser in Bash, and the resulting `POSITIONALS`, `END_OF_OPTIONS` and
+option variables are compared.
+
+`bash_parser` (v1) is not compared, since it handles invalid command lines
+differently (e.g. unknown long options are parsed as short options).
+'''
+
+import os
+import sys
+import glob
+import random
+import argparse
+import subprocess
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+CRAZY_COMPLETE_DIR = os.path.abspath(os.path.join(SCRIPT_DIR, '..', '..'))
+TESTS_DIR = os.path.join(CRAZY_COMPLETE_DIR, 'test', 'tests')
+
+# We want to import the development version of crazy-complete,
+# not the installed version.
+sys.path.insert(0, CRAZY_COMPLETE_DIR)
+
+# pylint: disable=wrong-import-position
+from crazy_complete import (  # noqa: E402
+    config, generation, shell, utils, yaml_source, argparse_source,
+    bash_parser_v2, bash_parser_v3)
+from crazy_complete.bash_utils import VariableManager  # noqa: E402
+from crazy_complete.errors import CrazyError  # noqa: E402
+
+PARSERS = ('v2', 'v3')
+
+TABLE = '_test__options'
+
+OTHER_WORDS = ('', '-', '--', 'foo', 'a b', "it's", '-=', '--=x', '-x=')
+
+
+def get_configs():
+    '''Return the configurations to test with.'''
+
+    default = config.Config()
+
+    abbreviate = config.Config()
+    abbreviate.set_abbreviate_commands(True)
+    abbreviate.set_abbreviate_options(True)
+
+    inherit = config.Config()
+    inherit.set_inherit_options(True)
+
+    return {'default': default, 'abbreviate': abbreviate, 'inherit': inherit}
+
+
+def get_words(commandline):
+    '''Return the words the command lines are made of.'''
+
+    words = list(OTHER_WORDS)
+
+    for cmdline in commandline.get_all_commandlines():
+        for option in cmdline.options:
+            for option_string in option.option_strings:
+                words.append(option_string)
+                words.append(option_string + '=value')
+
+                # Abbreviations (or invalid ones)
+                if option_string.startswith('--') and len(option_string) > 3:
+                    words.append(option_string[:-1])
+
+            short = ''.join(o[1] for o in option.get_short_option_strings())
+            if short:
+                words.append('-%sx' % short)
+                words.append('-x%s' % short)
+
+        if cmdline.get_subcommands():
+            for subcommand in cmdline.get_subcommands().subcommands:
+                words.extend(utils.get_all_command_variations(subcommand))
+
+    return words
+
+
+def make_script(commandline):
+    '''Return Bash code defining a parse function for each parser.'''
+
+    variable_manager = VariableManager('OPT_')
+
+    entries = bash_parser_v3.get_table_entries(commandline, variable_manager)
+    commands = []
+    if bash_parser_v3.has_unknown_subcommands(commandline):
+        commands = bash_parser_v3.get_commands(commandline)
+
+    code = {
+        'v2': bash_parser_v2.generate(commandline, variable_manager),
+        'v3': bash_parser_v3.generate(commandline, TABLE),
+    }
+
+    variables = set()
+    for cmdline in commandline.get_all_commandlines():
+        for option in cmdline.options:
+            variables.add(option.capture)
+
+    r = bash_parser_v3.generate_table(entries, commands, TABLE) + '\n\n'
+
+    for parser in PARSERS:
+        r += 'parse_%s() {\n%s\n}\n\n' % (parser, code[parser])
+
+    local = 'local END_OF_OPTIONS POSITIONALS'
+    if variables:
+        local += '\n  local -a %s' % ' '.join(sorted(variables))
+
+    r += 'run() {\n'
+    r += '  %s\n' % local
+    r += '  parse_$1\n'
+    r += '  declare -p END_OF_OPTIONS POSITIONALS %s\n' % (
+        ' '.join(sorted(variables)))
+    r += '}\n\n'
+    return r
+
+
+def make_commandlines(commandline, count, seed):
+    '''Return random command lines (lists of words).'''
+
+    rnd = random.Random(seed)
+    words = get_words(commandline)
+    result = []
+
+    for _ in range(count):
+        length = rnd.randint(1, 8)
+        result.append([commandline.prog] + [rnd.choice(words) for _ in range(length)])
+
+    return result
+
+
+def check(name, commandline, count, seed):
+    '''Run the parsers on random command lines and compare the results.'''
+
+    script = make_script(commandline)
+    commandlines = make_commandlines(commandline, count, seed)
+
+    for words in commandlines:
+        quoted = ' '.join(shell.quote(w) for w in words)
+        script += 'words_dequoted=(%s)\ncword=%d\n' % (quoted, len(words) - 1)
+        for parser in PARSERS:
+            script += 'echo "### %s"\nrun %s\n' % (parser, parser)
+
+    result = subprocess.run(['bash', '-O', 'extglob', '-c', script],
+                            check=False, capture_output=True, text=True)
+
+    if result.returncode != 0 or result.stderr:
+        print('%s: Bash failed:\n%s' % (name, result.stderr))
+        return False
+
+    outputs = result.stdout.split('### ')[1:]
+    failed = False
+
+    for i, words in enumerate(commandlines):
+        results = {}
+        for parser in PARSERS:
+            output = outputs[i * len(PARSERS) + PARSERS.index(parser)]
+            results[parser] = output.split('\n', 1)[1]
+
+        if len(set(results.values())) != 1:
+            failed = True
+            print('%s: Parsers differ for %r' % (name, words))
+            for parser in PARSERS:
+                print('  %s:\n%s' % (parser, results[parser]))
+
+    return not failed
+
+
+def main():
+    '''Main function.'''
+
+    argp = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    argp.add_argument('-n', '--count', type=int, default=200,
+                      help='Number of command lines per definition file')
+    argp.add_argument('--seed', type=int, default=0,
+                      help='Seed for the random number generator')
+    opts = argp.parse_args()
+
+    ok = True
+
+    files = sorted(glob.glob(os.path.join(TESTS_DIR, '*.yaml')))
+    files.append(os.path.join(TESTS_DIR, 'crazy-complete-test'))
+
+    for file in files:
+        if file.endswith('.yaml'):
+            load_from_file = yaml_source.load_from_file
+        else:
+            load_from_file = argparse_source.load_from_file
+
+        try:
+            load_from_file(file)
+        except CrazyError:
+            # Not a valid definition file (e.g. tests.yaml)
+            print('%s: Skipped' % os.path.basename(file))
+            continue
+
+        for config_name, conf in get_configs().items():
+            commandline = generation.enhance_commandline(load_from_file(file), conf)
+            name = '%s (%s)' % (os.path.basename(file), config_name)
+
+            if not check(name, commandline, opts.count, opts.seed):
+                ok = False
+
+    if not ok:
+        sys.exit(1)
+
+    print('OK')
+
+
+if __name__ == '__main__':
+    main()
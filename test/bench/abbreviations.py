@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+
+'''Benchmark the abbreviation generators on large option and command sets.
+
+For each size the time of `OptionAbbreviationGenerator` and
+`CommandAbbreviationGenerator` is measured. The results are checked
+against a reference implementation of the previous quadratic algorithm
+(unless the size exceeds --check-limit).
+'''
+
+import time
+import random
+import argparse
+
+import synthetic  # pylint: disable=unused-import (sets up sys.path)
+import history
+
+from crazy_complete import utils
+
+
+WORDS = ('all', 'allow', 'append', 'archive', 'auto', 'color', 'colour',
+         'config', 'debug', 'default', 'dry', 'exclude', 'force', 'format',
+         'include', 'interactive', 'list', 'log', 'max', 'min', 'no', 'output',
+         'path', 'prefix', 'quiet', 'recursive', 'remote', 'size', 'verbose')
+
+
+def reference_abbreviations(min_abbreviated_length, words):
+    '''The original O(n² · L) algorithm, used for checking the results.'''
+
+    abbreviations = {}
+    min_lengths = {}
+
+    for word in words:
+        abbreviations[word] = []
+        min_lengths[word] = len(word)
+
+        for length in range(len(word), min_abbreviated_length - 1, -1):
+            abbrev = word[0:length]
+
+            can_abbreviate = True
+            for other_word in words:
+                if other_word != word and other_word.startswith(abbrev):
+                    can_abbreviate = False
+                    break
+
+            if can_abbreviate or abbrev == word:
+                abbreviations[word].append(abbrev)
+                min_lengths[word] = length
+
+    return abbreviations, min_lengths
+
+
+def make_words(count, prefix, seed):
+    '''Return `count` distinct words sharing many common prefixes.'''
+
+    rnd = random.Random(seed)
+    words = {}
+
+    while len(words) < count:
+        parts = [rnd.choice(WORDS) for _ in range(rnd.randint(1, 3))]
+        word = prefix + '-'.join(parts)
+        if rnd.random() < 0.3:
+            word += str(rnd.randrange(100))
+        words[word] = None
+
+    return list(words)
+
+
+def bench(cls, min_abbreviated_length, words, repeat, check):
+    '''Time `cls(words)` and optionally compare with the reference.'''
+
+    best = None
+    generator = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        generator = cls(words)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    if check:
+        abbreviations, min_lengths = reference_abbreviations(min_abbreviated_length, words)
+        assert generator.abbreviations == abbreviations, cls.__name__
+        assert generator.min_lengths == min_lengths, cls.__name__
+
+    return best
+
+
+def main():
+    '''Main function.'''
+
+    argp = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    argp.add_argument('--sizes', type=lambda s: [int(i) for i in s.split(',')],
+                      default=[100, 500, 2000, 5000],
+                      help='Comma separated list of word counts')
+    argp.add_argument('-r', '--repeat', type=int, default=3,
+                      help='Number of repetitions (the fastest run is recorded)')
+    argp.add_argument('--check-limit', type=int, default=2000,
+                      help='Check results against the reference up to this size')
+    argp.add_argument('--seed', type=int, default=0,
+                      help='Seed for the random number generator')
+    history.add_arguments(argp)
+    opts = argp.parse_args()
+
+    results = {}
+
+    print(f"{'size':>8}{'options':>14}{'commands':>14}")
+
+    for size in opts.sizes:
+        check = size <= opts.check_limit
+
+        options = make_words(size, '--', opts.seed)
+        commands = make_words(size, '', opts.seed + 1)
+
+        results[str(size)] = {
+            'options': bench(utils.OptionAbbreviationGenerator, 3, options,
+                             opts.repeat, check),
+            'commands': bench(utils.CommandAbbreviationGenerator, 1, commands,
+                              opts.repeat, check),
+        }
+
+        print(f"{size:>8}{results[str(size)]['options']:>14.4f}"
+              f"{results[str(size)]['commands']:>14.4f}")
+
+    params = {'sizes': opts.sizes, 'seed': opts.seed}
+    entry = history.make_entry('abbreviations', params, results, opts.label)
+
+    history.record(opts, entry)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+
+'''Count the forks of the Bash helper functions per completion.
+
+A small program whose options use the `values`, `exec`, `history`,
+`mountpoint` and `mime_file` helpers is generated for Bash. Each option is
+completed repeatedly in a non-interactive Bash and the number of created
+processes per completion is counted. The counting uses the last PID from
+`/proc/loadavg`, so other processes running on the machine add noise; the
+lowest count of all repetitions is recorded.
+
+If bash-completion is not installed, a minimal replacement of
+`_init_completion` is defined, which is enough for the tested helpers.
+'''
+
+import os
+import argparse
+import tempfile
+import subprocess
+
+import synthetic  # pylint: disable=unused-import (sets up sys.path)
+import history
+
+from crazy_complete import bash, config, dictionary_source
+
+
+BASH_COMPLETION_FILES = (
+    '/usr/share/bash-completion/bash_completion',
+    '/etc/bash_completion',
+)
+
+# Candidates with characters that need quoting
+WORDS = ('item with space', "item'quote", 'item$dollar', 'item*star', 'item;semi')
+
+DRIVER = r'''
+for file in %(bash_completion)s; do
+  [[ -f "$file" ]] && { source "$file"; break; }
+done
+
+if ! declare -F _init_completion >/dev/null; then
+  _init_completion() {
+    cur="${COMP_WORDS[COMP_CWORD]}"
+    prev="${COMP_WORDS[COMP_CWORD-1]}"
+    words=("${COMP_WORDS[@]}")
+    cword=$COMP_CWORD
+  }
+fi
+
+source "%(script)s"
+
+complete_option() {
+  COMP_WORDS=(fk "$1" "$2")
+  COMP_CWORD=2
+  COMP_LINE="fk $1 $2"
+  COMP_POINT=${#COMP_LINE}
+  COMPREPLY=()
+  _fk fk "$2" "$1" 2>/dev/null
+}
+
+# The fifth field of /proc/loadavg is the last PID that has been created
+last_pid() {
+  read -r _ _ _ _ pid < /proc/loadavg
+}
+
+option="$1" cur="$2" loops=$3
+
+complete_option "$option" "$cur"
+candidates=${#COMPREPLY[@]}
+
+last_pid; start_pid=$pid
+start=$EPOCHREALTIME
+for ((n=0; n < loops; ++n)); do
+  complete_option "$option" "$cur"
+done
+end=$EPOCHREALTIME
+last_pid; end_pid=$pid
+
+echo "$candidates $((end_pid - start_pid)) ${start/,/.} ${end/,/.}"
+'''
+
+
+def make_definition(count, directory):
+    '''Return the definition of the program and the environment for Bash.'''
+
+    words = [f'{word} {i}' for i in range(count // len(WORDS) + 1) for word in WORDS][:count]
+
+    histfile = os.path.join(directory, 'history')
+    with open(histfile, 'w', encoding='utf-8') as fh:
+        for i in range(count):
+            fh.write(f'ssh user{i}@host{i}\n')
+
+    files = os.path.join(directory, 'files')
+    os.mkdir(files)
+    for i, word in enumerate(words):
+        with open(os.path.join(files, f'{word}.txt'), 'w', encoding='utf-8') as fh:
+            fh.write(f'{i}\n')
+
+    exec_command = "printf '%s\\n' " + ' '.join(
+        "'%s'" % word.replace("'", "'\\''") for word in words)
+
+    definition = {
+        'prog': 'fk',
+        'options': [
+            {'option_strings': ['--values'],   'complete': ['choices', words]},
+            {'option_strings': ['--exec'],     'complete': ['exec', exec_command]},
+            {'option_strings': ['--history'],  'complete': ['history', '[a-z0-9]+@[a-z0-9]+']},
+            {'option_strings': ['--mount'],    'complete': ['mountpoint']},
+            {'option_strings': ['--mime'],     'complete': ['mime_file', 'text/']},
+        ],
+    }
+
+    env = dict(os.environ, HISTFILE=histfile, LC_ALL='C')
+    return definition, env, files
+
+
+def run_completion(script, env, option, cur, loops):
+    '''Complete `option` `loops` times and return (candidates, forks, seconds).'''
+
+    driver = DRIVER % {
+        'bash_completion': ' '.join(BASH_COMPLETION_FILES),
+        'script': script,
+    }
+
+    result = subprocess.run(['bash', '-c', driver, 'bash', option, cur, str(loops)],
+                            env=env, check=True, capture_output=True, text=True)
+    candidates, forks, start, end = result.stdout.split()
+    return int(candidates), int(forks), float(end) - float(start)
+
+
+def main():
+    '''Main function.'''
+
+    argp = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    argp.add_argument('-n', '--candidates', type=int, default=100,
+                      help='Number of candidates per completion [default: %(default)s]')
+    argp.add_argument('-l', '--loops', type=int, default=10,
+                      help='Completions per measurement [default: %(default)s]')
+    argp.add_argument('-r', '--repeat', type=int, default=3,
+                      help='Number of repetitions (the lowest count is recorded)')
+    history.add_arguments(argp)
+    opts = argp.parse_args()
+
+    results = {}
+
+    with tempfile.TemporaryDirectory() as directory:
+        definition, env, files = make_definition(opts.candidates, directory)
+        commandline = dictionary_source.dictionaries_to_commandline([definition])
+
+        script = os.path.join(directory, 'fk.bash')
+        with open(script, 'w', encoding='utf-8') as fh:
+            fh.write(bash.generate_completion(commandline, config.Config()))
+
+        tests = (
+            ('values',     '--values',  'item'),
+            ('exec',       '--exec',    'item'),
+            ('history',    '--history', 'user'),
+            ('mountpoint', '--mount',   ''),
+            ('mime_file',  '--mime',    files + '/item'),
+        )
+
+        print(f"{'helper':<12}{'candidates':>12}{'forks':>10}{'ms':>10}")
+
+        for name, option, cur in tests:
+            forks = seconds = None
+            for _ in range(opts.repeat):
+                candidates, f, s = run_completion(script, env, option, cur, opts.loops)
+                forks = f if forks is None else min(forks, f)
+                seconds = s if seconds is None else min(seconds, s)
+
+            results[name] = {
+                'forks': forks / opts.loops,
+                'seconds': seconds / opts.loops,
+            }
+
+            print(f"{name:<12}{candidates:>12}{results[name]['forks']:>10.1f}"
+                  f"{results[name]['seconds'] * 1000:>10.2f}")
+
+    params = {'candidates': opts.candidates}
+    entry = history.make_entry('bash_forks', params, results, opts.label)
+
+    history.record(opts, entry)
+
+
+if __name__ == '__main__':
+    main()
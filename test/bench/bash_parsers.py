@@ -0,0 +1,443 @@
+#!/usr/bin/env python3
+
+'''Measure the Bash command line parsers and compare with the cost model.
+
+First the unit costs used by `bash_parser_cost` (case statements, case
+patterns, function calls, copying function bodies, table lookups, sourcing
+functions and option tables) are measured with micro benchmarks and printed
+next to the constants of the model.
+
+Then for each synthetic preset the code of every parser is generated. Bash
+measures the time for sourcing the parser, the time for calling it on an
+empty command line and the time for parsing a word of each type (long
+option, short option, positional). The word costs are measured on long
+command lines for random subcommands of the definition, minus the time for
+parsing the words leading to the subcommand. The measurements are printed
+next to the estimates, together with the parser chosen by the model and
+the parser that was measured fastest.
+
+All times are the lowest of several rounds, since the machine may be busy
+with other things.
+'''
+
+import os
+import random
+import argparse
+import tempfile
+import subprocess
+
+import synthetic
+import history
+
+from crazy_complete import (
+    config, generation, shell, bash_parser, bash_parser_v2, bash_parser_v3,
+    bash_parser_cost)
+from crazy_complete.bash_utils import VariableManager
+from crazy_complete.bash_parser_subcommand_code import get_subcommand_path
+
+
+TABLE = '_bench__options'
+
+# Number of sampled command lines per word type and words per command line
+SAMPLES = 3
+WORDS = 50
+
+# `time_it ROUNDS LOOPS COMMAND` sets REPLY to the lowest time in
+# microseconds of running COMMAND for LOOPS times. The results are printed
+# in nanoseconds, to avoid floating point arithmetic in Bash.
+TIMER = r'''
+time_it() {
+  local round n start end
+  REPLY=
+  for ((round=0; round < $1; ++round)); do
+    start=$EPOCHREALTIME
+    for ((n=0; n < $2; ++n)); do $3; done
+    end=$EPOCHREALTIME
+    end=$(( ${end/[.,]/} - ${start/[.,]/} ))
+    (( REPLY && REPLY <= end )) || REPLY=$end
+  done
+}
+'''
+
+# The micro benchmarks loop inside of the functions, since calling a
+# function copies its body
+UNIT_COSTS = r'''
+source %(function_file)s
+declare -gA T=([root$'\t'--option]=1OPT_option)
+word=--unknown
+
+many_statements() {
+  local n
+  for ((n=0; n < %(loops)d; ++n)); do
+%(statements)s
+  done
+}
+
+many_patterns() {
+  local n
+  for ((n=0; n < %(loops)d; ++n)); do
+%(case)s
+  done
+}
+
+no_patterns() {
+  local n
+  for ((n=0; n < %(loops)d; ++n)); do
+    case "$word" in esac
+  done
+}
+
+empty_function() { return; }
+
+lookup() {
+  local n REPLY ___var
+  for ((n=0; n < %(loops)d; ++n)); do
+    REPLY="${T["root"$'\t'"--option"]}"
+    declare -n ___var="${REPLY:1}"
+  done
+}
+
+no_lookup() {
+  local n REPLY ___var
+  for ((n=0; n < %(loops)d; ++n)); do
+    :
+  done
+}
+
+words() {
+  local n argi arg words_dequoted=(a b c d e f g h i j k) POSITIONALS=()
+  for ((n=0; n < %(loops)d; ++n)); do
+    for ((argi=1; argi <= 10; ++argi)); do
+      arg="${words_dequoted[argi]}"
+      case "$arg" in
+        --);;
+        -?*);;
+        *) POSITIONALS+=("$arg");;
+      esac
+    done
+  done
+}
+
+source_function() { source %(function_file)s; }
+source_table() { source %(table_file)s; }
+
+time_it 5 1 many_statements; a=$REPLY
+time_it 5 1 no_patterns; b=$REPLY
+echo "case_statement $(( (a - b) * 1000 / (%(loops)d * %(patterns)d) ))"
+
+time_it 5 1 many_patterns; a=$REPLY
+echo "case_pattern $(( (a - b) * 1000 / (%(loops)d * %(patterns)d) ))"
+
+time_it 5 %(loops)d empty_function; a=$REPLY
+time_it 5 %(loops)d :; b=$REPLY
+echo "function_call $(( (a - b) * 1000 / %(loops)d ))"
+
+time_it 5 %(loops)d big_function; a=$REPLY
+time_it 5 %(loops)d empty_function; b=$REPLY
+echo "function_byte $(( (a - b) * 1000 / (%(loops)d * %(function_bytes)d) ))"
+
+time_it 5 1 lookup; a=$REPLY
+time_it 5 1 no_lookup; b=$REPLY
+echo "table_lookup $(( (a - b) * 1000 / %(loops)d ))"
+
+time_it 5 1 source_function
+echo "source_byte $(( REPLY * 1000 / %(function_bytes)d ))"
+
+time_it 5 1 source_table
+echo "table_entry $(( REPLY * 1000 / %(entries)d ))"
+
+time_it 5 1 words; a=$REPLY
+time_it 5 1 no_lookup; b=$REPLY
+echo "word $(( (a - b) * 1000 / (%(loops)d * 10) ))"
+'''
+
+
+def run_bash(script):
+    '''Run `script` and return its output as a dictionary of microseconds.
+
+    Each line of the output has to consist of a name and a time in
+    nanoseconds.
+    '''
+
+    # The script is passed on STDIN, since it may exceed the maximum
+    # length of a command line argument
+    result = subprocess.run(['bash', '-O', 'extglob', '-s'], input=script,
+                            check=True, capture_output=True, text=True)
+    results = {}
+    for line in result.stdout.splitlines():
+        name, value = line.split()
+        results[name] = int(value) / 1000
+    return results
+
+
+def measure_unit_costs(directory, loops):
+    '''Measure the unit costs of the cost model in microseconds.'''
+
+    patterns = 100
+    entries = 2000
+
+    case = '    case "$word" in\n%s\n    esac' % '\n'.join(
+        '      --option-%d) VAR=OPT_%d; ARGS=1; return;;' % (i, i) for i in range(patterns))
+
+    statements = '\n'.join(
+        '    case "$word" in --option-%d) return;; esac' % i for i in range(patterns))
+
+    function_file = os.path.join(directory, 'function.bash')
+    with open(function_file, 'w', encoding='utf-8') as fh:
+        fh.write('big_function() {\n  return\n%s\n}\n' % case)
+
+    table_file = os.path.join(directory, 'table.bash')
+    with open(table_file, 'w', encoding='utf-8') as fh:
+        fh.write('declare -gA T=(\n%s\n)\n' % '\n'.join(
+            "  [root$'\\t'--option-%d]=1OPT_%d" % (i, i) for i in range(entries)))
+
+    script = TIMER + UNIT_COSTS % {
+        'statements': statements,
+        'case': case,
+        'patterns': patterns,
+        'entries': entries,
+        'loops': loops,
+        'function_file': function_file,
+        'function_bytes': os.path.getsize(function_file),
+        'table_file': table_file,
+    }
+
+    return run_bash(script)
+
+
+def get_commandline_words(cmdline, entries):
+    '''Return the words leading to `cmdline` and the words of each type.'''
+
+    # The subcommands are positionals, counted from the program on
+    leading = [cmdline.get_parents(include_self=True)[0].prog]
+    for parent in cmdline.get_parents(include_self=True)[1:]:
+        positional_num = parent.parent.get_subcommands().get_positional_num()
+        leading += ['file'] * (positional_num - len(leading)) + [parent.prog]
+
+    command = get_subcommand_path(cmdline)
+    long_words = []
+    short_words = []
+
+    for entry_command, option_string, value in entries:
+        if entry_command != command:
+            continue
+
+        # Options with arguments take them in the same word
+        if len(option_string) == 2:
+            short_words.append(option_string + ('x' if value[0] != '0' else ''))
+        elif value[0] != '0':
+            long_words.append(option_string + '=x')
+        else:
+            long_words.append(option_string)
+
+    return leading, {
+        'long':       long_words,
+        'short':      short_words,
+        'positional': ['file'],
+    }
+
+
+def make_samples(commandline, entries, rnd):
+    '''Return random command lines for each word type.
+
+    Returns:
+        dict: Mapping of word types to lists of (words, leading) tuples,
+              where `leading` is the number of words leading to the
+              subcommand.
+    '''
+
+    samples = {}
+
+    for word_type in bash_parser_cost.WORD_TYPES:
+        candidates = []
+        for cmdline in commandline.get_all_commandlines():
+            leading, words = get_commandline_words(cmdline, entries)
+            if words[word_type]:
+                candidates.append((leading, words[word_type]))
+
+        samples[word_type] = []
+        for _ in range(SAMPLES if candidates else 0):
+            leading, words = rnd.choice(candidates)
+            line = leading + [rnd.choice(words) for _ in range(WORDS)] + ['']
+            samples[word_type].append((line, len(leading)))
+
+    return samples
+
+
+def measure_parser(directory, name, code, variables, samples, rounds):
+    '''Measure a parser. Returns the results in microseconds.'''
+
+    parser_file = os.path.join(directory, 'parser_%s.bash' % name)
+    with open(parser_file, 'w', encoding='utf-8') as fh:
+        fh.write(code)
+
+    local = 'local END_OF_OPTIONS POSITIONALS words_dequoted cword'
+    if variables:
+        local += '\n  local -a %s' % ' '.join(sorted(variables))
+
+    def make_function(name, words, cword, call='_bench__parse_commandline'):
+        r  = '%s() {\n' % name
+        r += '  %s\n' % local
+        r += '  words_dequoted=(%s)\n' % ' '.join(shell.quote(w) for w in words)
+        r += '  cword=%d\n' % cword
+        r += '  %s\n' % call
+        r += '}\n'
+        return r
+
+    script = TIMER
+    script += 'source %s\n' % parser_file
+    script += 'source_parser() { source %s; }\n' % parser_file
+    script += 'time_it %d 1 source_parser\n' % rounds
+    script += 'echo "source $(( REPLY * 1000 ))"\n'
+
+    # The costs of calling the parser on an empty command line
+    script += make_function('call', ['prog', ''], 1)
+    script += make_function('no_call', ['prog', ''], 1, ':')
+    script += 'time_it %d 1 call; a=$REPLY\n' % rounds
+    script += 'time_it %d 1 no_call; b=$REPLY\n' % rounds
+    script += 'echo "call $(( (a - b) * 1000 ))"\n'
+
+    for word_type, lines in samples.items():
+        if not lines:
+            continue
+
+        script += 'total=0\n'
+        for i, (words, leading) in enumerate(lines):
+            script += make_function('%s_words_%d' % (word_type, i), words, len(words) - 1)
+            script += make_function('%s_leading_%d' % (word_type, i), words, leading)
+            script += 'time_it %d 1 %s_words_%d; total=$(( total + REPLY ))\n' % (
+                rounds, word_type, i)
+            script += 'time_it %d 1 %s_leading_%d; total=$(( total - REPLY ))\n' % (
+                rounds, word_type, i)
+        script += 'echo "%s $(( total * 1000 / %d ))"\n' % (
+            word_type, len(lines) * WORDS)
+
+    return run_bash(script)
+
+
+def benchmark_preset(directory, preset, rounds, rnd):
+    '''Measure all parsers of `preset`. Returns (estimates, measurements).'''
+
+    conf = config.Config()
+    commandline = synthetic.make_commandline(synthetic.Parameters.from_preset(preset))
+    commandline = generation.enhance_commandline(commandline, conf)
+
+    variable_manager = VariableManager('OPT_')
+    entries = bash_parser_v3.get_table_entries(commandline, variable_manager)
+    commands = []
+    if bash_parser_v3.has_unknown_subcommands(commandline):
+        commands = bash_parser_v3.get_commands(commandline)
+
+    code = {
+        'v1': bash_parser.generate(commandline, variable_manager),
+        'v2': bash_parser_v2.generate(commandline, variable_manager),
+        'v3': bash_parser_v3.generate(commandline, TABLE),
+    }
+
+    estimates = bash_parser_cost.estimate(entries, code)
+    samples = make_samples(commandline, entries, rnd)
+    variables = {value[1:] for _, _, value in entries}
+
+    measurements = {}
+    for parser in bash_parser_cost.PARSERS:
+        parser_code = '_bench__parse_commandline() {\n%s\n}\n' % code[parser]
+        if parser == 'v3':
+            parser_code = '%s\n\n%s' % (
+                bash_parser_v3.generate_table(entries, commands, TABLE), parser_code)
+
+        measurements[parser] = measure_parser(
+            directory, parser, parser_code, variables, samples, rounds)
+
+    return estimates, measurements
+
+
+def get_measured_total(estimate, measurement):
+    '''Return the measured costs, weighted like the estimated costs.'''
+
+    words = sum(measurement[t] * share for t, share in estimate.mix.items())
+    completion = measurement['call'] + bash_parser_cost.WORDS_PER_COMPLETION * words
+    return measurement['source'] + bash_parser_cost.COMPLETIONS_PER_SOURCE * completion
+
+
+def print_preset(preset, estimates, measurements):
+    '''Print the estimates and measurements of a preset.'''
+
+    columns = ('source', 'call') + bash_parser_cost.WORD_TYPES + ('total',)
+
+    print()
+    print(f'{preset} (us, estimated / measured)')
+    print(f"{'parser':<8}" + ''.join(f'{column:>22}' for column in columns))
+
+    measured_totals = {}
+    for parser, est in estimates.items():
+        measurement = measurements[parser]
+        measured_totals[parser] = get_measured_total(est, measurement)
+
+        values = [(est.source, measurement['source']),
+                  (bash_parser_cost.price(est.completion), measurement['call'])]
+        for word_type in bash_parser_cost.WORD_TYPES:
+            if word_type in est.mix:
+                values.append((est.get_word(word_type), measurement[word_type]))
+            else:
+                values.append(None)
+        values.append((est.total, measured_totals[parser]))
+
+        row = f'{parser:<8}'
+        for value in values:
+            row += '%22s' % ('%.1f / %.1f' % value if value else '-')
+        print(row)
+
+    print('chosen: %s, fastest: %s' % (
+        bash_parser_cost.choose(estimates),
+        min(measured_totals, key=measured_totals.get)))
+
+
+def main():
+    '''Main function.'''
+
+    argp = argparse.ArgumentParser(description=__doc__.split('\n', maxsplit=1)[0])
+    argp.add_argument('-p', '--presets', default='small,medium,git',
+                      help='Comma separated list of presets [default: %(default)s]')
+    argp.add_argument('-r', '--repeat', type=int, default=3,
+                      help='Number of rounds, the fastest is recorded [default: %(default)s]')
+    argp.add_argument('-l', '--loops', type=int, default=1000,
+                      help='Loops of the micro benchmarks [default: %(default)s]')
+    argp.add_argument('--seed', type=int, default=0,
+                      help='Seed for the random number generator')
+    history.add_arguments(argp)
+    opts = argp.parse_args()
+
+    rnd = random.Random(opts.seed)
+    results = {}
+
+    model = {
+        'case_statement': bash_parser_cost.COST_CASE_STATEMENT,
+        'case_pattern':   bash_parser_cost.COST_CASE_PATTERN,
+        'function_call':  bash_parser_cost.COST_FUNCTION_CALL,
+        'function_byte':  bash_parser_cost.COST_FUNCTION_BYTE,
+        'table_lookup':   bash_parser_cost.COST_TABLE_LOOKUP,
+        'source_byte':    bash_parser_cost.COST_SOURCE_BYTE,
+        'table_entry':    bash_parser_cost.COST_TABLE_ENTRY,
+        'word':           bash_parser_cost.COST_WORD['positional'],
+    }
+
+    with tempfile.TemporaryDirectory() as directory:
+        results['units'] = measure_unit_costs(directory, opts.loops)
+
+        print(f"{'unit cost (us)':<16}{'model':>10}{'measured':>10}")
+        for name, value in model.items():
+            print(f"{name:<16}{value:>10.3f}{results['units'][name]:>10.3f}")
+
+        for preset in opts.presets.split(','):
+            estimates, measurements = benchmark_preset(directory, preset, opts.repeat, rnd)
+            results[preset] = measurements
+            print_preset(preset, estimates, measurements)
+
+    params = {'presets': opts.presets, 'seed': opts.seed}
+    entry = history.make_entry('bash_parsers', params, results, opts.label)
+
+    history.record(opts, entry)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,160 @@
+'''Record benchmark results to a JSON history file and compare them.'''
+
+import os
+import sys
+import json
+import time
+import platform
+import subprocess
+
+HISTORY_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'history.json')
+
+
+def _git_revision():
+    try:
+        result = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            check=True)
+        return result.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def add_arguments(argp):
+    '''Add the history related options to the argument parser `argp`.'''
+
+    argp.add_argument('--history', default=HISTORY_FILE,
+                      help='History file [default: %(default)s]')
+    argp.add_argument('--no-record', action='store_true',
+                      help='Do not append the results to the history file')
+    argp.add_argument('--label', help='Label for the history entry')
+    argp.add_argument('--threshold', type=float, default=0.1,
+                      help='Relative increase reported as regression')
+
+
+def make_entry(benchmark, params, results, label=None):
+    '''Return a history entry.
+
+    Args:
+        benchmark (str):
+            Name of the benchmark.
+
+        params (dict):
+            Parameters of the benchmark run. Only entries having the same
+            benchmark name and parameters are compared against each other.
+
+        results (dict):
+            Nested dictionary of measurements. Leaves are numbers, lower
+            is better.
+
+        label (str or None):
+            Optional free text label (e.g. a release name).
+    '''
+
+    return {
+        'benchmark': benchmark,
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'revision':  _git_revision(),
+        'label':     label,
+        'python':    platform.python_version(),
+        'machine':   platform.machine(),
+        'params':    params,
+        'results':   results,
+    }
+
+
+def load(file):
+    '''Load the history file. Returns an empty list if it does not exist.'''
+
+    try:
+        with open(file, 'r', encoding='utf-8') as fh:
+            return json.load(fh)
+    except FileNotFoundError:
+        return []
+
+
+def append(file, entry):
+    '''Append `entry` to the history file.'''
+
+    entries = load(file)
+    entries.append(entry)
+
+    with open(file, 'w', encoding='utf-8') as fh:
+        json.dump(entries, fh, indent=1)
+        fh.write('\n')
+
+
+def find_previous(entries, entry):
+    '''Return the latest entry comparable to `entry`, or None.'''
+
+    for previous in reversed(entries):
+        if (previous['benchmark'] == entry['benchmark'] and
+                previous['params'] == entry['params']):
+            return previous
+
+    return None
+
+
+def _flatten(results, prefix=''):
+    flat = {}
+
+    for key, value in results.items():
+        name = f'{prefix}{key}'
+        if isinstance(value, dict):
+            flat.update(_flatten(value, f'{name}.'))
+        elif isinstance(value, (int, float)):
+            flat[name] = value
+
+    return flat
+
+
+def compare(previous, current, threshold=0.1, file=sys.stdout):
+    '''Print a comparison of two entries.
+
+    Returns:
+        list: Names of measurements that regressed by more than `threshold`.
+    '''
+
+    old = _flatten(previous['results'])
+    new = _flatten(current['results'])
+    regressions = []
+
+    print(f"Compared to {previous['timestamp']} "
+          f"(revision {previous['revision']}, label {previous['label']}):",
+          file=file)
+
+    for name, value in new.items():
+        if name not in old or not old[name]:
+            continue
+
+        ratio = value / old[name]
+        mark = ''
+        if ratio > 1 + threshold:
+            mark = '  <-- REGRESSION'
+            regressions.append(name)
+        elif ratio < 1 - threshold:
+            mark = '  (improved)'
+
+        print(f'  {name:<45} {old[name]:>12.6g} -> {value:>12.6g} '
+              f'({(ratio - 1) * 100:+.1f}%){mark}', file=file)
+
+    return regressions
+
+
+def record(opts, entry):
+    '''Compare `entry` to the previous run and append it to the history.
+
+    `opts` are the parsed options of `add_arguments()`.
+    '''
+
+    previous = find_previous(load(opts.history), entry)
+    if previous is not None:
+        print()
+        compare(previous, entry, opts.threshold)
+
+    if not opts.no_record:
+        append(opts.history, entry)
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+
+'''Measure the memory usage of loading a definition with tracemalloc.
+
+A synthetic definition is written to a temporary YAML file. For each phase
+the peak of traced memory is measured and reported per 1,000 options:
+
+  - parse:    `ExtendedYAMLParser.parse` (the `ValueWithTrace` tree)
+  - load:     `yaml_source.load_from_file` (parsing, validation and
+              creating the `cli.CommandLine` objects)
+  - retained: memory still held by the loaded `cli.CommandLine` tree
+  - enhance:  `generation.enhance_commandline` on the loaded tree
+'''
+
+import os
+import gc
+import argparse
+import tempfile
+import tracemalloc
+
+import synthetic
+import history
+
+from crazy_complete import config, generation, yaml_source
+from crazy_complete.extended_yaml_parser import ExtendedYAMLParser
+
+
+def measure(function):
+    '''Return the result of `function`, its peak and its retained memory in bytes.'''
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = function()
+        gc.collect()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return result, peak, current
+
+
+def main():
+    '''Main function.'''
+
+    argp = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    argp.add_argument('--width', type=int, default=20,
+                      help='Number of subcommands [default: %(default)s]')
+    argp.add_argument('--options', type=int, default=250,
+                      help='Number of options per subcommand [default: %(default)s]')
+    argp.add_argument('--root-options', type=int, default=0,
+                      help='Number of options of the program [default: %(default)s]')
+    history.add_arguments(argp)
+    opts = argp.parse_args()
+
+    params = synthetic.Parameters(
+        width=opts.width, depth=1, options=opts.options, root_options=opts.root_options)
+
+    commandline = synthetic.make_commandline(params)
+    statistics = synthetic.get_statistics(commandline)
+    print('Definition:', statistics)
+
+    per_1k = 1000 / statistics['options']
+    results = {}
+
+    with tempfile.TemporaryDirectory() as directory:
+        file = os.path.join(directory, 'definition.yaml')
+
+        with open(file, 'w', encoding='utf-8') as fh:
+            fh.write(yaml_source.commandline_to_yaml(commandline))
+
+        with open(file, 'r', encoding='utf-8') as fh:
+            content = fh.read()
+
+        del commandline
+
+        _, peak, _ = measure(lambda: ExtendedYAMLParser().parse(content))
+        results['parse'] = int(peak * per_1k)
+
+        loaded, peak, current = measure(lambda: yaml_source.load_from_file(file))
+        results['load'] = int(peak * per_1k)
+        results['retained'] = int(current * per_1k)
+
+        conf = config.Config()
+        _, peak, _ = measure(lambda: generation.enhance_commandline(loaded, conf))
+        results['enhance'] = int(peak * per_1k)
+
+    print()
+    print('Peak bytes per 1k options:')
+    for name, value in results.items():
+        print(f'{name:<12}{value:>14,}')
+
+    entry = history.make_entry('memory', params.to_dict(), results, opts.label)
+
+    history.record(opts, entry)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+
+'''Benchmark the template preprocessor on all built-in helper functions.
+
+The compiled preprocessor (`preprocessor.preprocess`) is compared with the
+previous line-by-line implementation. Each template is rendered without
+defines and with all defines it references. The results of both
+implementations are checked for equality.
+'''
+
+import time
+import argparse
+
+import synthetic  # pylint: disable=unused-import (sets up sys.path)
+import history
+
+from crazy_complete import (
+    config, preprocessor, bash_helpers, fish_helpers, zsh_helpers, bash_parser_v2)
+
+
+def reference_preprocess(string, defines):
+    '''The previous line-by-line implementation, used for comparison.'''
+
+    defines = set(defines)
+    output = []
+    stack = []
+
+    for line in string.splitlines(keepends=True):
+        stripped_line = line.lstrip()
+
+        if stripped_line.startswith("#ifdef"):
+            stack.append(stripped_line.split()[1] in defines)
+        elif stripped_line.startswith("#else"):
+            if not stack:
+                raise SyntaxError("#else without #ifdef")
+            stack[-1] = not stack[-1]
+        elif stripped_line.startswith("#endif"):
+            if not stack:
+                raise SyntaxError("#endif without #ifdef")
+            stack.pop()
+        elif not stack or all(stack):
+            output.append(line)
+
+    if stack:
+        raise SyntaxError("Unclosed #ifdef")
+
+    return ''.join(output)
+
+
+def get_templates():
+    '''Return the code of all built-in helper functions.'''
+
+    conf = config.Config()
+    templates = {}
+
+    for cls in (bash_helpers.BashHelpers, fish_helpers.FishHelpers, zsh_helpers.ZshHelpers):
+        helpers = cls(conf, 'prog')
+        for function in helpers.functions.values():
+            templates[function.code] = None
+
+    templates[bash_parser_v2._PARSER_CODE] = None  # pylint: disable=protected-access
+    return list(templates)
+
+
+def get_jobs(templates):
+    '''Return a list of (template, defines) to render.'''
+
+    jobs = []
+    for template in templates:
+        defines = preprocessor.Template(template).defines
+        jobs.append((template, frozenset()))
+        if defines:
+            jobs.append((template, defines))
+    return jobs
+
+
+def bench(function, jobs, repeat, loops):
+    '''Return the fastest time of calling `function` for all jobs `loops` times.'''
+
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(loops):
+            for args in jobs:
+                function(*args)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    '''Main function.'''
+
+    argp = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    argp.add_argument('-r', '--repeat', type=int, default=5,
+                      help='Number of repetitions (the fastest run is recorded)')
+    argp.add_argument('-l', '--loops', type=int, default=20,
+                      help='Number of times all templates are rendered per repetition')
+    history.add_arguments(argp)
+    opts = argp.parse_args()
+
+    templates = get_templates()
+    jobs = get_jobs(templates)
+
+    for template, defines in jobs:
+        assert preprocessor.preprocess(template, defines) == \
+            reference_preprocess(template, defines)
+
+    preprocessor.compile_template.cache_clear()
+
+    results = {
+        'compile': bench(preprocessor.Template, [(t,) for t in templates], opts.repeat, 1),
+        'reference': bench(reference_preprocess, jobs, opts.repeat, opts.loops),
+        'compiled': bench(preprocessor.preprocess, jobs, opts.repeat, opts.loops),
+    }
+
+    print(f'{len(templates)} templates, {len(jobs)} renderings x {opts.loops}')
+    for name, seconds in results.items():
+        print(f'{name:<12}{seconds:>10.4f}')
+
+    params = {'loops': opts.loops, 'templates': len(templates)}
+    entry = history.make_entry('preprocessor', params, results, opts.label)
+
+    history.record(opts, entry)
+
+
+if __name__ == '__main__':
+    main()
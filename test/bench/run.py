@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+
+'''Benchmark the generation phases of crazy-complete on synthetic definitions.
+
+For each shell the following phases are timed (inclusive, in seconds):
+
+    load_yaml / load_json     Loading the definition file
+    validate                  Time spent in `scheme_validator.Validator`
+                              (also included in load_yaml)
+    enhance_commandline       `generation.enhance_commandline`
+    generators                Per-commandline generator objects
+    helpers                   Rendering of the used helper functions
+    output                    `Output.get`
+    total                     `<shell>.generate_completion`
+
+Results are appended to a JSON history file and compared against the
+latest entry that was recorded with the same parameters.
+'''
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+import functools
+from contextlib import contextmanager
+
+import synthetic
+import history
+
+from crazy_complete import (
+    bash, fish, zsh, config, generation, helpers, output,
+    scheme_validator, yaml_source, json_source)
+
+
+SHELLS = ('bash', 'fish', 'zsh')
+
+GENERATORS = {
+    'bash': (bash, 'BashCompletionGenerator'),
+    'fish': (fish, 'FishCompletionGenerator'),
+    'zsh':  (zsh,  'ZshCompletionFunction'),
+}
+
+
+class PhaseTimer:
+    '''Accumulate wall time of wrapped callables per phase.
+
+    Recursive calls of the same phase (e.g. `FishCompletionGenerator`
+    creating its children) are only counted once.
+    '''
+
+    def __init__(self):
+        self.times = {}
+        self.counts = {}
+        self.active = set()
+
+    def reset(self):
+        '''Clear all measurements.'''
+
+        self.times.clear()
+        self.counts.clear()
+
+    def wrap(self, phase, func):
+        '''Return a wrapper of `func` which accounts its time to `phase`.'''
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if phase in self.active:
+                return func(*args, **kwargs)
+
+            self.active.add(phase)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                self.active.discard(phase)
+                self.times[phase] = self.times.get(phase, 0.0) + elapsed
+                self.counts[phase] = self.counts.get(phase, 0) + 1
+
+        return wrapper
+
+    @contextmanager
+    def patch(self, patches):
+        '''Temporarily replace attributes by timing wrappers.
+
+        Args:
+            patches (list):
+                List of (phase, object, attribute name) tuples.
+        '''
+
+        saved = []
+
+        try:
+            for phase, obj, attr in patches:
+                original = getattr(obj, attr)
+                saved.append((obj, attr, original))
+                setattr(obj, attr, self.wrap(phase, original))
+            yield self
+        finally:
+            for obj, attr, original in reversed(saved):
+                setattr(obj, attr, original)
+
+
+def _common_patches():
+    return [
+        ('validate',            scheme_validator.Validator, 'add_definition'),
+        ('validate',            scheme_validator.Validator, 'finish'),
+        ('enhance_commandline', generation,                 'enhance_commandline'),
+        ('helpers',             helpers.GeneralHelpers,     'get_used_functions_code'),
+        ('output',              output.Output,              'get'),
+    ]
+
+
+def _best(runs):
+    '''Return the minimum of each phase over all runs.'''
+
+    best = {}
+    for run in runs:
+        for phase, value in run.items():
+            best[phase] = min(best.get(phase, value), value)
+    return best
+
+
+def bench_loading(directory, commandline, repeat):
+    '''Time loading the definition from YAML and JSON.'''
+
+    yaml_file = os.path.join(directory, 'definition.yaml')
+    json_file = os.path.join(directory, 'definition.json')
+
+    with open(yaml_file, 'w', encoding='utf-8') as fh:
+        fh.write(yaml_source.commandline_to_yaml(commandline))
+
+    with open(json_file, 'w', encoding='utf-8') as fh:
+        fh.write(json_source.commandline_to_json(commandline))
+
+    timer = PhaseTimer()
+    patches = _common_patches() + [
+        ('load_yaml', yaml_source, 'load_from_file'),
+        ('load_json', json_source, 'load_from_file'),
+    ]
+
+    results = {}
+    loaded = None
+
+    for name, module, file in (('yaml', yaml_source, yaml_file),
+                               ('json', json_source, json_file)):
+        runs = []
+        for _ in range(repeat):
+            timer.reset()
+            with timer.patch(patches):
+                loaded = module.load_from_file(file)
+            runs.append(dict(timer.times))
+        results[name] = _best(runs)
+        results[name]['bytes'] = os.path.getsize(file)
+
+    return loaded, results
+
+
+def bench_shell(shell, commandline, conf, repeat):
+    '''Time the generation phases of a single shell.'''
+
+    module, generator = GENERATORS[shell]
+    timer = PhaseTimer()
+    patches = _common_patches() + [
+        ('generators', module, generator),
+        ('total',      module, 'generate_completion'),
+    ]
+
+    runs = []
+    result = None
+    for _ in range(repeat):
+        timer.reset()
+        with timer.patch(patches):
+            result = module.generate_completion(commandline, conf)
+        runs.append(dict(timer.times))
+
+    best = _best(runs)
+    best['output_bytes'] = len(result)
+    return best
+
+
+def _make_config(opts):
+    conf = config.Config()
+    conf.set_abbreviate_commands(opts.abbreviate)
+    conf.set_abbreviate_options(opts.abbreviate)
+    conf.set_inherit_options(opts.inherit_options)
+    return conf
+
+
+def _print_results(results, file=sys.stdout):
+    print(f"{'phase':<28}" + ''.join(f'{s:>14}' for s in results['shells']), file=file)
+
+    phases = []
+    for shell_results in results['shells'].values():
+        for phase in shell_results:
+            if phase not in phases:
+                phases.append(phase)
+
+    for phase in phases:
+        line = f'{phase:<28}'
+        for shell_results in results['shells'].values():
+            value = shell_results.get(phase)
+            line += f'{value:>14.4f}' if isinstance(value, float) else f'{value!s:>14}'
+        print(line, file=file)
+
+    print(file=file)
+    for name, load_results in results['load'].items():
+        parts = ', '.join(f'{k}={v:.4f}' if isinstance(v, float) else f'{k}={v}'
+                          for k, v in load_results.items())
+        print(f'load {name}: {parts}', file=file)
+
+
+def main():
+    '''Main function.'''
+
+    argp = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    argp.add_argument('-p', '--preset', default='small', choices=synthetic.PRESETS,
+                      help='Select a preset for the definition size')
+    argp.add_argument('--width', type=int, help='Subcommands per command line')
+    argp.add_argument('--depth', type=int, help='Levels of subcommands')
+    argp.add_argument('--options', type=int, help='Options per subcommand')
+    argp.add_argument('--root-options', type=int, help='Options of the program')
+    argp.add_argument('--arg-density', type=float, help='Fraction of options taking an argument')
+    argp.add_argument('--when-density', type=float, help='Fraction of options with `when`')
+    argp.add_argument('--groups', type=int, help='Mutually exclusive groups per command line')
+    argp.add_argument('--group-density', type=float, help='Fraction of options in a group')
+    argp.add_argument('--completers', type=lambda s: s.split(','),
+                      help='Comma separated list of completers to use')
+    argp.add_argument('--seed', type=int, help='Seed for the random number generator')
+    argp.add_argument('-s', '--shells', type=lambda s: s.split(','), default=list(SHELLS),
+                      help='Comma separated list of shells')
+    argp.add_argument('-r', '--repeat', type=int, default=3,
+                      help='Number of repetitions (the fastest run is recorded)')
+    argp.add_argument('--abbreviate', action='store_true',
+                      help='Enable abbreviation of commands and options')
+    argp.add_argument('--inherit-options', action='store_true',
+                      help='Enable inheriting of options')
+    history.add_arguments(argp)
+    opts = argp.parse_args()
+
+    params = synthetic.Parameters.from_preset(
+        opts.preset,
+        width=opts.width,
+        depth=opts.depth,
+        options=opts.options,
+        root_options=opts.root_options,
+        arg_density=opts.arg_density,
+        when_density=opts.when_density,
+        groups=opts.groups,
+        group_density=opts.group_density,
+        completers=opts.completers,
+        seed=opts.seed)
+
+    commandline = synthetic.make_commandline(params)
+    statistics = synthetic.get_statistics(commandline)
+    print('Definition:', statistics, file=sys.stderr)
+
+    results = {'load': {}, 'shells': {}}
+
+    with tempfile.TemporaryDirectory() as directory:
+        loaded, results['load'] = bench_loading(directory, commandline, opts.repeat)
+
+    conf = _make_config(opts)
+
+    for shell in opts.shells:
+        print(f'Benchmarking {shell} ...', file=sys.stderr)
+        results['shells'][shell] = bench_shell(shell, loaded, conf, opts.repeat)
+
+    _print_results(results)
+
+    run_params = params.to_dict()
+    run_params['abbreviate'] = opts.abbreviate
+    run_params['inherit_options'] = opts.inherit_options
+    run_params['shells'] = opts.shells
+    entry = history.make_entry('generation', run_params, results, opts.label)
+    entry['statistics'] = statistics
+
+    history.record(opts, entry)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,266 @@
+'''Build synthetic command line definitions for benchmarking.'''
+
+import os
+import sys
+import random
+
+# We want to import the development version of crazy-complete,
+# not the installed version.
+CRAZY_COMPLETE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, CRAZY_COMPLETE_DIR)
+
+from crazy_complete import cli  # noqa: E402
+
+
+# Sample completer specifications, selectable by name.
+COMPLETERS = {
+    'none':           ['none'],
+    'choices':        ['choices', ['alpha', 'beta', 'gamma', 'delta', 'epsilon']],
+    'choices_dict':   ['choices', {'on': 'Enable it', 'off': 'Disable it', 'auto': 'Decide'}],
+    'file':           ['file'],
+    'file_ext':       ['file', {'extensions': ['txt', 'log', 'conf']}],
+    'directory':      ['directory'],
+    'integer':        ['integer', {'min': 0, 'max': 100}],
+    'float':          ['float', {'min': 0.0, 'max': 1.0}],
+    'range':          ['range', 1, 10],
+    'exec':           ['exec', "printf '%s\\n' one two three"],
+    'user':           ['user'],
+    'hostname':       ['hostname'],
+    'signal':         ['signal'],
+    'history':        ['history', '[a-z]+@[a-z]+'],
+    'value_list':     ['value_list', {'values': ['read', 'write', 'exec']}],
+    'list':           ['list', ['choices', ['x', 'y', 'z']]],
+    'combine':        ['combine', [['user'], ['hostname']]],
+    'key_value_list': ['key_value_list', ',', '=', [
+                          ['size', 'The size', ['integer']],
+                          ['mode', 'The mode', ['choices', ['fast', 'slow']]],
+                          ['flag', 'A flag', None]]],
+}
+
+DEFAULT_COMPLETERS = ('choices', 'file', 'directory', 'integer', 'exec',
+                      'value_list', 'user', 'key_value_list')
+
+PRESETS = {
+    # name:     (width, depth, options, root_options)
+    'small':    (5,     1,     10,      20),
+    'medium':   (20,    2,     15,      40),
+    'git':      (150,   1,     30,      60),
+    'kubectl':  (40,    2,     20,      60),
+    'huge':     (25,    2,     40,      2000),
+}
+
+
+class Parameters:
+    '''Parameters controlling the shape of a synthetic definition.'''
+
+    # pylint: disable=too-many-instance-attributes
+    # pylint: disable=too-few-public-methods
+
+    def __init__(self,
+                 width=5,
+                 depth=1,
+                 options=10,
+                 root_options=None,
+                 arg_density=0.5,
+                 when_density=0.1,
+                 groups=2,
+                 group_density=0.2,
+                 completers=DEFAULT_COMPLETERS,
+                 seed=0):
+        '''Initialize the parameters.
+
+        Args:
+            width (int):
+                Number of subcommands of each non-leaf command line.
+
+            depth (int):
+                Number of subcommand levels below the program.
+
+            options (int):
+                Number of options of each subcommand.
+
+            root_options (int or None):
+                Number of options of the program. Defaults to `options`.
+
+            arg_density (float):
+                Fraction of options that take an argument.
+
+            when_density (float):
+                Fraction of options that carry a `when` condition.
+
+            groups (int):
+                Number of mutually exclusive groups per command line.
+
+            group_density (float):
+                Fraction of options that belong to a group.
+
+            completers (list of str):
+                Names of completers from `COMPLETERS` which are used
+                round-robin for options and positionals.
+
+            seed (int):
+                Seed for the random number generator.
+        '''
+
+        for name in completers:
+            if name not in COMPLETERS:
+                raise ValueError(f'Unknown completer: {name}')
+
+        self.width = width
+        self.depth = depth
+        self.options = options
+        self.root_options = options if root_options is None else root_options
+        self.arg_density = arg_density
+        self.when_density = when_density
+        self.groups = groups
+        self.group_density = group_density
+        self.completers = list(completers)
+        self.seed = seed
+
+    @staticmethod
+    def from_preset(name, **overrides):
+        '''Create parameters from a preset, overriding single values.'''
+
+        width, depth, options, root_options = PRESETS[name]
+        params = {
+            'width': width,
+            'depth': depth,
+            'options': options,
+            'root_options': root_options,
+        }
+        params.update({k: v for k, v in overrides.items() if v is not None})
+        return Parameters(**params)
+
+    def to_dict(self):
+        '''Return the parameters as a dictionary.'''
+
+        return {
+            'width':         self.width,
+            'depth':         self.depth,
+            'options':       self.options,
+            'root_options':  self.root_options,
+            'arg_density':   self.arg_density,
+            'when_density':  self.when_density,
+            'groups':        self.groups,
+            'group_density': self.group_density,
+            'completers':    self.completers,
+            'seed':          self.seed,
+        }
+
+
+class _Builder:
+    '''Build a `cli.CommandLine` tree from `Parameters`.'''
+
+    # pylint: disable=too-few-public-methods
+
+    SHORT_CHARS = 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ'
+
+    def __init__(self, params):
+        self.params = params
+        self.random = random.Random(params.seed)
+        self.completer_index = 0
+
+    def _next_completer(self):
+        name = self.params.completers[self.completer_index % len(self.params.completers)]
+        self.completer_index += 1
+        return COMPLETERS[name]
+
+    def _make_when(self, option_strings):
+        '''Return a condition referencing one of the previous options.'''
+
+        if not option_strings:
+            return None
+
+        other = self.random.choice(option_strings)
+        kind = self.random.randrange(3)
+
+        if kind == 0:
+            return f'has_option {other}'
+
+        if kind == 1:
+            return f'option_is {other} -- alpha beta'
+
+        return f'option_match {other} -- ^[a-z]+[0-9]*$'
+
+    def _add_options(self, commandline, count):
+        rnd = self.random
+        params = self.params
+        previous = []
+
+        for i in range(count):
+            option_strings = [f'--option-{i}-{commandline.prog}']
+            if i < len(self.SHORT_CHARS):
+                option_strings.insert(0, f'-{self.SHORT_CHARS[i]}')
+
+            kwargs = {'help': f'Help for option {i} of {commandline.prog}'}
+
+            if rnd.random() < params.arg_density:
+                kwargs['complete'] = self._next_completer()
+                kwargs['metavar'] = f'ARG{i}'
+
+            if params.groups and rnd.random() < params.group_density:
+                kwargs['groups'] = [f'group{rnd.randrange(params.groups)}']
+
+            if rnd.random() < params.when_density:
+                kwargs['when'] = self._make_when(previous)
+
+            if i % 13 == 12:
+                kwargs['repeatable'] = True
+            elif i % 17 == 16:
+                kwargs['hidden'] = True
+            elif i % 29 == 28:
+                kwargs['final'] = True
+
+            commandline.add_option(option_strings, **kwargs)
+            previous.append(option_strings[-1])
+
+    def _add_positionals(self, commandline):
+        commandline.add_positional(
+            1, metavar='FILE', help='Input file', complete=['file'])
+
+        commandline.add_positional(
+            2, metavar='VALUE', help='Some value',
+            complete=self._next_completer(), repeatable=True)
+
+    def build(self, commandline, level):
+        '''Populate `commandline` and its subcommands recursively.'''
+
+        if level == 0:
+            self._add_options(commandline, self.params.root_options)
+        else:
+            self._add_options(commandline, self.params.options)
+
+        if level == self.params.depth:
+            self._add_positionals(commandline)
+            return
+
+        subcommands = commandline.add_subcommands()
+        for i in range(self.params.width):
+            sub = subcommands.add_commandline(f'cmd{level}x{i}', f'Subcommand {i}')
+            if i % 7 == 6:
+                sub.aliases = [f'alias{level}x{i}']
+            self.build(sub, level + 1)
+
+
+def make_commandline(params, prog='synthetic'):
+    '''Return a synthetic `cli.CommandLine` object for `params`.'''
+
+    commandline = cli.CommandLine(prog, help='Synthetic benchmark program')
+    _Builder(params).build(commandline, 0)
+    return commandline
+
+
+def get_statistics(commandline):
+    '''Return a dictionary describing the size of `commandline`.'''
+
+    commandlines = commandline.get_all_commandlines()
+    options = sum(len(c.options) for c in commandlines)
+    positionals = sum(len(c.positionals) for c in commandlines)
+    with_when = sum(1 for c in commandlines for o in c.options if o.when)
+
+    return {
+        'commandlines': len(commandlines),
+        'options':      options,
+        'positionals':  positionals,
+        'when':         with_when,
+    }
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+
+'''Benchmark loading a large YAML definition with and without libyaml.
+
+A synthetic definition (about 20,000 options by default) is written to a
+temporary YAML file. `ExtendedYAMLParser.parse` is timed with the libyaml
+based parser and with the pure Python parser, and the parsed values
+including their line and column information are checked for equality.
+`yaml_source.load_from_file` is timed as a whole.
+
+The loaded definition is then compiled (`crazy-complete compile`) and
+`compiled_source.load_from_file` is timed. The command lines loaded from
+the compiled file are checked against the ones loaded from YAML.
+'''
+
+import os
+import time
+import argparse
+import tempfile
+
+import synthetic
+import history
+
+from crazy_complete import yaml_source, json_source, compiled_source
+from crazy_complete.extended_yaml_parser import ExtendedYAMLParser, HAVE_LIBYAML
+
+
+def flatten(value):
+    '''Turn parsed `ValueWithTrace` objects into comparable tuples.'''
+
+    if isinstance(value, list):
+        return [flatten(v) for v in value]
+
+    inner = value.value
+
+    if isinstance(inner, dict):
+        inner = [(flatten(k), flatten(v)) for k, v in inner.items()]
+    elif isinstance(inner, list):
+        inner = [flatten(v) for v in inner]
+
+    return (inner, value.line, value.column)
+
+
+def bench(function, repeat):
+    '''Return the fastest time and the result of calling `function`.'''
+
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    '''Main function.'''
+
+    argp = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    argp.add_argument('--width', type=int, default=50,
+                      help='Number of subcommands [default: %(default)s]')
+    argp.add_argument('--options', type=int, default=390,
+                      help='Number of options per subcommand [default: %(default)s]')
+    argp.add_argument('--root-options', type=int, default=500,
+                      help='Number of options of the program [default: %(default)s]')
+    argp.add_argument('-r', '--repeat', type=int, default=3,
+                      help='Number of repetitions (the fastest run is recorded)')
+    history.add_arguments(argp)
+    opts = argp.parse_args()
+
+    params = synthetic.Parameters(
+        width=opts.width, depth=1, options=opts.options, root_options=opts.root_options)
+
+    commandline = synthetic.make_commandline(params)
+    print('Definition:', synthetic.get_statistics(commandline))
+
+    results = {}
+
+    with tempfile.TemporaryDirectory() as directory:
+        file = os.path.join(directory, 'definition.yaml')
+
+        with open(file, 'w', encoding='utf-8') as fh:
+            fh.write(yaml_source.commandline_to_yaml(commandline))
+
+        with open(file, 'r', encoding='utf-8') as fh:
+            content = fh.read()
+
+        results['bytes'] = len(content)
+
+        parsed = {}
+        variants = [('python', False)]
+        if HAVE_LIBYAML:
+            variants.append(('libyaml', True))
+        else:
+            print('PyYAML was built without libyaml, skipping libyaml benchmark')
+
+        for name, use_libyaml in variants:
+            parser = ExtendedYAMLParser(use_libyaml=use_libyaml)
+            seconds, parsed[name] = bench(lambda p=parser: p.parse(content), opts.repeat)
+            results[f'parse_{name}'] = seconds
+
+        if 'libyaml' in parsed:
+            assert flatten(parsed['python']) == flatten(parsed['libyaml'])
+
+        results['load_from_file'], loaded = bench(
+            lambda: yaml_source.load_from_file(file), opts.repeat)
+
+        compiled_file = os.path.join(directory, 'definition.ccd')
+
+        with open(compiled_file, 'wb') as fh:
+            fh.write(compiled_source.commandline_to_compiled(loaded))
+
+        results['compiled_bytes'] = os.path.getsize(compiled_file)
+        results['load_compiled'], compiled = bench(
+            lambda: compiled_source.load_from_file(compiled_file), opts.repeat)
+
+        assert json_source.commandline_to_json(compiled) == json_source.commandline_to_json(loaded)
+
+    for name, value in results.items():
+        if isinstance(value, float):
+            print(f'{name:<20}{value:>10.4f}')
+        else:
+            print(f'{name:<20}{value:>10}')
+
+    entry = history.make_entry('yaml_loading', params.to_dict(), results, opts.label)
+
+    history.record(opts, entry)
+
+
+if __name__ == '__main__':
+    main()
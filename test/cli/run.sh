@@ -0,0 +1,68 @@
+#!/bin/sh
+
+# Checks how crazy-complete parses its own command line
+
+set -e
+
+cd "$(dirname "$0")"
+
+CRAZY_COMPLETE=../../crazy-complete
+TEST_FILE=../../examples/example.yaml
+TMP_DIR=$(mktemp -d)
+trap 'rm -rf "$TMP_DIR"' EXIT
+
+# Don't touch the cache of the user
+export XDG_CACHE_HOME="$TMP_DIR/xdg"
+
+set -x
+
+# Flags that are given before the positional arguments must not consume them
+$CRAZY_COMPLETE --cache bash "$TEST_FILE" -o /dev/null
+$CRAZY_COMPLETE --no-cache --cache bash "$TEST_FILE" -o /dev/null
+
+# --cache-dir implies --cache
+$CRAZY_COMPLETE --cache-dir "$TMP_DIR" bash "$TEST_FILE" -o "$TMP_DIR/out1.bash"
+ls "$TMP_DIR"/*.cache >/dev/null
+$CRAZY_COMPLETE --cache-dir "$TMP_DIR" bash "$TEST_FILE" -o "$TMP_DIR/out2.bash"
+cmp "$TMP_DIR/out1.bash" "$TMP_DIR/out2.bash"
+
+# Binary output to STDOUT is rejected in batch mode
+echo "compile $TEST_FILE" > "$TMP_DIR/batch"
+! $CRAZY_COMPLETE --batch "$TMP_DIR/batch" 2>"$TMP_DIR/stderr" || exit 1
+grep -q 'Cannot write binary output to STDOUT in batch mode' "$TMP_DIR/stderr"
+echo "compile $TEST_FILE -o $TMP_DIR/out.ccd" > "$TMP_DIR/batch"
+$CRAZY_COMPLETE --batch "$TMP_DIR/batch" 2>/dev/null
+test -s "$TMP_DIR/out.ccd"
+
+# --profile is a flag, the output file is given by --profile-output
+$CRAZY_COMPLETE --profile bash "$TEST_FILE" -o /dev/null 2>"$TMP_DIR/stderr"
+test -s "$TMP_DIR/stderr"
+$CRAZY_COMPLETE --profile-output "$TMP_DIR/profile.json" bash "$TEST_FILE" -o /dev/null
+python3 -m json.tool "$TMP_DIR/profile.json" >/dev/null
+
+# Multiple shells are written to the files given by the {shell} placeholder
+$CRAZY_COMPLETE -o "$TMP_DIR/multi.{shell}" bash,zsh,json "$TEST_FILE"
+for shell in bash zsh json; do
+  $CRAZY_COMPLETE -o "$TMP_DIR/single.$shell" $shell "$TEST_FILE"
+  cmp "$TMP_DIR/single.$shell" "$TMP_DIR/multi.$shell"
+done
+! $CRAZY_COMPLETE -o "$TMP_DIR/multi" bash,zsh "$TEST_FILE" 2>/dev/null || exit 1
+! $CRAZY_COMPLETE foo "$TEST_FILE" 2>"$TMP_DIR/stderr" || exit 1
+grep -q "invalid choice: 'foo' (choose from 'bash', 'fish', 'zsh'" "$TMP_DIR/stderr"
+
+# --jobs keeps the order of the output, runs all lines and fails if one failed
+cat > "$TMP_DIR/batch" << EOB
+json $TEST_FILE
+json $TMP_DIR/does-not-exist.yaml
+yaml $TEST_FILE
+EOB
+{ $CRAZY_COMPLETE json "$TEST_FILE"; $CRAZY_COMPLETE yaml "$TEST_FILE"; } > "$TMP_DIR/expected"
+set +e
+$CRAZY_COMPLETE --batch "$TMP_DIR/batch" --jobs 2 >"$TMP_DIR/stdout" 2>"$TMP_DIR/stderr"
+test $? -eq 1 || exit 1
+set -e
+cmp "$TMP_DIR/expected" "$TMP_DIR/stdout"
+grep -q 'does-not-exist.yaml' "$TMP_DIR/stderr"
+grep -q 'Batch summary: 3 commands, 1 failed' "$TMP_DIR/stderr"
+$CRAZY_COMPLETE --batch "$TMP_DIR/batch" --jobs 1 >/dev/null 2>"$TMP_DIR/stderr" || true
+! grep -q 'Batch summary' "$TMP_DIR/stderr" || exit 1
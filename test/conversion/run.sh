@@ -15,5 +15,29 @@ $CRAZY_COMPLETE --debug --input-type=python yaml "$TEST_FILE" -o out.yaml
 $CRAZY_COMPLETE --debug bash out.yaml -o /tmp/out.bash
 $CRAZY_COMPLETE --debug bash out.json -o /tmp/out.bash
 
+$CRAZY_COMPLETE --debug compile out.yaml -o /tmp/out.ccd
+$CRAZY_COMPLETE --debug bash /tmp/out.ccd -o /tmp/out.bash
+
+# Defines may follow the programs that use them
+$CRAZY_COMPLETE --debug yaml defines_after_program.yaml -o out.yaml
+cmp out.yaml defines_after_program.expected
+
+# Scalars are typed like yaml.safe_load() does it (0x10, 017, 0b11, 1:20)
+$CRAZY_COMPLETE --debug yaml scalars.yaml -o out.yaml
+cmp out.yaml scalars.expected
+
+# Tags that are not supported by yaml.safe_load() are rejected
+! $CRAZY_COMPLETE yaml unsupported_tag.yaml 2>/tmp/err.txt || exit 1
+grep -q "could not determine a constructor for the tag '!foo'" /tmp/err.txt
+
+# Documents are validated while the file is parsed, so a schema error is
+# reported before a syntax error in a later document
+! $CRAZY_COMPLETE yaml schema_error_before_syntax_error.yaml 2>/tmp/err.txt || exit 1
+grep -q 'Unknown parameter: foo' /tmp/err.txt
+
+# Definitions of nested subcommands are validated
+! $CRAZY_COMPLETE yaml nested_definition_error.yaml 2>/tmp/err.txt || exit 1
+grep -q 'a b c: Unknown parameter: foo' /tmp/err.txt
+
 grep --help > help.txt
 $CRAZY_COMPLETE --debug --input-type=help yaml help.txt -o out.yaml
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+
+'''This script checks the startup time of crazy-complete.
+
+For a few typical invocations, `crazy-complete` is run with
+`python -X importtime`. The script fails if
+
+  - a module is imported that is not needed for the invocation
+    (e.g. the Bash generator when generating Fish completion), or
+
+  - the time for importing the `crazy_complete` modules exceeds the budget
+    given by `--budget` (the fastest of `--repeat` runs is used).
+
+Without `--budget` the import time is only reported, since it depends too
+much on the machine to be checked on shared CI runners.
+'''
+
+import os
+import sys
+import argparse
+import tempfile
+import subprocess
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+CRAZY_COMPLETE_DIR = os.path.abspath(os.path.join(SCRIPT_DIR, '..', '..'))
+CRAZY_COMPLETE = os.path.join(CRAZY_COMPLETE_DIR, 'crazy-complete')
+
+JSON_DEFINITION = '''\
+[{"prog": "example", "options": [{"option_strings": ["--file"], "complete": ["file"]}]}]
+'''
+
+YAML_DEFINITION = '''\
+prog: "example"
+options:
+  - option_strings: ["--file"]
+    complete: ["file"]
+'''
+
+SHELL_MODULES = ('crazy_complete.bash', 'crazy_complete.fish', 'crazy_complete.zsh')
+
+INPUT_MODULES = (
+    'crazy_complete.json_source',
+    'crazy_complete.yaml_source',
+    'crazy_complete.argparse_source',
+    'crazy_complete.help_converter',
+    'yaml',
+)
+
+OTHER_MODULES = (
+    'crazy_complete.cache',
+    'crazy_complete.watch',
+    'crazy_complete.manual',
+    'concurrent.futures',
+    'cProfile',
+)
+
+
+def _without(modules, *allowed):
+    return tuple(m for m in modules if m not in allowed)
+
+
+# (description, arguments, modules that must not be imported)
+CASES = [
+    ('--version',
+     ['--version'],
+     SHELL_MODULES + INPUT_MODULES + OTHER_MODULES),
+
+    ('bash from JSON',
+     ['bash', '{json}'],
+     _without(SHELL_MODULES, 'crazy_complete.bash') +
+     _without(INPUT_MODULES, 'crazy_complete.json_source') +
+     OTHER_MODULES),
+
+    ('fish from JSON',
+     ['fish', '{json}'],
+     _without(SHELL_MODULES, 'crazy_complete.fish') +
+     _without(INPUT_MODULES, 'crazy_complete.json_source') +
+     OTHER_MODULES),
+
+    ('zsh from YAML',
+     ['zsh', '{yaml}'],
+     _without(SHELL_MODULES, 'crazy_complete.zsh') +
+     _without(INPUT_MODULES, 'crazy_complete.yaml_source', 'yaml') +
+     OTHER_MODULES),
+]
+
+
+def parse_importtime(output):
+    '''Parse the output of `python -X importtime`.
+
+    Returns:
+        dict: Mapping of module names to a tuple of their cumulative import
+              time in µs and their nesting level.
+    '''
+
+    result = {}
+
+    for line in output.splitlines():
+        if not line.startswith('import time:'):
+            continue
+
+        fields = line[len('import time:'):].split('|')
+
+        try:
+            cumulative = int(fields[1])
+        except ValueError:
+            continue  # Header line
+
+        name = fields[2].rstrip()
+        level = (len(name) - len(name.lstrip()) - 1) // 2
+        result[name.strip()] = (cumulative, level)
+
+    return result
+
+
+def get_startup_time(modules):
+    '''Return the import time of crazy-complete in milliseconds.
+
+    This is the sum of the cumulative times of all `crazy_complete` modules
+    that were not imported by another module.
+    '''
+
+    total = 0
+    for name, (cumulative, level) in modules.items():
+        if level == 0 and name.split('.')[0] == 'crazy_complete':
+            total += cumulative
+    return total / 1000
+
+
+def run_case(arguments):
+    '''Run crazy-complete and return the parsed import times.'''
+
+    return run_python([CRAZY_COMPLETE] + arguments)
+
+
+def run_python(arguments):
+    '''Run python with `arguments` and return the parsed import times.'''
+
+    command = [sys.executable, '-X', 'importtime'] + arguments
+
+    # Run from the repository, so that the development version is imported
+    result = subprocess.run(
+        command,
+        cwd=CRAZY_COMPLETE_DIR,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        check=False)
+
+    if result.returncode != 0:
+        print(result.stderr, file=sys.stderr)
+        raise SystemExit(f'Command failed: {" ".join(command)}')
+
+    return parse_importtime(result.stderr)
+
+
+def main():
+    '''Main function.'''
+
+    argp = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    argp.add_argument('-b', '--budget', type=float, default=None,
+                      help='Fail if importing takes longer (in milliseconds)')
+    argp.add_argument('-r', '--repeat', type=int, default=5,
+                      help='Number of runs per case [default: %(default)s]')
+    opts = argp.parse_args()
+
+    failed = False
+
+    with tempfile.TemporaryDirectory() as directory:
+        files = {'json': os.path.join(directory, 'example.json'),
+                 'yaml': os.path.join(directory, 'example.yaml')}
+
+        with open(files['json'], 'w', encoding='utf-8') as fh:
+            fh.write(JSON_DEFINITION)
+
+        with open(files['yaml'], 'w', encoding='utf-8') as fh:
+            fh.write(YAML_DEFINITION)
+
+        # Make sure the bytecode is up to date, so that compiling the
+        # sources is not counted
+        run_case(['--version'])
+
+        for description, arguments, forbidden in CASES:
+            arguments = [arg.format(**files) for arg in arguments]
+            modules = run_case(arguments)
+
+            unwanted = [m for m in forbidden if m in modules]
+            if unwanted:
+                print(f'FAIL: {description}: unneeded imports: {", ".join(unwanted)}')
+                failed = True
+
+        # The `crazy-complete` script imports the application module using
+        # `from crazy_complete import application`, which is not fully
+        # reported by `-X importtime`.
+        code = 'import crazy_complete.application'
+        best = min(get_startup_time(run_python(['-c', code]))
+                   for _ in range(opts.repeat))
+
+        if opts.budget is None:
+            print(f'INFO: importing crazy-complete took {best:.1f} ms')
+        elif best > opts.budget:
+            print(f'FAIL: importing crazy-complete took {best:.1f} ms '
+                  f'(budget: {opts.budget:.1f} ms)')
+            failed = True
+        else:
+            print(f'OK: importing crazy-complete took {best:.1f} ms '
+                  f'(budget: {opts.budget:.1f} ms)')
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
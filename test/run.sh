@@ -9,3 +9,7 @@ set -x
 ./tests/run.py "$@"
 ./error_messages/run.py
 ./conversion/run.sh
+./cli/run.sh
+./watch/run.py
+./bash_parsers/run.py
+./importtime/run.py
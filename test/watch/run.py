@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+
+'''This script checks `crazy-complete --watch`.
+
+inotify is disabled, so the watcher falls back to polling the modification
+times of the files. The script checks that the output is regenerated after
+an include file or the definition file has been changed.
+'''
+
+import os
+import sys
+import time
+import signal
+import tempfile
+import subprocess
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+CRAZY_COMPLETE_DIR = os.path.abspath(os.path.join(SCRIPT_DIR, '..', '..'))
+CRAZY_COMPLETE = os.path.join(CRAZY_COMPLETE_DIR, 'crazy-complete')
+
+# Runs crazy-complete with inotify being unavailable
+RUN_WITHOUT_INOTIFY = '''\
+import sys
+import errno
+import runpy
+from crazy_complete import watch
+
+class InotifyWatcher:
+    def __init__(self, files):
+        raise OSError(errno.ENOSYS, 'Function not implemented')
+
+watch.InotifyWatcher = InotifyWatcher
+sys.argv = sys.argv[1:]
+runpy.run_path(sys.argv[0], run_name='__main__')
+'''
+
+DEFINITION = '''\
+prog: "example"
+options:
+  - option_strings: ["--%s"]
+'''
+
+TIMEOUT = 20
+
+
+def write_file(file, content):
+    with open(file, 'w', encoding='utf-8') as fh:
+        fh.write(content)
+
+
+def read_file(file):
+    try:
+        with open(file, 'r', encoding='utf-8') as fh:
+            return fh.read()
+    except FileNotFoundError:
+        return ''
+
+
+def wait_for(files, string, process):
+    '''Wait until all `files` contain `string`.'''
+
+    deadline = time.monotonic() + TIMEOUT
+
+    while time.monotonic() < deadline:
+        if all(string in read_file(file) for file in files):
+            return
+
+        if process.poll() is not None:
+            print('crazy-complete exited unexpectedly')
+            sys.exit(1)
+
+        time.sleep(0.1)
+
+    print(f'Timeout while waiting for {string!r} in', ', '.join(files))
+    sys.exit(1)
+
+
+def touch_later(file, content):
+    '''Write `file` with a modification time that differs from the last one.'''
+
+    mtime = os.stat(file).st_mtime_ns
+    write_file(file, content)
+    os.utime(file, ns=(mtime + 10**9, mtime + 10**9))
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        definition_file = os.path.join(tmp_dir, 'example.yaml')
+        include_file = os.path.join(tmp_dir, 'include.sh')
+        outputs = [os.path.join(tmp_dir, f'example.{shell}') for shell in ('bash', 'zsh')]
+
+        write_file(definition_file, DEFINITION % 'first-option')
+        write_file(include_file, '# first include\n')
+
+        env = dict(os.environ, PYTHONPATH=CRAZY_COMPLETE_DIR)
+        cmd = [sys.executable, '-c', RUN_WITHOUT_INOTIFY, CRAZY_COMPLETE,
+               '--watch', '--include-file', include_file,
+               '-o', os.path.join(tmp_dir, 'example.{shell}'),
+               'bash,zsh', definition_file]
+
+        with subprocess.Popen(cmd, env=env, stderr=subprocess.PIPE, text=True) as process:
+            try:
+                wait_for(outputs, 'first include', process)
+                wait_for(outputs, 'first-option', process)
+
+                touch_later(include_file, '# second include\n')
+                wait_for(outputs, 'second include', process)
+
+                touch_later(definition_file, DEFINITION % 'second-option')
+                wait_for(outputs, 'second-option', process)
+            finally:
+                process.send_signal(signal.SIGINT)
+                _, stderr = process.communicate(timeout=TIMEOUT)
+
+        if process.returncode != 0:
+            print(stderr)
+            print(f'crazy-complete exited with {process.returncode}')
+            sys.exit(1)
+
+        if stderr.count('Regenerated bash,zsh') != 3:
+            print(stderr)
+            print('Expected the output to be regenerated three times')
+            sys.exit(1)
+
+    print('OK')
+
+
+if __name__ == '__main__':
+    main()